@@ -0,0 +1,96 @@
+"""Almacén Arrow de eventos: vista por partidos sobre segmentos mapeados vs un hit de `st.cache_data`,
+y consultas de liga completa con el motor de Arrow vs pandas.
+
+Un hit de `st.cache_data` deserializa el DataFrame completo con pickle; el
+almacén solo rebana los segmentos mapeados (sin asignar memoria de Arrow) y
+materializa las filas pedidas.
+"""
+import pandas as pd
+import pyarrow as pa
+import pytest
+import streamlit as st
+
+from datos_sinteticos import ESCALAS
+from tactisense.almacen_eventos import AlmacenEventos
+from tactisense.api import construir_filas_eventos
+from tactisense.consultas import ranking_tiradores
+
+
+@pytest.fixture(scope="module")
+def almacen(liga, tmp_path_factory):
+    """Toda la liga en segmentos de una temporada (como los escribe la app al descargar)."""
+    almacen = AlmacenEventos(str(tmp_path_factory.mktemp("eventos")))
+    for temporada in sorted({p["season"] for p in liga["partidos"]}):
+        mids = [p["id"] for p in liga["partidos"] if p["season"] == temporada]
+        shots = [s for mid in mids for s in liga["shots"][mid]]
+        players = [s for mid in mids for s in liga["player_stats"][mid]]
+        almacen.agregar(mids, construir_filas_eventos(shots, players))
+    return almacen
+
+
+def _mids_equipo(liga, equipo, escala):
+    propios = sorted((p for p in liga["partidos"] if equipo in (p["home_team"], p["away_team"])),
+                     key=lambda p: p["event_date"], reverse=True)
+    return [p["id"] for p in propios[:ESCALAS[escala]]]
+
+
+def bench_vista_almacen_eventos(benchmark, verificar_baseline, almacen, liga, equipo, escala, df_eventos):
+    mids = _mids_equipo(liga, equipo, escala)
+    antes = pa.total_allocated_bytes()
+    assert almacen.vista(mids).num_rows == len(df_eventos)
+    assert pa.total_allocated_bytes() == antes     # rebanadas del memory-map, sin copia
+
+    df = benchmark(almacen.eventos, mids)
+    pd.testing.assert_frame_equal(df, df_eventos)
+    verificar_baseline(benchmark)
+
+
+def bench_hit_cache_data_eventos(benchmark, verificar_baseline, liga, equipo, escala, df_eventos):
+    """Referencia: un hit de `_obtener_datos_eventos_por_nombre` cuando usaba `st.cache_data`
+    (hash de los argumentos, con los partidos de una temporada, y deserializar el DataFrame)."""
+    temporada = liga["partidos"][0]["season"]
+    partidos = pd.DataFrame([p for p in liga["partidos"] if p["season"] == temporada])
+
+    @st.cache_data(ttl=3600, show_spinner=False)
+    def cargar(equipo_nombre, matches_df, escala):
+        return df_eventos
+
+    cargar(equipo, partidos, escala)
+    df = benchmark(cargar, equipo, partidos, escala)
+    assert len(df) == len(df_eventos)
+    verificar_baseline(benchmark)
+
+
+@pytest.fixture(scope="module")
+def eventos_liga(liga):
+    mids = [p["id"] for p in liga["partidos"]]
+    return construir_filas_eventos([s for mid in mids for s in liga["shots"][mid]],
+                                   [s for mid in mids for s in liga["player_stats"][mid]])
+
+
+def bench_ranking_tiradores_liga(benchmark, verificar_baseline, almacen, liga, eventos_liga):
+    """Ranking de xG por tiro (≥20 tiros) sobre las 5 temporadas, con el motor de consultas de Arrow."""
+    tabla = almacen.vista([p["id"] for p in liga["partidos"]], orden_almacen=True)
+    ranking = benchmark(ranking_tiradores, tabla, 20, 20)
+
+    tiros = eventos_liga[eventos_liga["type_name"] == "Shot"]
+    esperado = tiros.groupby("player_id").agg(tiros=("xg", "size"), xg=("xg", "sum"))
+    esperado = esperado[esperado["tiros"] >= 20].assign(xg_por_tiro=lambda d: d["xg"] / d["tiros"])
+    esperado = esperado.sort_values(["xg_por_tiro", "tiros"], ascending=False).head(20)
+    assert ranking["player_id"].tolist() == esperado.index.tolist()
+    verificar_baseline(benchmark)
+
+
+def bench_ranking_tiradores_liga_pandas(benchmark, verificar_baseline, eventos_liga):
+    """Referencia: la misma pregunta en pandas sobre el DataFrame de eventos completo."""
+    def ranking():
+        tiros = eventos_liga[eventos_liga["type_name"] == "Shot"]
+        res = tiros.groupby("player_id").agg(
+            player=("player", "last"), team_name=("team_name", "last"), tiros=("xg", "size"), xg=("xg", "sum"),
+            goles=("result", lambda r: r.str.contains("goal", case=False, na=False).sum()),
+        )
+        res = res[res["tiros"] >= 20].assign(xg_por_tiro=lambda d: d["xg"] / d["tiros"])
+        return res.sort_values(["xg_por_tiro", "tiros"], ascending=False).head(20)
+
+    assert len(benchmark(ranking)) == 20
+    verificar_baseline(benchmark)
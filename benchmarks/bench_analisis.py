@@ -0,0 +1,41 @@
+"""Métricas del Scout Report, recomendador de formaciones y modelo xG local."""
+import numpy as np
+
+from tactisense.analisis import calcular_metricas_jugador, sugerir_formacion
+from tactisense.api import construir_filas_eventos
+from tactisense.formaciones import NOMBRES
+from tactisense.modelo_xg import MODELO_XG_BASE, entrenar_modelo_xg, matriz_rasgos_df, predecir_xg_df
+
+
+def bench_calcular_metricas_jugador(benchmark, verificar_baseline, df_eventos):
+    tiros = df_eventos[df_eventos["type_name"] == "Shot"]
+    jugador = tiros["player"].value_counts().index[0]
+    metricas = benchmark(calcular_metricas_jugador, df_eventos, jugador)
+    assert set(metricas) == {"xG", "Tiros", "Goles", "A Puerta", "Precisión", "xG/Tiro"}
+    verificar_baseline(benchmark)
+
+
+def bench_sugerir_formacion(benchmark, verificar_baseline):
+    # Se recalcula en cada cambio de los multiselect: debe quedar muy por debajo de 1 ms
+    recs = benchmark(sugerir_formacion, ["Bandas fuertes", "Presión alta"],
+                     ["Laterales débiles", "Sufre transiciones"], formacion_rival="4-2-3-1", top=len(NOMBRES))
+    assert sorted(f for f, _ in recs) == sorted(NOMBRES)
+    verificar_baseline(benchmark)
+
+
+def bench_predecir_xg(benchmark, verificar_baseline, df_eventos):
+    # Rasgos + puntuación de todos los tiros en una llamada
+    tiros = df_eventos[df_eventos["type_name"] == "Shot"]
+    xg = benchmark(predecir_xg_df, MODELO_XG_BASE, tiros)
+    assert len(xg) == len(tiros) and xg.between(0, 1).all()
+    verificar_baseline(benchmark)
+
+
+def bench_entrenar_modelo_xg(benchmark, verificar_baseline, liga):
+    # Ajuste sobre la matriz de rasgos ya cacheada de toda la liga
+    df = construir_filas_eventos([s for filas in liga["shots"].values() for s in filas], [])
+    df = df[df["situation"] != "Penalty"]
+    X, goles = matriz_rasgos_df(df), df["result"].eq("Goal").to_numpy()
+    modelo = benchmark(entrenar_modelo_xg, X, goles)
+    assert modelo.origen == "temporada" and np.isfinite(modelo.coef).all()
+    verificar_baseline(benchmark)
@@ -0,0 +1,95 @@
+"""Cache compartida entre workers: lo que descarga uno lo leen los demás sin ir a la API.
+
+Con `disco` el worker que calienta es otro proceso (mismo directorio); con
+`redis` se usa un sustituto en memoria del cliente, compartido por los dos
+"workers" del mismo proceso. En ambos casos el worker frío parte con la cache
+del proceso vacía y no debe hacer ninguna petición HTTP.
+"""
+import fnmatch
+import os
+import subprocess
+import sys
+
+import pytest
+
+from datos_sinteticos import EQUIPOS
+from mock_api import iniciar_en_hilo
+from tactisense import api
+from tactisense.cache import BackendDisco, BackendRedis, CacheCompartida
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LATENCIA_MS = 20
+
+WORKER = """
+import sys
+from tactisense import api
+api.descargar_eventos_partidos([int(m) for m in sys.argv[1].split(",")])
+"""
+
+
+class RedisLocal:
+    """Sustituto en memoria de `redis.Redis` con las operaciones que usa BackendRedis."""
+
+    def __init__(self):
+        self._datos = {}
+
+    def mget(self, claves):
+        return [self._datos.get(clave) for clave in claves]
+
+    def set(self, clave, valor, ex=None):
+        self._datos[clave] = valor
+
+    def scan_iter(self, match):
+        return [clave for clave in self._datos if fnmatch.fnmatchcase(clave, match)]
+
+    def delete(self, *claves):
+        for clave in claves:
+            self._datos.pop(clave, None)
+
+
+@pytest.fixture(scope="module")
+def servidor():
+    srv, url = iniciar_en_hilo(latencia_ms=LATENCIA_MS)
+    yield srv, url
+    srv.shutdown()
+
+
+@pytest.fixture(scope="module")
+def mids(servidor):
+    srv, _ = servidor
+    return [p["id"] for p in srv.liga["partidos"] if EQUIPOS[0] in (p["home_team"], p["away_team"])]
+
+
+def _calentar(backend, url, mids, tmp_path, monkeypatch):
+    """El primer worker descarga la temporada del equipo y llena la cache compartida."""
+    if backend == "disco":
+        env = dict(os.environ, TACTISENSE_API_BASE=url, TACTISENSE_CACHE_URL=f"file://{tmp_path}",
+                   PYTHONPATH=RAIZ)
+        subprocess.run([sys.executable, "-c", WORKER, ",".join(map(str, mids))], env=env, cwd=RAIZ, check=True)
+        return CacheCompartida(BackendDisco(str(tmp_path)))
+    compartida = CacheCompartida(BackendRedis(RedisLocal()))
+    monkeypatch.setattr(api, "CACHE_COMPARTIDA", compartida)
+    api.CACHE_PARTIDOS.clear()
+    api.descargar_eventos_partidos(mids)
+    return compartida
+
+
+@pytest.mark.parametrize("backend", ["disco", "redis"])
+def bench_worker_frio_con_cache_compartida(benchmark, verificar_baseline, servidor, mids, backend,
+                                           tmp_path, monkeypatch):
+    srv, url = servidor
+    monkeypatch.setattr(api, "API_BASE", url)
+    monkeypatch.setattr(api, "_lotes_no_soportados", {})
+    compartida = _calentar(backend, url, mids, tmp_path, monkeypatch)
+    monkeypatch.setattr(api, "CACHE_COMPARTIDA", compartida)
+    peticiones = sum(srv.conteo.values())
+    assert peticiones > 0
+
+    shots, players = benchmark.pedantic(
+        api.descargar_eventos_partidos, args=(mids,),
+        setup=api.CACHE_PARTIDOS.clear, rounds=5, iterations=1,
+    )
+    assert set(shots) == set(players) == set(mids)
+    assert sum(shots.values(), []) == sum((srv.liga["shots"][m] for m in mids), [])
+    assert sum(srv.conteo.values()) == peticiones
+    verificar_baseline(benchmark)
@@ -0,0 +1,34 @@
+"""Escalón corto del arnés de carga (`carga.py`): dos sesiones concurrentes recorren el guion completo.
+
+Mantiene el arnés funcionando con cada cambio de la app; la medición de
+capacidad se hace con `python benchmarks/carga.py`.
+"""
+import random
+
+import pytest
+
+from carga import GUION, RAIZ, ejecutar_escalon, sesion
+from mock_api import iniciar_en_hilo
+from tactisense import api
+
+
+@pytest.fixture(scope="module")
+def servidor():
+    srv, url = iniciar_en_hilo(latencia_ms=20, n_temporadas=2)
+    yield srv, url
+    srv.shutdown()
+
+
+def bench_carga_dos_sesiones(benchmark, verificar_baseline, servidor, monkeypatch):
+    _, url = servidor
+    monkeypatch.setattr(api, "API_BASE", url)
+    monkeypatch.chdir(RAIZ)
+    sesion(GUION, 0.0, random.Random(-1), [])   # caches calientes, como tras el primer usuario
+
+    escalon = benchmark.pedantic(ejecutar_escalon, args=(2,), kwargs={"pausa_s": 0.0}, rounds=1, iterations=1)
+    assert escalon["errores"] == 0
+    assert escalon["reruns"] == 2 * len(GUION)
+    assert escalon["p50_ms"] <= escalon["p95_ms"] <= escalon["p99_ms"]
+    assert set(escalon["pasos"]) == {paso for paso, _ in GUION}
+    benchmark.extra_info.update({k: escalon[k] for k in ("p95_ms", "cpu_s_por_sesion", "rss_pico_mb")})
+    verificar_baseline(benchmark)
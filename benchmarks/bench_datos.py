@@ -0,0 +1,108 @@
+"""Ingesta: filas de eventos, extracción de equipos, lectura de CSV, índices (formaciones,
+identidades), series de forma y agregados de temporada por equipo."""
+from io import BytesIO
+
+import pandas as pd
+
+from tactisense import api
+from tactisense.api import (
+    agregar_equipos, agregar_resumen_partidos, cara_a_cara, construir_filas_eventos, extraer_equipos,
+    filas_equipos_partidos, unir_identidades,
+)
+from tactisense.identidades import IndiceIdentidades
+from tactisense.indice_formaciones import IndiceFormaciones
+from tactisense.series import METRICAS_EQUIPO, SerieTemporal
+
+
+def bench_construir_filas_eventos(benchmark, verificar_baseline, eventos_crudos):
+    todos_shots, todos_players = eventos_crudos
+    df = benchmark(construir_filas_eventos, todos_shots, todos_players)
+    assert len(df) == len(todos_shots) + len(todos_players)
+    verificar_baseline(benchmark)
+
+
+def bench_extraer_equipos(benchmark, verificar_baseline, partidos_liga):
+    _, equipos = benchmark(extraer_equipos, partidos_liga)
+    assert equipos
+    verificar_baseline(benchmark)
+
+
+def bench_read_csv(benchmark, verificar_baseline, csv_eventos, df_eventos):
+    df = benchmark(lambda: pd.read_csv(BytesIO(csv_eventos)))
+    assert len(df) == len(df_eventos)
+    verificar_baseline(benchmark)
+
+
+def bench_agregar_resumen_partidos(benchmark, verificar_baseline, df_eventos, equipo, liga):
+    partidos, _ = extraer_equipos(pd.DataFrame(liga["partidos"]).assign(
+        match_id=lambda d: d["id"], match_date=lambda d: d["event_date"]))
+    resumen = benchmark(agregar_resumen_partidos, df_eventos, equipo, partidos)
+    assert len(resumen) == df_eventos["match_id"].nunique()
+    verificar_baseline(benchmark)
+
+
+def bench_indice_formaciones(benchmark, verificar_baseline, eventos_crudos, equipo):
+    todos_shots, _ = eventos_crudos
+    por_partido = {}
+    for s in todos_shots:
+        por_partido.setdefault(s["match_id"], []).append(s)
+
+    def indexar():
+        indice = IndiceFormaciones()
+        for mid, shots in por_partido.items():
+            indice.registrar_partido("temporada", mid, shots)
+        return indice.uso("temporada", equipo), indice.cruces("temporada", equipo)
+
+    uso, cruces = benchmark(indexar)
+    assert uso["tiros"].sum() == sum(s["team"] == equipo for s in todos_shots)
+    assert cruces["minutos"].sum() == uso["minutos"].sum()
+    verificar_baseline(benchmark)
+
+
+def bench_serie_forma_incremental(benchmark, verificar_baseline, df_eventos, equipo, liga):
+    # Alta de partidos uno a uno en orden de fecha: el coste por partido no crece con la serie
+    partidos, _ = extraer_equipos(pd.DataFrame(liga["partidos"]).assign(
+        match_id=lambda d: d["id"], match_date=lambda d: d["event_date"]))
+    filas = agregar_resumen_partidos(df_eventos, equipo, partidos).sort_values("match_date").to_dict("records")
+
+    def construir():
+        serie = SerieTemporal(METRICAS_EQUIPO)
+        for fila in filas:
+            serie.agregar(fila["match_date"], fila["match_id"], fila)
+        return serie
+
+    serie = benchmark(construir)
+    assert len(serie) == len(filas)
+    verificar_baseline(benchmark)
+
+
+def bench_unir_identidades(benchmark, verificar_baseline, eventos_crudos, df_eventos, monkeypatch):
+    todos_shots, todos_players = eventos_crudos
+    indice = IndiceIdentidades()
+    for mid in df_eventos["match_id"].unique():
+        indice.registrar_partido(mid, [s for s in todos_shots if s["match_id"] == mid],
+                                 [p for p in todos_players if p["match_id"] == mid])
+    monkeypatch.setitem(api._IDENTIDADES, ("bench", "liga", "temporada"), indice)
+
+    df = benchmark(unir_identidades, df_eventos, "bench", "liga", "temporada")
+    stats = df[df["type_name"] == "PlayerStat"]
+    assert stats["player_id_v1"].notna().any()
+    assert ((stats["player_id_v1"].dropna() - 1_000_000) == (stats["player_id_v2"][stats["player_id_v1"].notna()] - 10_000)).all()
+    verificar_baseline(benchmark)
+
+
+def bench_tabla_equipos_temporada(benchmark, verificar_baseline, liga, partidos_liga, equipo):
+    # Reducción por partido + tabla por equipo + cara a cara, sin red ni caches
+    partidos, equipos = extraer_equipos(partidos_liga.assign(
+        match_id=lambda d: d["id"], match_date=lambda d: d["event_date"]))
+    partidos = partidos.set_index("match_id")
+    shots = {mid: liga["shots"][mid] for mid in partidos.index}
+
+    def construir():
+        filas = filas_equipos_partidos(shots, partidos)
+        return filas, agregar_equipos(filas), cara_a_cara(equipos[0], equipos[1], filas)
+
+    filas, tabla, _ = benchmark(construir)
+    assert len(filas) == 2 * len(partidos)
+    assert tabla["shots"].sum() == tabla["shots_against"].sum() == sum(len(v) for v in shots.values())
+    verificar_baseline(benchmark)
@@ -0,0 +1,100 @@
+"""Reruns acotados a fragmentos: cambiar un control del panel no repite la página.
+
+AppTest siempre vuelve a ejecutar el script completo, así que el rerun de
+fragmento se pide como lo hace el navegador: con el id del fragmento en la
+cola de la petición de rerun. Durante ese rerun no debe llamarse a ningún
+loader, ni a `cargar_competiciones`, ni al `render()` de la página.
+"""
+import functools
+import os
+
+import pytest
+from streamlit.runtime.scriptrunner_utils.script_requests import RerunData
+from streamlit.testing.v1 import AppTest, local_script_runner
+
+import paginas.comun
+from mock_api import iniciar_en_hilo
+from tactisense import api
+from tactisense.instrumentacion import REGISTRO_GLOBAL
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUTA_APP = os.path.join(RAIZ, "streamlit_app.py")
+
+
+@pytest.fixture(scope="module")
+def servidor():
+    srv, url = iniciar_en_hilo()
+    yield url
+    srv.shutdown()
+
+
+def _cambiar_control(at, fragmento):
+    if fragmento == "panel_jugador":
+        selector = next(s for s in at.selectbox if s.label == "Selecciona un jugador")
+        selector.set_value(selector.options[1])
+    elif fragmento == "ranking_liga":
+        next(s for s in at.slider if s.label == "Tiros mínimos en la temporada").set_value(5)
+    elif fragmento == "recomendador":
+        fortalezas = next(m for m in at.multiselect if m.label == "Fortalezas propias")
+        fortalezas.set_value([fortalezas.options[0]])
+    else:
+        next(s for s in at.slider if s.label == "Grosor del trazo").set_value(7)
+
+
+def _id_fragmento(at, fragmento):
+    """Id del fragmento registrado para la función `fragmento` (el que enviaría el navegador)."""
+    for fid, envoltorio in at._fragment_storage._fragments.items():
+        if any(getattr(c.cell_contents, "__name__", None) == fragmento for c in envoltorio.__closure__ or ()):
+            return fid
+    raise LookupError(fragmento)
+
+
+def _contadores(loaders):
+    cache = REGISTRO_GLOBAL.cache.get("cargar_competiciones", {})
+    paginas_renderizadas = sum(v["llamadas"] for k, v in REGISTRO_GLOBAL.secciones.items() if k.startswith("página: "))
+    return loaders["n"], cache.get("hits", 0) + cache.get("misses", 0), paginas_renderizadas
+
+
+@pytest.mark.parametrize("pagina,fragmento", [
+    pytest.param("scout_report", "panel_jugador", id="scout_report"),
+    pytest.param("scout_report", "ranking_liga", id="scout_report-ranking"),
+    pytest.param("comparativa", "recomendador", id="comparativa"),
+    pytest.param("pizarra", "controles_y_tablero", id="pizarra"),
+])
+def bench_rerun_fragmento(benchmark, verificar_baseline, servidor, pagina, fragmento, monkeypatch):
+    monkeypatch.chdir(RAIZ)  # los assets se leen con rutas relativas a la raíz
+    monkeypatch.setattr(api, "API_BASE", servidor)
+    loaders = {"n": 0}
+    original = paginas.comun.show_ball_loader
+
+    def loader_contado(*args, **kwargs):
+        loaders["n"] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(paginas.comun, "show_ball_loader", loader_contado)
+
+    at = AppTest.from_file(RUTA_APP, default_timeout=120)
+    at.query_params["pagina"] = pagina
+    at.run()
+    assert not at.exception
+    antes = _contadores(loaders)
+    assert antes[0] > 0 or pagina == "pizarra"     # la página completa sí pasa por los loaders
+
+    if fragmento == "ranking_liga" and not any(s.label == "Tiros mínimos en la temporada" for s in at.slider):
+        # Temporada fuera del almacén: el ranking se carga al pulsar el botón
+        next(b for b in at.button if b.label == "Cargar ranking de la liga").click()
+        at.run()
+        assert not at.exception
+        antes = _contadores(loaders)
+
+    fid = _id_fragmento(at, fragmento)
+    monkeypatch.setattr(local_script_runner, "RerunData", functools.partial(RerunData, fragment_id_queue=[fid]))
+
+    def rerun():
+        _cambiar_control(at, fragmento)
+        at.run()
+
+    benchmark.pedantic(rerun, rounds=5, iterations=1)
+    assert not at.exception
+    assert _contadores(loaders) == antes
+    verificar_baseline(benchmark)
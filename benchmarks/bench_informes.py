@@ -0,0 +1,50 @@
+"""Informes de plantel: métricas de todos los jugadores de una vez y radares en lote.
+
+La referencia de las métricas es llamar a `calcular_metricas_jugador` para cada
+jugador, como haría recorrer el selector del Scout Report. El informe completo
+dibuja los 25 radares del plantel en el pool de procesos y arma el PDF.
+"""
+import io
+import zipfile
+
+import pytest
+
+from tactisense.analisis import calcular_metricas_jugador
+from tactisense.informes import PROCESOS_INFORMES, dibujar_radares, empaquetar, metricas_equipo
+
+
+def _por_jugador(df_eventos, equipo):
+    return {j: calcular_metricas_jugador(df_eventos, j) for j in metricas_equipo(df_eventos, equipo).index}
+
+
+def bench_metricas_plantel(benchmark, verificar_baseline, df_eventos, equipo):
+    metricas = benchmark(metricas_equipo, df_eventos, equipo)
+    # Solo jugadores con nombre: las PlayerStat sin identidad resuelta quedan fuera, como en el selector
+    assert 0 < len(metricas) <= 25 and metricas.index.str.startswith(equipo).all()
+    verificar_baseline(benchmark)
+
+
+@pytest.mark.parametrize("escala", ["1_temporada"], indirect=True)
+def bench_metricas_plantel_por_jugador(benchmark, verificar_baseline, df_eventos, equipo):
+    # Referencia: el mismo resultado con una llamada por jugador
+    esperado = benchmark.pedantic(_por_jugador, args=(df_eventos, equipo), rounds=1, iterations=1)
+    assert esperado == {j: fila for j, fila in metricas_equipo(df_eventos, equipo).to_dict("index").items()}
+    verificar_baseline(benchmark)
+
+
+@pytest.mark.parametrize("formato", ["PDF", "PNG (ZIP)"])
+@pytest.mark.parametrize("escala", ["1_temporada"], indirect=True)
+def bench_informe_plantel(benchmark, verificar_baseline, df_eventos, equipo, formato):
+    # Plantel completo: radares en el pool (PROCESOS_INFORMES workers, ya arrancados) + empaquetado
+    metricas = metricas_equipo(df_eventos, equipo)
+    dibujar_radares(metricas.head(2 * PROCESOS_INFORMES))
+
+    def informe():
+        return empaquetar(list(metricas.index), dibujar_radares(metricas), formato)
+
+    datos = benchmark.pedantic(informe, rounds=3, iterations=1)
+    if formato == "PDF":
+        assert datos.startswith(b"%PDF") and datos.count(b"/Type /Page\n") == len(metricas)
+    else:
+        assert len(zipfile.ZipFile(io.BytesIO(datos)).namelist()) == len(metricas)
+    verificar_baseline(benchmark)
@@ -0,0 +1,82 @@
+"""Tablas de líderes: vista materializada con refresco incremental vs recalcular la liga completa.
+
+Tras sincronizar un partido la vista solo suma sus eventos y reordena; la
+referencia agrega de nuevo las 5 temporadas. Paginar con el orden ya calculado
+es rebanar un índice.
+"""
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from tactisense.almacen_eventos import AlmacenEventos
+from tactisense.api import construir_filas_eventos
+from tactisense.lideres import VistaLideres
+
+
+@pytest.fixture(scope="module")
+def almacen(liga, tmp_path_factory):
+    """La liga completa salvo el último partido, que llega después como una sincronización."""
+    almacen = AlmacenEventos(str(tmp_path_factory.mktemp("lideres")))
+    partidos = liga["partidos"][:-1]
+    for temporada in sorted({p["season"] for p in partidos}):
+        mids = [p["id"] for p in partidos if p["season"] == temporada]
+        almacen.agregar(mids, construir_filas_eventos([s for mid in mids for s in liga["shots"][mid]],
+                                                      [s for mid in mids for s in liga["player_stats"][mid]]))
+    return almacen
+
+
+@pytest.fixture(scope="module")
+def partido_nuevo(liga, tmp_path_factory):
+    mid = liga["partidos"][-1]["id"]
+    almacen = AlmacenEventos(str(tmp_path_factory.mktemp("partido_nuevo")))
+    almacen.agregar([mid], construir_filas_eventos(liga["shots"][mid], liga["player_stats"][mid]))
+    return almacen.vista([mid])
+
+
+def _vista(almacen, liga):
+    vista = VistaLideres()
+    vista.incorporar(almacen.vista([p["id"] for p in liga["partidos"][:-1]], orden_almacen=True))
+    return vista
+
+
+def bench_lideres_partido_nuevo(benchmark, verificar_baseline, almacen, partido_nuevo, liga):
+    """Sumar un partido sincronizado y servir la primera página de xG."""
+    def actualizar(vista):
+        vista.incorporar(partido_nuevo)
+        return vista.pagina("xg", pagina=1, por_pagina=25)
+
+    filas, total = benchmark.pedantic(actualizar, setup=lambda: ((_vista(almacen, liga),), {}), rounds=10, iterations=1)
+    assert len(filas) == 25 and total >= 500
+
+    completa = VistaLideres()
+    completa.incorporar(pa.concat_tables([almacen.vista([p["id"] for p in liga["partidos"][:-1]]), partido_nuevo]))
+    esperado, _ = completa.pagina("xg", pagina=1, por_pagina=25)
+    pd.testing.assert_frame_equal(filas, esperado)
+    verificar_baseline(benchmark)
+
+
+def bench_lideres_recalculo_completo(benchmark, verificar_baseline, almacen, partido_nuevo, liga):
+    """Referencia: agregar de nuevo toda la liga tras cada partido."""
+    tabla = almacen.vista([p["id"] for p in liga["partidos"][:-1]], orden_almacen=True)
+
+    def recalcular():
+        vista = VistaLideres()
+        vista.incorporar(tabla)
+        vista.incorporar(partido_nuevo)
+        return vista.pagina("xg", pagina=1, por_pagina=25)
+
+    filas, _ = benchmark(recalcular)
+    assert len(filas) == 25
+    verificar_baseline(benchmark)
+
+
+@pytest.mark.parametrize("metrica", ["xg", "goles_menos_xg", "rating"])
+def bench_lideres_paginar(benchmark, verificar_baseline, almacen, liga, metrica):
+    """Página 10 de 25 filas con el orden ya calculado (mismo filtro que la página anterior)."""
+    vista = VistaLideres()
+    almacen.suscribir(vista.incorporar)
+    _, total = vista.pagina(metrica, pagina=1, por_pagina=25)
+    filas, _ = benchmark(vista.pagina, metrica, True, 10, 25)
+    assert len(filas) == min(25, max(0, total - 225))
+    assert filas[metrica].is_monotonic_decreasing
+    verificar_baseline(benchmark)
@@ -0,0 +1,55 @@
+"""Descarga de eventos contra la API simulada: una petición por partido vs lotes."""
+import pytest
+
+from datos_sinteticos import ESCALAS, EQUIPOS
+from mock_api import iniciar_en_hilo
+from tactisense import api
+from tactisense.resiliencia import CuboTokens
+
+LATENCIA_MS = 20
+
+
+@pytest.fixture(scope="module", params=["por_partido", "lotes"])
+def servidor(request):
+    srv, url = iniciar_en_hilo(latencia_ms=LATENCIA_MS, lotes=request.param == "lotes", n_temporadas=5)
+    yield srv, url
+    srv.shutdown()
+
+
+def bench_descargar_eventos_partidos(benchmark, verificar_baseline, servidor, escala, monkeypatch):
+    srv, url = servidor
+    monkeypatch.setattr(api, "API_BASE", url)
+    monkeypatch.setattr(api, "_lotes_no_soportados", {})
+    # Se mide la descarga, no el cupo del gateway (eso está en bench_resiliencia)
+    monkeypatch.setattr(api, "LIMITADOR", CuboTokens(tasa=1000, capacidad=1000))
+    propios = [p for p in srv.liga["partidos"] if EQUIPOS[0] in (p["home_team"], p["away_team"])]
+    mids = [p["id"] for p in propios][:ESCALAS[escala]]
+
+    shots, players = benchmark.pedantic(
+        api.descargar_eventos_partidos, args=(mids,),
+        setup=api.CACHE_PARTIDOS.clear, rounds=5, iterations=1,
+    )
+    assert set(shots) == set(players) == set(mids)
+    verificar_baseline(benchmark)
+
+
+def bench_lote_con_partido_omitido(benchmark, verificar_baseline, monkeypatch):
+    # Un id que la respuesta del lote no trae se pide por su ruta de partido; nunca se guarda como []
+    srv, url = iniciar_en_hilo(latencia_ms=LATENCIA_MS, lotes=True, n_temporadas=1)
+    monkeypatch.setattr(api, "API_BASE", url)
+    monkeypatch.setattr(api, "_lotes_no_soportados", {})
+    monkeypatch.setattr(api, "LIMITADOR", CuboTokens(tasa=1000, capacidad=1000))
+    mids = [p["id"] for p in srv.liga["partidos"] if EQUIPOS[0] in (p["home_team"], p["away_team"])]
+    omitido = mids[0]
+    srv.omitir_en_lotes = {omitido}
+    try:
+        shots, players = benchmark.pedantic(
+            api.descargar_eventos_partidos, args=(mids,),
+            setup=api.CACHE_PARTIDOS.clear, rounds=5, iterations=1,
+        )
+    finally:
+        srv.shutdown()
+    assert set(shots) == set(players) == set(mids)
+    assert shots[omitido] == srv.liga["shots"][omitido] and shots[omitido]
+    assert srv.conteo[f"/matches/{omitido}/shots"] == srv.conteo[f"/matches/{omitido}/player-stats"] >= 1
+    verificar_baseline(benchmark)
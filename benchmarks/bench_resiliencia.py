@@ -0,0 +1,155 @@
+"""Limitador de ritmo y disyuntor frente a la API simulada caída o sin cupo.
+
+Con la API respondiendo 503 la primera descarga abre el disyuntor tras unas
+pocas peticiones (sin tormenta de reintentos partido a partido) y las
+siguientes fallan al instante sin tocar la red. Nada de lo calculado durante la
+caída queda en cache: al volver la API se obtienen los datos completos.
+"""
+import threading
+import time
+
+import pytest
+
+from datos_sinteticos import EQUIPOS
+from mock_api import iniciar_en_hilo
+from tactisense import api
+from tactisense.resiliencia import ApiNoDisponible, CuboTokens, Disyuntor
+
+UMBRAL = 5
+ENFRIAMIENTO_S = 0.3
+
+
+@pytest.fixture(scope="module")
+def servidor():
+    srv, url = iniciar_en_hilo(latencia_ms=10, n_temporadas=1)
+    yield srv, url
+    srv.shutdown()
+
+
+@pytest.fixture
+def entorno(servidor, monkeypatch):
+    """API simulada sana, caches vacías y limitador/disyuntor nuevos."""
+    srv, url = servidor
+    monkeypatch.setattr(api, "API_BASE", url)
+    monkeypatch.setattr(api, "_lotes_no_soportados", {})
+    monkeypatch.setattr(api, "DISYUNTOR", Disyuntor(umbral=UMBRAL, enfriamiento=ENFRIAMIENTO_S))
+    monkeypatch.setattr(api, "LIMITADOR", CuboTokens(tasa=1000, capacidad=1000))
+    for cache in (api.CACHE_PARTIDOS, api.CACHE_TIROS_PARTIDO, api.cargar_competiciones, api.obtener_partidos,
+                  api.tabla_equipos_temporada, api._descargar_resumen_equipo):
+        cache.clear()
+    srv.forzar_estado = None
+    yield srv
+    srv.forzar_estado = None
+
+
+def _peticiones(srv):
+    return sum(srv.conteo.values())
+
+
+def bench_api_caida_falla_rapido(benchmark, verificar_baseline, entorno):
+    srv = entorno
+    mids = [p["id"] for p in srv.liga["partidos"] if EQUIPOS[0] in (p["home_team"], p["away_team"])]
+    api.DISYUNTOR.enfriamiento = 60   # sin peticiones de prueba mientras se mide
+    srv.forzar_estado = 503
+
+    antes = _peticiones(srv)
+    shots, players = api.descargar_eventos_partidos(mids)
+    assert shots == players == {}
+    # Lote fallido + reintentos por partido hasta abrir el disyuntor, no uno por partido y dataset
+    assert _peticiones(srv) - antes <= UMBRAL + 1 < 2 * len(mids)
+    assert api.DISYUNTOR.estado == "abierto"
+
+    antes = _peticiones(srv)
+    shots, _ = benchmark(api.descargar_eventos_partidos, mids)
+    assert shots == {} and _peticiones(srv) == antes
+    assert not api.CACHE_PARTIDOS._datos
+    verificar_baseline(benchmark)
+
+
+def bench_sin_cachear_fallos(benchmark, verificar_baseline, entorno):
+    """Manifest, partidos y tabla de la temporada calculados en la caída no sobreviven a la vuelta de la API."""
+    srv = entorno
+    comps = api.cargar_competiciones()
+    fila = comps.iloc[0]
+    partidos = api.obtener_partidos(fila["competition_id"], fila["season_id"], fila["source"])
+    api.cargar_competiciones.clear()
+    api.obtener_partidos.clear()
+
+    srv.forzar_estado = 503
+    # Sin nada en cache el error llega a la página; no se convierte en "sin datos"
+    with pytest.raises(Exception):
+        api.cargar_competiciones()
+    with pytest.raises(Exception):
+        api.obtener_partidos(fila["competition_id"], fila["season_id"], fila["source"])
+    filas, _ = api.tabla_equipos_temporada(partidos)
+    assert filas.empty
+
+    srv.forzar_estado = None
+    time.sleep(ENFRIAMIENTO_S)
+    assert len(api.cargar_competiciones()) == len(comps)
+    assert len(api.obtener_partidos(fila["competition_id"], fila["season_id"], fila["source"])) == len(partidos)
+    filas, tabla = benchmark(api.tabla_equipos_temporada, partidos)
+    jugados = partidos[partidos["status"] == "finished"] if "status" in partidos.columns else partidos
+    assert filas["match_id"].nunique() == jugados["match_id"].nunique()
+    assert api.DISYUNTOR.estado == "cerrado"
+    verificar_baseline(benchmark)
+
+
+def bench_resumen_api_caida_sin_agregacion_local(benchmark, verificar_baseline, entorno):
+    """Con el disyuntor abierto el resumen falla al instante: no se agrega partido a partido."""
+    srv = entorno
+    fila = api.cargar_competiciones().iloc[0]
+    partidos = api.obtener_partidos(fila["competition_id"], fila["season_id"], fila["source"])
+    api.DISYUNTOR.enfriamiento = 60
+    srv.forzar_estado = 503
+    # Un 5xx es un error de red más: cae a la agregación local, que abre el disyuntor
+    api.obtener_resumen_equipo(EQUIPOS[0], partidos)
+    assert api.DISYUNTOR.estado == "abierto"
+
+    antes = _peticiones(srv)
+
+    def resumen():
+        with pytest.raises(ApiNoDisponible):
+            api.obtener_resumen_equipo(EQUIPOS[0], partidos)
+
+    benchmark(resumen)
+    assert _peticiones(srv) == antes
+    verificar_baseline(benchmark)
+
+
+def bench_limitador_429_y_ritmo(benchmark, verificar_baseline, entorno, monkeypatch):
+    """Un 429 reduce el ritmo a la mitad y respeta Retry-After; con concurrencia se sostiene `tasa`."""
+    srv = entorno
+    srv.forzar_estado = 429
+    assert api._get(f"{api.API_BASE}/manifest", timeout=5).status_code == 429
+    assert api.LIMITADOR.tasa == 500
+    srv.forzar_estado = None
+
+    tasa, capacidad, hilos, por_hilo = 100, 10, 8, 10
+    monkeypatch.setattr(api, "LIMITADOR", CuboTokens(tasa=tasa, capacidad=capacidad))
+
+    rondas = []
+
+    def rafaga():
+        rondas.append(1)
+
+        def cliente(i):
+            for k in range(por_hilo):
+                # URLs distintas: el single-flight no las une
+                api._get(f"{api.API_BASE}/matches?season={i * por_hilo + k}", timeout=5)
+        threads = [threading.Thread(target=cliente, args=(i,)) for i in range(hilos)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def vaciar():
+        api.LIMITADOR._tokens = capacidad
+
+    t0 = time.perf_counter()
+    benchmark.pedantic(rafaga, setup=vaciar, rounds=3, iterations=1)
+    minimo = (hilos * por_hilo - capacidad) / tasa
+    assert benchmark.stats is None or benchmark.stats.stats.min >= 0.9 * minimo
+    # Con --benchmark-disable `pedantic` hace una sola ronda
+    assert time.perf_counter() - t0 >= len(rondas) * 0.9 * minimo
+    verificar_baseline(benchmark)
@@ -0,0 +1,102 @@
+"""Stale-while-revalidate en las cargas de la API: vencido el TTL nadie espera a la red.
+
+Con la lista de partidos vencida, las sesiones reciben al instante la anterior
+y una sola recarga en segundo plano va a la API, la pidan cuantas sesiones la
+pidan; la lectura siguiente ve los datos nuevos. La referencia es la carga
+bloqueante que pagaba la primera sesión al vencer `st.cache_data`.
+"""
+import threading
+import time
+
+import pytest
+
+from mock_api import iniciar_en_hilo
+from tactisense import api
+
+LATENCIA_MS = 80
+SESIONES = 32
+
+
+@pytest.fixture(scope="module")
+def servidor():
+    srv, url = iniciar_en_hilo(latencia_ms=LATENCIA_MS, n_temporadas=1)
+    yield srv, url
+    srv.shutdown()
+
+
+@pytest.fixture
+def partidos(servidor, monkeypatch):
+    """Argumentos de `obtener_partidos` para la temporada simulada, con la cache vacía."""
+    srv, url = servidor
+    monkeypatch.setattr(api, "API_BASE", url)
+    api.obtener_partidos.clear()
+    entrada = srv.liga["manifest"]["entries"][0]
+    yield entrada["league"], entrada["season"], entrada["source"]
+    api.obtener_partidos.clear()
+
+
+def _esperar(condicion, limite_s=5):
+    fin = time.monotonic() + limite_s
+    while not condicion():
+        assert time.monotonic() < fin, "la recarga en segundo plano no terminó"
+        time.sleep(0.01)
+
+
+def bench_partidos_vencidos_revalidacion(benchmark, verificar_baseline, servidor, partidos, monkeypatch):
+    srv, _ = servidor
+    liga, temporada, fuente = partidos
+    anterior = api.obtener_partidos(liga, temporada, fuente)
+    monkeypatch.setattr(api.obtener_partidos.cache, "ttl", 0)
+    monkeypatch.setattr(api.obtener_partidos.cache, "reintento", 0)
+
+    # Llega un partido nuevo; todas las sesiones leen a la vez la lista vencida
+    nuevo = dict(srv.liga["partidos"][-1], id=10**9)
+    srv.liga["partidos"].append(nuevo)
+    try:
+        peticiones = srv.conteo["/matches"]
+        barrera, resultados = threading.Barrier(SESIONES), []
+
+        def sesion():
+            barrera.wait()
+            resultados.append(api.obtener_partidos(liga, temporada, fuente))
+
+        hilos = [threading.Thread(target=sesion) for _ in range(SESIONES)]
+        for h in hilos:
+            h.start()
+        for h in hilos:
+            h.join()
+        assert all(r is anterior for r in resultados)
+        _esperar(lambda: nuevo["id"] in api.obtener_partidos(liga, temporada, fuente)["match_id"].tolist())
+        assert srv.conteo["/matches"] - peticiones <= 2   # la recarga de la ráfaga (+ la de la última lectura)
+
+        df = benchmark(api.obtener_partidos, liga, temporada, fuente)
+        assert len(df) == len(anterior) + 1
+    finally:
+        srv.liga["partidos"].remove(nuevo)
+    verificar_baseline(benchmark)
+
+
+def bench_partidos_vencidos_bloqueante(benchmark, verificar_baseline, partidos):
+    """Referencia: la primera sesión tras vencer el TTL espera la descarga completa."""
+    df = benchmark.pedantic(api.obtener_partidos, args=partidos, setup=api.obtener_partidos.clear,
+                            rounds=5, iterations=1)
+    assert not df.empty
+    verificar_baseline(benchmark)
+
+
+def bench_temporada_sin_partidos(benchmark, verificar_baseline, servidor, partidos, monkeypatch):
+    """Una temporada sin partidos es una respuesta correcta: se guarda (TTL corto) y no se pide en cada rerun."""
+    srv, _ = servidor
+    liga, _, fuente = partidos
+    peticiones = srv.conteo["/matches"]
+    assert api.obtener_partidos(liga, "0", fuente).empty
+    df = benchmark(api.obtener_partidos, liga, "0", fuente)
+    assert df.empty and srv.conteo["/matches"] - peticiones == 1
+
+    # Pasado `ttl_vacio` se sirve la vacía y se revalida en segundo plano
+    monkeypatch.setattr(api.obtener_partidos.cache, "ttl_vacio", 0)
+    api.obtener_partidos.clear()
+    api.obtener_partidos(liga, "0", fuente)
+    api.obtener_partidos(liga, "0", fuente)
+    _esperar(lambda: srv.conteo["/matches"] - peticiones == 3)
+    verificar_baseline(benchmark)
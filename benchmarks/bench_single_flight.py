@@ -0,0 +1,93 @@
+"""Single-flight en el cliente de datos: sesiones concurrentes que piden los mismos partidos.
+
+Simula el final de un partido: `SESIONES` hilos abren a la vez el mismo equipo
+(y la mitad, además, a su rival) con las caches vacías contra la API simulada.
+Con single-flight cada URL y cada partido se descargan una vez y el resto de
+las peticiones se cuentan como coalescidas; sin él, cada sesión repite las
+mismas descargas.
+"""
+import threading
+
+import pytest
+
+from datos_sinteticos import EQUIPOS
+from mock_api import iniciar_en_hilo
+from tactisense import api
+from tactisense.cache import UnVuelo
+from tactisense.instrumentacion import REGISTRO_GLOBAL
+
+LATENCIA_MS = 80
+SESIONES = 16
+
+
+class SinVuelo(UnVuelo):
+    """Cada llamada ejecuta su propia descarga (comportamiento sin single-flight)."""
+
+    def reclamar(self, claves):
+        return list(claves), {}
+
+    def terminar(self, clave, resultado=None, error=None):
+        pass
+
+
+@pytest.fixture(scope="module")
+def servidor():
+    srv, url = iniciar_en_hilo(latencia_ms=LATENCIA_MS, n_temporadas=1)
+    yield srv, url
+    srv.shutdown()
+
+
+def _mids(liga, equipo):
+    return [p["id"] for p in liga["partidos"] if equipo in (p["home_team"], p["away_team"])]
+
+
+def _rafaga(pedidos):
+    barrera = threading.Barrier(len(pedidos))
+    resultados = [None] * len(pedidos)
+
+    def sesion(i):
+        barrera.wait()
+        resultados[i] = api.descargar_eventos_partidos(pedidos[i])
+
+    hilos = [threading.Thread(target=sesion, args=(i,)) for i in range(len(pedidos))]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+    return resultados
+
+
+@pytest.mark.parametrize("single_flight", [True, False], ids=["single_flight", "sin_single_flight"])
+def bench_sesiones_concurrentes_mismo_equipo(benchmark, verificar_baseline, servidor, single_flight, monkeypatch):
+    srv, url = servidor
+    monkeypatch.setattr(api, "API_BASE", url)
+    monkeypatch.setattr(api, "_lotes_no_soportados", {})
+    if not single_flight:
+        monkeypatch.setattr(api, "VUELOS_HTTP", SinVuelo())
+        monkeypatch.setattr(api, "VUELOS_PARTIDOS", SinVuelo())
+    propios, rivales = _mids(srv.liga, EQUIPOS[0]), _mids(srv.liga, EQUIPOS[1])
+    # La mitad de las sesiones abre el equipo y la otra mitad el cara a cara con su rival
+    pedidos = [propios if i % 2 == 0 else sorted(set(propios) | set(rivales)) for i in range(SESIONES)]
+
+    conteo = {}
+
+    def preparar():
+        api.CACHE_PARTIDOS.clear()
+        conteo["peticiones"] = sum(srv.conteo.values())
+        conteo["coalescidas"] = sum(REGISTRO_GLOBAL.coalescidas.values())
+
+    resultados = benchmark.pedantic(_rafaga, args=(pedidos,), setup=preparar, rounds=3, iterations=1)
+    for pedido, (shots, players) in zip(pedidos, resultados):
+        assert set(shots) == set(players) == set(pedido)
+        assert all(shots[m] == srv.liga["shots"][m] for m in pedido)
+
+    peticiones = sum(srv.conteo.values()) - conteo["peticiones"]
+    coalescidas = sum(REGISTRO_GLOBAL.coalescidas.values()) - conteo["coalescidas"]
+    benchmark.extra_info.update(peticiones_http=peticiones, coalescidas=coalescidas)
+    if single_flight:
+        # Un lote por dataset para el equipo y otro para los partidos del rival que no compartía
+        assert peticiones <= 4
+        assert coalescidas >= SESIONES
+    else:
+        assert peticiones >= SESIONES
+    verificar_baseline(benchmark)
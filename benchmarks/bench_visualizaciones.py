@@ -0,0 +1,37 @@
+"""Render de figuras matplotlib (backend Agg, incluye dibujado a PNG)."""
+from io import BytesIO
+
+import matplotlib.pyplot as plt
+
+from tactisense.analisis import calcular_metricas_jugador
+from tactisense.visualizaciones import figura_xg_por_jugador, graficar_mapa_calor, graficar_radar
+
+
+def _renderizar(fig):
+    # st.pyplot guarda la figura como PNG; medimos lo mismo
+    buf = BytesIO()
+    fig.savefig(buf, format="png")
+    plt.close(fig)
+    return buf.tell()
+
+
+def bench_graficar_xg_por_jugador(benchmark, verificar_baseline, df_eventos):
+    n_bytes = benchmark(lambda: _renderizar(figura_xg_por_jugador(df_eventos)))
+    assert n_bytes > 0
+    verificar_baseline(benchmark)
+
+
+def bench_graficar_radar(benchmark, verificar_baseline, df_eventos):
+    tiros = df_eventos[df_eventos["type_name"] == "Shot"]
+    jugador = tiros["player"].value_counts().index[0]
+    metricas = calcular_metricas_jugador(df_eventos, jugador)
+    n_bytes = benchmark(lambda: _renderizar(graficar_radar(dict(metricas), jugador)))
+    assert n_bytes > 0
+    verificar_baseline(benchmark)
+
+
+def bench_mapa_calor_kde(benchmark, verificar_baseline, df_eventos):
+    tiros = df_eventos[df_eventos["type_name"] == "Shot"]
+    n_bytes = benchmark(lambda: _renderizar(graficar_mapa_calor(tiros, "#040404", "#B3B2B3")))
+    assert n_bytes > 0
+    verificar_baseline(benchmark)
@@ -0,0 +1,240 @@
+"""Prueba de carga: muchas sesiones simuladas del dashboard contra la API simulada.
+
+Cada usuario virtual es una sesión de `AppTest`: la misma app, en el mismo
+proceso y con las mismas caches que un servidor real. El usuario recorre un
+guion: abrir la app, elegir liga y rival en Análisis Rival, pasar a Scout
+Report y elegir varios jugadores, con una pausa de lectura entre pasos. La
+concurrencia sube por escalones. En cada uno se mide la latencia de cada rerun
+(p50/p95/p99), la CPU del proceso y la RSS. Al final se estima la capacidad del
+nodo: el último escalón que cumple el objetivo de p95 sin errores.
+
+    $ python benchmarks/carga.py --escalones 1,2,4,8,16 --latencia-ms 80
+    $ python benchmarks/carga.py --api http://127.0.0.1:8765 --escalones 4,8 --json carga.json
+
+Sin `--api` la API simulada corre en otro proceso, así que la CPU medida es
+solo la del nodo de Streamlit. Los cambios de jugador son reruns de fragmento
+en el navegador; aquí son reruns completos, así que su latencia es una cota
+superior.
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, "streamlit_app.py")
+
+
+# =========================
+# GUION DE UNA SESIÓN
+# =========================
+def _ir_a(pagina):
+    def accion(at, azar):
+        at.session_state["pagina_inicial"] = pagina
+    return accion
+
+
+def _elegir(etiqueta):
+    def accion(at, azar):
+        caja = next((s for s in at.selectbox if s.label == etiqueta), None)
+        if caja is not None and caja.options:
+            caja.select(azar.choice(caja.options))
+    return accion
+
+
+# (paso, acción antes del rerun); el primer paso solo abre la app
+GUION = [
+    ("abrir app", None),
+    ("Análisis Rival", _ir_a("Análisis Rival")),
+    ("elegir liga", _elegir("Selecciona una liga")),
+    ("elegir rival", _elegir("Equipo Rival")),
+    ("Scout Report", _ir_a("Scout Report")),
+    ("elegir jugador", _elegir("Selecciona un jugador")),
+    ("elegir jugador", _elegir("Selecciona un jugador")),
+    ("elegir jugador", _elegir("Selecciona un jugador")),
+]
+
+
+def sesion(guion, pausa_s, azar, reruns, timeout=300):
+    """Recorre `guion` en una sesión nueva; agrega (paso, segundos, error) a `reruns`."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    for paso, accion in guion:
+        if accion is not None:
+            time.sleep(pausa_s * azar.uniform(0.5, 1.5))
+            accion(at, azar)
+        t0 = time.perf_counter()
+        try:
+            at.run()
+            error = len(at.exception) > 0
+        except Exception:
+            error = True
+        reruns.append((paso, time.perf_counter() - t0, error))
+        if error:
+            return
+
+
+# =========================
+# MEDICIÓN POR ESCALÓN
+# =========================
+def rss_mb():
+    """RSS actual del proceso (Linux); en otros sistemas, el pico de `getrusage`."""
+    try:
+        with open("/proc/self/status") as f:
+            for linea in f:
+                if linea.startswith("VmRSS:"):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def percentiles(latencias):
+    if not latencias:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+    p50, p95, p99 = np.percentile(latencias, [50, 95, 99]) * 1000
+    return {"p50_ms": round(p50, 1), "p95_ms": round(p95, 1), "p99_ms": round(p99, 1),
+            "max_ms": round(max(latencias) * 1000, 1)}
+
+
+def ejecutar_escalon(concurrencia, guion=GUION, pausa_s=1.0, semilla=0):
+    """Lanza `concurrencia` sesiones a la vez y resume latencias, CPU y memoria del escalón."""
+    reruns, hilos = [], []
+    rss_inicio = pico = rss_mb()
+    fin = threading.Event()
+
+    def muestrear():
+        nonlocal pico
+        while not fin.wait(0.2):
+            pico = max(pico, rss_mb())
+
+    monitor = threading.Thread(target=muestrear, daemon=True)
+    monitor.start()
+    cpu0, t0 = time.process_time(), time.perf_counter()
+    for i in range(concurrencia):
+        azar = random.Random(semilla * 1000 + i)
+        hilos.append(threading.Thread(target=sesion, args=(guion, pausa_s, azar, reruns)))
+        hilos[-1].start()
+    for hilo in hilos:
+        hilo.join()
+    duracion, cpu = time.perf_counter() - t0, time.process_time() - cpu0
+    fin.set()
+    monitor.join()
+    pico = max(pico, rss_mb())
+
+    latencias = [s for _, s, _ in reruns]
+    por_paso = {}
+    for paso, segundos, _ in reruns:
+        por_paso.setdefault(paso, []).append(segundos)
+    return {
+        "concurrencia": concurrencia,
+        "reruns": len(reruns),
+        "errores": sum(error for _, _, error in reruns),
+        **percentiles(latencias),
+        "reruns_por_s": round(len(reruns) / duracion, 2),
+        "duracion_s": round(duracion, 2),
+        "cpu_pct": round(100 * cpu / duracion, 1),
+        "cpu_s_por_sesion": round(cpu / concurrencia, 3),
+        "rss_pico_mb": round(pico, 1),
+        "rss_mb_por_sesion": round(max(0.0, pico - rss_inicio) / concurrencia, 2),
+        "pasos": {paso: percentiles(lat) for paso, lat in por_paso.items()},
+    }
+
+
+def capacidad(escalones, objetivo_p95_ms):
+    """Mayor concurrencia con p95 dentro del objetivo y sin errores (0 si ninguna)."""
+    validos = [e["concurrencia"] for e in escalones
+               if e["errores"] == 0 and e["p95_ms"] is not None and e["p95_ms"] <= objetivo_p95_ms]
+    return max(validos, default=0)
+
+
+# =========================
+# API SIMULADA Y REPORTE
+# =========================
+def iniciar_api(latencia_ms, temporadas):
+    """Arranca benchmarks/mock_api.py en otro proceso y devuelve (proceso, url_base)."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        puerto = s.getsockname()[1]
+    proceso = subprocess.Popen(
+        [sys.executable, os.path.join(RAIZ, "benchmarks", "mock_api.py"), "--puerto", str(puerto),
+         "--latencia-ms", str(latencia_ms), "--temporadas", str(temporadas)],
+        stdout=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{puerto}"
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(f"{url}/_stats", timeout=1)
+            return proceso, url
+        except OSError:
+            time.sleep(0.1)
+    proceso.kill()
+    raise RuntimeError("la API simulada no arrancó")
+
+
+def preparar_app(url):
+    """Apunta la app a `url`; se llama antes de la primera sesión."""
+    os.environ["TACTISENSE_API_BASE"] = url
+    os.chdir(RAIZ)   # los assets se abren con rutas relativas a la raíz
+    if RAIZ not in sys.path:
+        sys.path.insert(0, RAIZ)
+    from tactisense import api
+    api.API_BASE = url
+
+
+def imprimir(escalones, objetivo_p95_ms):
+    cols = ["concurrencia", "reruns", "errores", "p50_ms", "p95_ms", "p99_ms", "reruns_por_s",
+            "cpu_pct", "cpu_s_por_sesion", "rss_pico_mb", "rss_mb_por_sesion"]
+    print(" ".join(f"{c:>16}" for c in cols))
+    for e in escalones:
+        print(" ".join(f"{str(e[c]):>16}" for c in cols))
+    ultimo = escalones[-1]
+    print(f"\nLatencia por paso con {ultimo['concurrencia']} sesiones:")
+    for paso, p in ultimo["pasos"].items():
+        print(f"  {paso:16s} p50 {p['p50_ms']:>8} ms   p95 {p['p95_ms']:>8} ms")
+    print(f"\nCapacidad estimada (p95 ≤ {objetivo_p95_ms:.0f} ms, sin errores): "
+          f"{capacidad(escalones, objetivo_p95_ms)} sesiones concurrentes por nodo")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--escalones", default="1,2,4,8", help="Sesiones concurrentes de cada escalón.")
+    parser.add_argument("--pausa-s", type=float, default=1.0, help="Pausa media entre pasos de una sesión.")
+    parser.add_argument("--objetivo-p95-ms", type=float, default=2000.0)
+    parser.add_argument("--api", help="URL de una API ya levantada; si falta se arranca la simulada.")
+    parser.add_argument("--latencia-ms", type=float, default=80.0, help="Latencia de la API simulada.")
+    parser.add_argument("--temporadas", type=int, default=2)
+    parser.add_argument("--sin-calentar", action="store_true",
+                        help="No recorre el guion una vez antes de medir (el primer escalón paga la cache fría).")
+    parser.add_argument("--json", help="Guarda los resultados de cada escalón en este archivo.")
+    args = parser.parse_args()
+
+    proceso, url = (None, args.api) if args.api else iniciar_api(args.latencia_ms, args.temporadas)
+    try:
+        preparar_app(url)
+        if not args.sin_calentar:
+            sesion(GUION, 0.0, random.Random(-1), [])
+        escalones = []
+        for k, n in enumerate(int(x) for x in args.escalones.split(",")):
+            escalones.append(ejecutar_escalon(n, pausa_s=args.pausa_s, semilla=k))
+            print(f"escalón {n}: p95 {escalones[-1]['p95_ms']} ms, {escalones[-1]['errores']} errores", flush=True)
+        print()
+        imprimir(escalones, args.objetivo_p95_ms)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump({"objetivo_p95_ms": args.objetivo_p95_ms, "escalones": escalones,
+                           "capacidad": capacidad(escalones, args.objetivo_p95_ms)}, f, indent=2, ensure_ascii=False)
+    finally:
+        if proceso is not None:
+            proceso.terminate()
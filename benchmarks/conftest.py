@@ -0,0 +1,169 @@
+"""Fixtures comunes y control de regresiones contra `baselines.json`.
+
+Cada benchmark llama a `verificar_baseline(benchmark)` después de medir. Las
+medianas no se guardan en segundos sino como múltiplos de una carga de
+referencia fija (pandas + Python puro) que se mide al empezar la sesión: así el
+umbral compara lo mismo en la máquina que grabó el archivo y en CI u otro
+hardware. La prueba falla si la mediana supera la guardada, reescalada a esta
+máquina, en más del `umbral` del archivo (o el de `tolerancias` para ese caso o
+esa función) y además en más de `piso_ms` absolutos: los casos de pocos ms son
+sobre todo costo fijo de pandas/Python y no escalan como la referencia. Antes
+de fallar se vuelve a medir la referencia, por si la máquina se frenó durante
+la sesión. Un caso sin baseline se salta con un aviso; solo
+`--actualizar-baselines` escribe el archivo.
+
+Los casos que esperan a la API simulada (latencia fija) no escalan con la CPU:
+en máquinas muy distintas a la de `referencia.maquina` conviene regrabarlos.
+"""
+import json
+import os
+import platform
+import sys
+import time
+
+import matplotlib
+import numpy as np
+import pandas as pd
+import pytest
+
+matplotlib.use("Agg")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datos_sinteticos import ESCALAS, EQUIPOS, eventos_equipo, generar_liga  # noqa: E402
+from tactisense.api import construir_filas_eventos  # noqa: E402
+
+RUTA_BASELINES = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+# Filas de /matches de toda la liga para cada escala (1 partido, 1 y 5 torneos)
+ESCALAS_LIGA = {"1_partido": 1, "1_temporada": 153, "5_temporadas": 765}
+
+
+def pytest_addoption(parser):
+    parser.addoption("--actualizar-baselines", action="store_true", default=False,
+                     help="Reescribe baselines.json con las medianas de esta corrida.")
+
+
+def _cargar_baselines():
+    if os.path.exists(RUTA_BASELINES):
+        with open(RUTA_BASELINES, encoding="utf-8") as f:
+            return json.load(f)
+    return {"umbral": 0.50, "piso_ms": 5.0, "tolerancias": {}, "casos": {}}
+
+
+_baselines = _cargar_baselines()
+_modificado = False
+
+
+def _carga_referencia():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"k": rng.integers(0, 500, 200_000), "v": rng.random(200_000)})
+    df.groupby("k")["v"].agg(["sum", "mean", "max"])
+    sum(i * i for i in range(300_000))
+
+
+def _medir_referencia(corridas=5):
+    """Mejor de `corridas` de la carga de referencia en esta máquina."""
+    _carga_referencia()
+    tiempos = []
+    for _ in range(corridas):
+        t0 = time.perf_counter()
+        _carga_referencia()
+        tiempos.append(time.perf_counter() - t0)
+    return min(tiempos)
+
+
+@pytest.fixture(scope="session")
+def segundos_referencia():
+    return _medir_referencia()
+
+
+def _umbral(caso):
+    """Tolerancia del caso: la de `tolerancias` para el caso o su función, o el `umbral` general."""
+    tolerancias = _baselines.get("tolerancias", {})
+    return tolerancias.get(caso, tolerancias.get(caso.split("[", 1)[0], _baselines["umbral"]))
+
+
+def _limite(previa, referencia, caso):
+    previa_s = previa * referencia
+    return max(previa_s * (1 + _umbral(caso)), previa_s + _baselines.get("piso_ms", 0.0) / 1e3)
+
+
+def _describir_maquina():
+    return f"{platform.machine()} · {platform.processor() or platform.system()} · {os.cpu_count()} CPU · Python {platform.python_version()}"
+
+
+@pytest.fixture
+def verificar_baseline(request, segundos_referencia):
+    actualizar = request.config.getoption("--actualizar-baselines")
+
+    def _verificar(benchmark):
+        global _modificado
+        if benchmark.stats is None:  # --benchmark-disable
+            return
+        caso = request.node.nodeid.split("::", 1)[-1]
+        mediana = benchmark.stats.stats.median
+        if actualizar:
+            _baselines["casos"][caso] = float(f"{mediana / segundos_referencia:.4g}")
+            _baselines["referencia"] = {"maquina": _describir_maquina(), "segundos": round(segundos_referencia, 6)}
+            _modificado = True
+            return
+        previa = _baselines["casos"].get(caso)
+        if previa is None:
+            pytest.skip(f"Sin baseline para {caso}: grábelo con `pytest benchmarks --actualizar-baselines`")
+        referencia = segundos_referencia
+        if mediana > _limite(previa, referencia, caso):
+            # La máquina pudo frenarse desde el inicio de la sesión: la referencia más lenta manda
+            referencia = max(referencia, _medir_referencia(corridas=3))
+        limite = _limite(previa, referencia, caso)
+        # Queda en --benchmark-json junto a la mediana, para ver de qué lado del límite cayó
+        benchmark.extra_info.update(referencia_s=referencia, limite_s=limite)
+        if mediana > limite:
+            pytest.fail(f"Regresión en {caso}: mediana {mediana * 1e3:.2f} ms "
+                        f"> {limite * 1e3:.2f} ms (baseline {previa:.3g}× la referencia "
+                        f"de {referencia * 1e3:.1f} ms, +{_umbral(caso):.0%} "
+                        f"y al menos +{_baselines.get('piso_ms', 0.0):g} ms)")
+
+    return _verificar
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if _modificado:
+        with open(RUTA_BASELINES, "w", encoding="utf-8") as f:
+            json.dump(_baselines, f, indent=2, sort_keys=True, ensure_ascii=False)
+            f.write("\n")
+
+
+@pytest.fixture(scope="session")
+def liga():
+    return generar_liga(n_temporadas=5)
+
+
+@pytest.fixture(scope="session")
+def equipo():
+    return EQUIPOS[0]
+
+
+@pytest.fixture(scope="session", params=list(ESCALAS))
+def escala(request):
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def eventos_crudos(liga, equipo, escala):
+    return eventos_equipo(liga, equipo, ESCALAS[escala])
+
+
+@pytest.fixture(scope="session")
+def df_eventos(eventos_crudos):
+    todos_shots, todos_players = eventos_crudos
+    return construir_filas_eventos(todos_shots, todos_players)
+
+
+@pytest.fixture(scope="session")
+def partidos_liga(liga, escala):
+    return pd.DataFrame(liga["partidos"][:ESCALAS_LIGA[escala]])
+
+
+@pytest.fixture(scope="session")
+def csv_eventos(df_eventos):
+    return df_eventos.to_csv(index=False).encode("utf-8")
@@ -0,0 +1,144 @@
+"""Generador determinista de datos con la forma exacta de la TacticSense API.
+
+Produce manifest, partidos, /shots y /player-stats sintéticos para medir los
+hot paths sin red. Los tamaños reproducen Liga MX: 18 equipos y 17 jornadas
+por torneo (153 partidos de liga, 17 por equipo).
+"""
+import random
+from datetime import date, timedelta
+
+EQUIPOS = [
+    "América", "Guadalajara", "Cruz Azul", "Pumas UNAM", "Monterrey", "Tigres UANL",
+    "Toluca", "Santos Laguna", "León", "Pachuca", "Atlas", "Puebla",
+    "Querétaro", "Necaxa", "Mazatlán", "Juárez", "Tijuana", "Atlético San Luis",
+]
+FORMACIONES = ["4-3-3", "4-2-3-1", "4-4-2", "3-4-3", "5-3-2", "4-1-4-1"]
+RESULTADOS = ["Goal", "SavedShot", "MissedShots", "BlockedShot", "ShotOnPost"]
+PESOS_RESULTADO = [0.11, 0.24, 0.38, 0.24, 0.03]
+SITUACIONES = ["OpenPlay", "FromCorner", "SetPiece", "DirectFreekick", "Penalty"]
+PESOS_SITUACION = [0.72, 0.14, 0.08, 0.04, 0.02]
+PARTES = ["RightFoot", "LeftFoot", "Head"]
+PESOS_PARTE = [0.55, 0.30, 0.15]
+
+JORNADAS_POR_TEMPORADA = 17
+JUGADORES_POR_EQUIPO = 25
+
+# Partidos por equipo para cada escala de benchmark
+ESCALAS = {
+    "1_partido": 1,
+    "1_temporada": JORNADAS_POR_TEMPORADA,
+    "5_temporadas": 5 * JORNADAS_POR_TEMPORADA,
+}
+
+
+def _plantilla(equipo, idx_equipo):
+    """Jugadores con id v1 (7 dígitos, /shots) e id v2 (5 dígitos, /player-stats)."""
+    return [
+        {
+            "nombre": f"{equipo} J{n:02d}",
+            "id_v1": 1_000_000 + idx_equipo * 100 + n,
+            "id_v2": 10_000 + idx_equipo * 100 + n,
+        }
+        for n in range(1, JUGADORES_POR_EQUIPO + 1)
+    ]
+
+
+def _shot(rng, partido, equipo, jugador, formacion):
+    x = rng.uniform(84.0, 119.0)
+    y = rng.gauss(40.0, 9.0)
+    distancia = ((120.0 - x) ** 2 + (40.0 - y) ** 2) ** 0.5
+    xg = max(0.01, min(0.95, 0.9 * (1.0 - distancia / 40.0) ** 2 + rng.uniform(-0.03, 0.05)))
+    return {
+        "id": rng.randrange(10**9),
+        "match_id": partido["id"],
+        "player": jugador["nombre"],
+        "player_id": jugador["id_v1"],
+        "xG": round(xg, 4),
+        "x": round(x, 2),
+        "y": round(min(79.5, max(0.5, y)), 2),
+        "minute": rng.randint(1, 95),
+        "team": equipo,
+        "formation": formacion,
+        # El gol sale con probabilidad xG: el modelo xG local tiene señal que aprender
+        "type": "Goal" if rng.random() < xg else rng.choices(RESULTADOS[1:], PESOS_RESULTADO[1:])[0],
+        "situation": rng.choices(SITUACIONES, PESOS_SITUACION)[0],
+        "body_part": rng.choices(PARTES, PESOS_PARTE)[0],
+    }
+
+
+def _player_stat(rng, partido, equipo, jugador, xg_tiros):
+    minutos = rng.choice([90, 90, 90, 78, 65, 45, 23, 12])
+    return {
+        "match_id": partido["id"],
+        "player": None,
+        "player_id": jugador["id_v2"],
+        "team": equipo,
+        "minutes": minutos,
+        "expected_goals": round(xg_tiros, 4),
+        "rating": round(rng.uniform(5.8, 8.4), 1),
+        "passes_total": rng.randint(8, 70),
+        "tackles_total": rng.randint(0, 6),
+        "fouls_committed": rng.randint(0, 4),
+        "yellow_card": int(rng.random() < 0.12),
+        "red_card": int(rng.random() < 0.01),
+    }
+
+
+def generar_liga(n_temporadas=1, seed=7, primera_temporada=296):
+    """Devuelve un dict con `manifest`, `partidos`, `shots` y `player_stats`.
+
+    `partidos` es la lista que devuelve /matches (todas las temporadas);
+    `shots` y `player_stats` están indexados por id de partido.
+    """
+    rng = random.Random(seed)
+    plantillas = {e: _plantilla(e, i) for i, e in enumerate(EQUIPOS)}
+    formacion_base = {e: rng.choice(FORMACIONES) for e in EQUIPOS}
+    entries, partidos, shots, stats = [], [], {}, {}
+    mid = 100_000
+    for t in range(n_temporadas):
+        season = primera_temporada + t
+        league = f"league_{19 + t}"
+        entries.append({"source": "bsd", "league": league, "season": season,
+                        "datasets": ["matches", "shots", "player-stats"]})
+        inicio = date(2025, 7, 11) + timedelta(days=182 * t)
+        for jornada in range(JORNADAS_POR_TEMPORADA):
+            orden = EQUIPOS[:]
+            rng.shuffle(orden)
+            for k in range(0, len(orden), 2):
+                local, visita = orden[k], orden[k + 1]
+                mid += 1
+                partido = {
+                    "id": mid,
+                    "league": league,
+                    "season": season,
+                    "home_team": local,
+                    "away_team": visita,
+                    "event_date": (inicio + timedelta(days=7 * jornada)).isoformat(),
+                    "status": "finished",
+                }
+                partidos.append(partido)
+                shots[mid], stats[mid] = [], []
+                for equipo in (local, visita):
+                    plantilla = plantillas[equipo]
+                    formacion = formacion_base[equipo] if rng.random() < 0.8 else rng.choice(FORMACIONES)
+                    xg_por_jugador = {}
+                    for _ in range(rng.randint(6, 20)):
+                        jugador = rng.choice(plantilla[1:])
+                        s = _shot(rng, partido, equipo, jugador, formacion)
+                        shots[mid].append(s)
+                        xg_por_jugador[jugador["id_v2"]] = xg_por_jugador.get(jugador["id_v2"], 0.0) + s["xG"]
+                    for jugador in plantilla[:16]:
+                        stats[mid].append(_player_stat(rng, partido, equipo, jugador,
+                                                       xg_por_jugador.get(jugador["id_v2"], 0.0)))
+    return {"manifest": {"entries": entries}, "partidos": partidos, "shots": shots, "player_stats": stats}
+
+
+def eventos_equipo(liga, equipo, n_partidos):
+    """Respuestas crudas (shots, player-stats) de los últimos `n_partidos` del equipo."""
+    propios = [p for p in liga["partidos"] if equipo in (p["home_team"], p["away_team"])]
+    propios.sort(key=lambda p: p["event_date"], reverse=True)
+    todos_shots, todos_players = [], []
+    for p in propios[:n_partidos]:
+        todos_shots.extend(dict(s) for s in liga["shots"][p["id"]])
+        todos_players.extend(dict(s) for s in liga["player_stats"][p["id"]])
+    return todos_shots, todos_players
@@ -0,0 +1,141 @@
+"""TacticSense API simulada sobre los datos sintéticos de `datos_sinteticos`.
+
+Sirve los mismos recursos que la API real, incluidos los lotes
+(`/shots?match_ids=...`, `/player-stats?match_ids=...`) y `/team-summary`, con
+una latencia artificial por petición para que las comparaciones offline se
+parezcan al gateway real.
+
+    $ python benchmarks/mock_api.py --puerto 8765 --latencia-ms 80
+    $ TACTISENSE_API_BASE=http://127.0.0.1:8765 streamlit run streamlit_app.py
+
+`GET /_stats` devuelve el conteo de peticiones recibidas por ruta. Para simular
+incidencias, `servidor.forzar_estado = 503` (o 429, con `Retry-After: 1`) hace
+que todas las demás rutas respondan ese código hasta volver a None, y los ids
+de `servidor.omitir_en_lotes` no aparecen en las respuestas por lotes (sí en la
+ruta por partido).
+"""
+import argparse
+import json
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from datos_sinteticos import generar_liga
+
+_RUTA_PARTIDO = re.compile(r"^/matches/(\d+)/(shots|player-stats)$")
+
+
+def _resumen_equipo(liga, partidos, equipo):
+    filas = []
+    for p in partidos:
+        if equipo not in (p["home_team"], p["away_team"]):
+            continue
+        propios = [s for s in liga["shots"][p["id"]] if s["team"] == equipo]
+        rivales = [s for s in liga["shots"][p["id"]] if s["team"] != equipo]
+        stats = [s for s in liga["player_stats"][p["id"]] if s["team"] == equipo]
+        filas.append({
+            "match_id": p["id"],
+            "event_date": p["event_date"],
+            "opponent": p["away_team"] if p["home_team"] == equipo else p["home_team"],
+            "home": p["home_team"] == equipo,
+            "formation": Counter(s["formation"] for s in propios).most_common(1)[0][0] if propios else None,
+            "shots": len(propios),
+            "shots_on_target": sum(s["type"] in ("Goal", "SavedShot") for s in propios),
+            "goals": sum(s["type"] == "Goal" for s in propios),
+            "xg": round(sum(s["xG"] for s in propios), 4),
+            "shots_against": len(rivales),
+            "goals_against": sum(s["type"] == "Goal" for s in rivales),
+            "xg_against": round(sum(s["xG"] for s in rivales), 4),
+            "yellow_cards": sum(s["yellow_card"] for s in stats),
+            "red_cards": sum(s["red_card"] for s in stats),
+        })
+    return filas
+
+
+def crear_servidor(puerto=0, latencia_ms=0.0, lotes=True, resumen=True, n_temporadas=2, seed=7):
+    """Crea (sin arrancar) un ThreadingHTTPServer; `server_address[1]` da el puerto real."""
+    liga = generar_liga(n_temporadas=n_temporadas, seed=seed)
+    conteo = Counter()
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _json(self, datos, status=200):
+            cuerpo = json.dumps(datos).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            if status == 429:
+                self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", str(len(cuerpo)))
+            self.end_headers()
+            self.wfile.write(cuerpo)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            qs = {k: v[0] for k, v in parse_qs(url.query).items()}
+            if url.path == "/_stats":
+                with lock:
+                    return self._json(dict(conteo))
+            with lock:
+                conteo[url.path] += 1
+            if latencia_ms:
+                time.sleep(latencia_ms / 1000.0)
+            if servidor.forzar_estado:
+                return self._json({"error": "forzado"}, servidor.forzar_estado)
+
+            partidos = [p for p in liga["partidos"]
+                        if ("league" not in qs or p["league"] == qs["league"])
+                        and ("season" not in qs or str(p["season"]) == qs["season"])]
+
+            if url.path == "/manifest":
+                return self._json(liga["manifest"])
+            if url.path == "/matches":
+                return self._json(partidos)
+            m = _RUTA_PARTIDO.match(url.path)
+            if m:
+                mid, dataset = int(m.group(1)), m.group(2)
+                fuente = liga["shots"] if dataset == "shots" else liga["player_stats"]
+                if mid not in fuente:
+                    return self._json({"error": "match not found"}, 404)
+                return self._json(fuente[mid])
+            if url.path in ("/shots", "/player-stats") and lotes and "match_ids" in qs:
+                fuente = liga["shots"] if url.path == "/shots" else liga["player_stats"]
+                ids = [int(x) for x in qs["match_ids"].split(",") if x]
+                return self._json({str(mid): fuente[mid] for mid in ids
+                                   if mid in fuente and mid not in servidor.omitir_en_lotes})
+            if url.path == "/team-summary" and resumen and "team" in qs:
+                return self._json(_resumen_equipo(liga, partidos, qs["team"]))
+            return self._json({"error": "not found"}, 404)
+
+    servidor = ThreadingHTTPServer(("127.0.0.1", puerto), Handler)
+    servidor.daemon_threads = True
+    servidor.liga = liga
+    servidor.conteo = conteo
+    servidor.forzar_estado = None
+    servidor.omitir_en_lotes = set()
+    return servidor
+
+
+def iniciar_en_hilo(**kwargs):
+    """Arranca el servidor en un hilo daemon y devuelve (servidor, url_base)."""
+    servidor = crear_servidor(**kwargs)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor, f"http://127.0.0.1:{servidor.server_address[1]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--latencia-ms", type=float, default=0.0)
+    parser.add_argument("--temporadas", type=int, default=2)
+    parser.add_argument("--sin-lotes", action="store_true", help="Responde 404 a /shots?match_ids=...")
+    parser.add_argument("--sin-resumen", action="store_true", help="Responde 404 a /team-summary")
+    args = parser.parse_args()
+    servidor = crear_servidor(args.puerto, args.latencia_ms, not args.sin_lotes, not args.sin_resumen, args.temporadas)
+    print(f"TacticSense API simulada en http://127.0.0.1:{servidor.server_address[1]}")
+    servidor.serve_forever()
@@ -0,0 +1,33 @@
+import importlib
+
+
+# =========================
+# REGISTRO DE PÁGINAS
+# =========================
+# Cada página vive en su propio módulo con una función `render()`. El módulo
+# se importa la primera vez que se visita la página (y queda en sys.modules),
+# así que un rerun solo ejecuta el código de la página activa.
+# nombre en el menú → (módulo, icono); el módulo es también el slug de ?pagina=
+PAGINAS = {
+    "Inicio":             ("inicio", "house"),
+    "Análisis Rival":     ("analisis_rival", "trophy"),
+    "Análisis Propio":    ("analisis_propio", "shield"),
+    "Scout Report":       ("scout_report", "person-lines-fill"),
+    "Mapa de Calor":      ("mapa_calor", "fire"),
+    "Pizarra":            ("pizarra", "pencil"),
+    "Comparativa":        ("comparativa", "graph-up"),
+    "Líderes":            ("lideres", "bar-chart-line"),
+    "Simulador":          ("simulador", "play"),
+    "Subir CSV":          ("subir_csv", "upload"),
+    "Chat Tactisense AI": ("chat", "robot"),
+}
+
+
+def pagina_por_slug(slug):
+    """Nombre de menú de la página cuyo módulo es `slug` (None si no existe)."""
+    return next((nombre for nombre, (modulo, _) in PAGINAS.items() if modulo == slug), None)
+
+
+def render_pagina(nombre):
+    modulo, _ = PAGINAS[nombre]
+    importlib.import_module(f"{__name__}.{modulo}").render()
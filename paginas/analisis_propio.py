@@ -0,0 +1,64 @@
+import streamlit as st
+
+from tactisense.api import disciplina_equipo, modelo_xg_temporada, series_jugadores
+from tactisense.analisis import evaluar_rendimiento_xg
+from tactisense.visualizaciones import graficar_xg_por_jugador
+from tactisense.exportacion import exportar_datos
+from tactisense.modelo_xg import comparar_xg, predecir_xg_df
+from paginas.comun import obtener_datos_eventos_por_nombre, obtener_serie_equipo, render_selectores
+
+
+def render():
+    st.markdown(f'<div class="section-badge">Tu Rendimiento</div>', unsafe_allow_html=True)
+    matches, _, equipo_prop, src, lg, ssn = render_selectores(need_rival=False, need_prop=True)
+    st.header(f"Tu equipo: {equipo_prop}")
+    if not matches.empty and equipo_prop and equipo_prop != "(sin datos)":
+        df_p = obtener_datos_eventos_por_nombre(equipo_prop, matches, max_partidos=4, source=src, league=lg, season=ssn)
+        if df_p.empty:
+            st.warning("No se encontraron eventos reales para tu equipo.")
+        else:
+            st.write(f"Eventos cargados: {df_p.shape[0]}")
+            jugadores_top = df_p['player'].value_counts().head(5).index.tolist()
+            for jugador in jugadores_top:
+                mensaje = evaluar_rendimiento_xg(df_p, jugador)
+                st.write(mensaje)
+            graficar_xg_por_jugador(df_p)
+ 
+            # Disciplina y actividad de los mismos partidos (agregados por partido cacheados)
+            dis_p = disciplina_equipo(equipo_prop, matches, max_partidos=4, source=src, league=lg, season=ssn)
+            if not dis_p.empty:
+                c1, c2, c3, c4, c5 = st.columns(5)
+                c1.metric("Amarillas", int(dis_p['yellow_cards'].sum()))
+                c2.metric("Rojas", int(dis_p['red_cards'].sum()))
+                c3.metric("Faltas / partido", f"{dis_p['fouls'].mean():.1f}")
+                c4.metric("Entradas / partido", f"{dis_p['tackles'].mean():.1f}")
+                c5.metric("Pases / partido", f"{dis_p['passes'].mean():.0f}")
+ 
+            # Forma de la temporada desde el motor de series (sin reagregar eventos)
+            serie_p = obtener_serie_equipo(equipo_prop, matches, source=src, league=lg, season=ssn)
+            if not serie_p.empty:
+                st.subheader("Forma reciente")
+                st.line_chart(serie_p.set_index('match_date')[['xg_media', 'xg_ewm', 'xg_against_media', 'xg_against_ewm']])
+                forma_jugadores = series_jugadores(equipo_prop, matches, source=src, league=lg, season=ssn)
+                if not forma_jugadores.empty:
+                    st.dataframe(
+                        forma_jugadores[['xg_ewm', 'xg_media', 'shots_media', 'goals_media', 'rating_ewm', 'minutes_ewm']]
+                        .sort_values('xg_ewm', ascending=False).head(15).round(2)
+                    )
+ 
+            # Contraste del xG del proveedor con el modelo local ajustado a la temporada
+            with st.expander("Control del xG del proveedor"):
+                modelo_xg = modelo_xg_temporada(matches, source=src, league=lg, season=ssn)
+                tiros_p = df_p[df_p['type_name'] == 'Shot']
+                resumen_xg, calibracion = comparar_xg(tiros_p['xg'], predecir_xg_df(modelo_xg, tiros_p),
+                                                      tiros_p['result'].eq('Goal'))
+                st.caption(f"Modelo local: {modelo_xg.origen} ({modelo_xg.n_tiros} tiros de entrenamiento)")
+                c1, c2, c3 = st.columns(3)
+                c1.metric("Tiros", resumen_xg["tiros"])
+                c2.metric("Error medio (MAE)", f"{resumen_xg['mae']:.3f}")
+                c3.metric("Correlación", f"{resumen_xg['correlacion']:.2f}")
+                if not calibracion.empty:
+                    st.dataframe(calibracion.round(3), hide_index=True)
+            exportar_datos(df_p, nombre_archivo=f"{equipo_prop}_eventos.csv")
+    else:
+        st.warning("No hay datos disponibles para tu equipo. Comprueba selección de liga y equipo.")
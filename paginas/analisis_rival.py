@@ -0,0 +1,59 @@
+import streamlit as st
+
+from paginas.comun import obtener_datos_eventos_por_nombre, obtener_formaciones, render_selectores
+
+
+def render():
+    st.markdown(f'<div class="section-badge">Inteligencia Táctica</div>', unsafe_allow_html=True)
+    matches, equipo_rival, _, src, lg, ssn = render_selectores(need_rival=True, need_prop=False)
+    st.header(f"Análisis Rival: {equipo_rival}")
+    if not matches.empty and equipo_rival and equipo_rival != "(sin datos)":
+        df_r = obtener_datos_eventos_por_nombre(equipo_rival, matches, max_partidos=4, source=src, league=lg, season=ssn)
+        if df_r.empty:
+            st.warning("No se encontraron eventos reales para este equipo.")
+        else:
+            st.write(f"Eventos cargados: {df_r.shape[0]}")
+ 
+            # Formaciones de toda la temporada desde el índice (uso ponderado por minutos)
+            uso_r, cruces_r = obtener_formaciones(equipo_rival, matches, source=src, league=lg, season=ssn)
+            if not uso_r.empty:
+                formaciones = uso_r.head(5)
+                st.markdown("### 🛡️ TACTICAL FORMATIONS")
+                cols = st.columns(len(formaciones))
+                for i, fila in enumerate(formaciones.itertuples()):
+                    with cols[i]:
+                        st.markdown(f"""
+                            <div class="formation-badge">
+                                <div class="subtitle">DETECTED SET</div>
+                                <div class="title">{fila.formation}</div>
+                                <div class="subtitle">{fila.partidos} MATCHES · {fila.pct_minutos:.0f}% MIN</div>
+                            </div>
+                        """, unsafe_allow_html=True)
+                if not cruces_r.empty:
+                    with st.expander("xG por enfrentamiento de formaciones (temporada)"):
+                        st.dataframe(cruces_r.round(2), hide_index=True)
+ 
+            shots = df_r[df_r['type_name'] == 'Shot']
+            if not shots.empty and shots['xg'].notna().any():
+                xg_prom = shots.groupby('player')['xg'].mean().sort_values(ascending=False).head(12)
+                st.subheader("Top xG promedio por jugador")
+                st.markdown("<div class='card-container'>", unsafe_allow_html=True)
+                for jugador, xg_val in xg_prom.items():
+                    st.markdown(f"""
+                        <div class="module">
+                            <h3>{jugador}</h3>
+                            <div style="display:flex; align-items:flex-end; gap:8px;">
+                                <div class="stat">{xg_val:.2f}</div>
+                                <div class="label" style="margin-bottom:8px;">Expected Goals (xG)</div>
+                            </div>
+                            <div style="margin-top:12px;">
+                                <span class="token">Elite Signal</span>
+                                <span class="token">High Impact</span>
+                            </div>
+                        </div>
+                    """, unsafe_allow_html=True)
+                st.markdown("</div>", unsafe_allow_html=True)
+            else:
+                st.info("No se detectaron tiros con xG para mostrar.")
+    else:
+        st.warning("No hay partidos cargados para la liga/equipo seleccionado.")
@@ -0,0 +1,50 @@
+import streamlit as st
+
+
+def render():
+    st.markdown(f'<div class="section-badge">IA Especializada · LLaMA 3.3-70B</div>', unsafe_allow_html=True)
+    st.header("DT — Tu Asistente Táctico")
+ 
+    import os
+    from groq import Groq, AuthenticationError, BadRequestError, APIConnectionError, RateLimitError
+ 
+    if "messages_groq" not in st.session_state:
+        st.session_state.messages_groq = [
+            {"role": "system", "content": "Eres un asistente experto en táctica de fútbol llamado DT y formas parte de la plataforma Tactisense AI. Tu misión es ayudar a entrenadores y analistas a tomar decisiones tácticas dentro de Tactisense AI. Siempre responde con claridad y utiliza breves bullets cuando convenga. Solo proporciona información relacionada con tácticas, alineaciones, análisis de rivales, estrategias de juego o rendimiento de jugadores.Información sobre Tactisense AI:Es una herramienta tecnológica enfocada en el análisis táctico de fútbol mediante datos y estadísticas. Su enfoque principal es ayudar a entrenadores y analistas a tomar decisiones estratégicas basadas en datos históricos y patrones de juego. Está en una etapa temprana de desarrollo, con funcionalidades como análisis de rivales, sugerencias tácticas y visualización de alineaciones, pero representa la visión de un sistema completo que escalará para ofrecer predicciones y recomendaciones avanzadas.Como negocio, Tactisense AI apunta a ser escalable ofreciendo servicios a equipos profesionales y formativos, y expandiendo funcionalidades con IA avanzada en el futuro.Instrucciones para tus respuestas:Si te preguntan sobre Tactisense AI o tu rol, explica que eres una inteligencia artificial de Tactisense AI diseñada para apoyar en decisiones tácticas de fútbol.Si te preguntan sobre temas no relacionados con fútbol, responde de manera cortés indicando que solo puedes ayudar en tácticas de fútbol.Responde en el idioma en el que se te haga la pregunta, adaptando tus bullets y explicaciones a ese idioma."}
+        ]
+ 
+    for m in st.session_state.messages_groq:
+        if m["role"] in ("user", "assistant"):
+            with st.chat_message("user" if m["role"] == "user" else "assistant"):
+                st.markdown(m["content"])
+ 
+    prompt = st.chat_input("Escribe tu pregunta táctica (p. ej., ¿Cómo defender un 4-3-3?)")
+ 
+    if prompt:
+        with st.chat_message("user"):
+            st.markdown(prompt)
+        st.session_state.messages_groq.append({"role": "user", "content": prompt})
+ 
+        api_key = os.getenv("GROQ_API_KEY") or getattr(st.secrets, "GROQ_API_KEY", None)
+        if not api_key:
+            with st.chat_message("assistant"):
+                st.error("Falta GROQ_API_KEY en tus Secrets o variables de entorno.")
+        else:
+            client = Groq(api_key=api_key)
+            try:
+                resp = client.chat.completions.create(
+                    model="llama-3.3-70b-versatile",
+                    messages=st.session_state.messages_groq,
+                    temperature=0.2,
+                )
+                answer = resp.choices[0].message.content
+                with st.chat_message("assistant"):
+                    st.markdown(answer)
+                st.session_state.messages_groq.append({"role": "assistant", "content": answer})
+ 
+            except (AuthenticationError, RateLimitError, APIConnectionError, BadRequestError) as e:
+                with st.chat_message("assistant"):
+                    st.error(f"Error de Groq: {e}")
+            except Exception as e:
+                with st.chat_message("assistant"):
+                    st.error(f"Error inesperado: {e}")
@@ -0,0 +1,100 @@
+import streamlit as st
+import pandas as pd
+
+from tactisense.api import cara_a_cara, disciplina_equipo
+from tactisense.analisis import sugerir_formacion
+from tactisense.formaciones import NOMBRES as NOMBRES_FORMACIONES
+from tactisense.recomendador import PESOS_FORTALEZAS, PESOS_DEBILIDADES, normalizar_formacion
+from paginas.comun import obtener_resumen, obtener_tabla_temporada, render_selectores
+from paginas.tema import tema_actual
+
+
+# Fragmento: marcar fortalezas/debilidades o cambiar la formación rival solo
+# vuelve a puntuar la biblioteca, sin repetir los selectores ni las cargas.
+@st.fragment
+def recomendador(res_r):
+    st.subheader("Recomendador táctico")
+    colf, cold, colr = st.columns(3)
+    with colf:
+        fortalezas = st.multiselect("Fortalezas propias", list(PESOS_FORTALEZAS))
+    with cold:
+        debilidades = st.multiselect("Debilidades del rival", list(PESOS_DEBILIDADES))
+    with colr:
+        # Formación más usada por el rival en los partidos del resumen
+        observadas = res_r['formation'].map(normalizar_formacion).dropna() if 'formation' in res_r.columns else pd.Series(dtype=object)
+        opciones_rival = ["(desconocida)"] + list(NOMBRES_FORMACIONES)
+        observada = observadas.mode().iat[0] if not observadas.empty else "(desconocida)"
+        formacion_rival_obs = st.selectbox("Formación del rival", opciones_rival, index=opciones_rival.index(observada))
+
+    # Puntuar toda la biblioteca es una operación vectorizada: se recalcula en cada cambio
+    recs = sugerir_formacion(fortalezas, debilidades,
+                             formacion_rival=None if formacion_rival_obs == "(desconocida)" else formacion_rival_obs)
+    for f, motivo in recs:
+        st.markdown(f"- **{f}** — {motivo}")
+
+
+def render():
+    t = tema_actual()
+    st.markdown(f'<div class="section-badge">Head to Head</div>', unsafe_allow_html=True)
+    st.header("Comparativa de Equipos")
+    matches, equipo_rival, equipo_prop, src, lg, ssn = render_selectores(need_rival=True, need_prop=True)
+    if not matches.empty and equipo_prop and equipo_rival and equipo_prop != "(sin datos)" and equipo_rival != "(sin datos)":
+        # Solo se necesitan totales: /team-summary (o su agregación local)
+        res_p = obtener_resumen(equipo_prop, matches, max_partidos=4, source=src, league=lg, season=ssn)
+        res_r = obtener_resumen(equipo_rival, matches, max_partidos=4, source=src, league=lg, season=ssn)
+ 
+        # Tarjetas, faltas, entradas y pases: totales por partido ya agregados desde /player-stats
+        dis_p = disciplina_equipo(equipo_prop, matches, max_partidos=4, source=src, league=lg, season=ssn)
+        dis_r = disciplina_equipo(equipo_rival, matches, max_partidos=4, source=src, league=lg, season=ssn)
+        etiquetas = [("shots", "Tiros"), ("yellow_cards", "Tarjetas amarillas"), ("red_cards", "Tarjetas rojas"),
+                     ("fouls", "Faltas"), ("tackles", "Entradas"), ("passes", "Pases")]
+ 
+        def tarjeta_equipo(nombre, resumen, disciplina, color):
+            filas = "".join(
+                f"<p style='font-size:24px; margin:15px 0; font-family:Space Grotesk;'><strong style='color:{color};'>"
+                f"{int((resumen if col == 'shots' else disciplina)[col].sum())}</strong> "
+                f"<span style='font-size:16px; color:{t.text_secondary};'>{etiqueta}</span></p>"
+                for col, etiqueta in etiquetas
+            )
+            return f"""
+            <div style='flex:1; background:{t.surface_card}; padding:25px; border-radius:15px; color:{t.text_primary}; box-shadow: {t.card_shadow}; border-top: 4px solid {color};'>
+                <h3 style='text-align:center; padding-bottom: 6px;'>{nombre}</h3>
+                {filas}
+            </div>"""
+ 
+        color_prop  = t.accent_blue
+        color_rival = t.brand_blue
+ 
+        st.markdown(f"""
+        <div style='display:flex; gap:2rem;'>
+            {tarjeta_equipo(equipo_prop, res_p, dis_p, color_prop)}
+            {tarjeta_equipo(equipo_rival, res_r, dis_r, color_rival)}
+        </div>
+        """, unsafe_allow_html=True)
+ 
+        # Temporada completa y cara a cara: búsquedas sobre la tabla de agregados por equipo
+        filas_temp, tabla_temp = obtener_tabla_temporada(matches, src, lg, ssn)
+        metricas_temp = {
+            "matches": "Partidos", "shots_p90": "Tiros / 90'", "on_target_pct": "% a puerta",
+            "xg_p90": "xG / 90'", "xg_against_p90": "xG en contra / 90'", "goals_p90": "Goles / 90'",
+            "goals_against_p90": "Goles en contra / 90'", "xg_per_shot": "xG por tiro", "xg_diff": "Diferencia de xG",
+        }
+        st.subheader("Temporada completa")
+        comparacion = tabla_temp.reindex([equipo_prop, equipo_rival])[list(metricas_temp)].rename(columns=metricas_temp).T
+        st.dataframe(comparacion.round(2))
+        with st.expander("Cara a cara"):
+            partidos_h2h, tabla_h2h = cara_a_cara(equipo_prop, equipo_rival, filas_temp)
+            if partidos_h2h.empty:
+                st.info("Los equipos no se han enfrentado en esta temporada.")
+            else:
+                st.dataframe(tabla_h2h[["matches", "shots", "shots_on_target", "goals", "xg"]].rename(columns={
+                    "matches": "Partidos", "shots": "Tiros", "shots_on_target": "A puerta", "goals": "Goles", "xg": "xG",
+                }))
+                st.dataframe(partidos_h2h[["match_date", "goals", "goals_against", "xg", "xg_against"]].rename(columns={
+                    "match_date": "Fecha", "goals": f"Goles {equipo_prop}", "goals_against": f"Goles {equipo_rival}",
+                    "xg": f"xG {equipo_prop}", "xg_against": f"xG {equipo_rival}",
+                }), hide_index=True)
+ 
+        recomendador(res_r)
+    else:
+        st.warning("Selecciona liga y equipos válidos para comparar.")
@@ -0,0 +1,180 @@
+import pandas as pd
+import streamlit as st
+
+from tactisense.api import (
+    cargar_competiciones, obtener_partidos, extraer_equipos,
+    _obtener_datos_eventos_por_nombre, obtener_resumen_equipo, formaciones_equipo,
+    serie_equipo, unir_identidades, tabla_equipos_temporada, tabla_eventos_temporada,
+    lideres_temporada, temporada_en_almacen, COLUMNAS_RESUMEN,
+)
+from tactisense.resiliencia import ApiNoDisponible
+from paginas.tema import recurso_base64
+
+
+# =========================
+# NÚCLEO COMPARTIDO ENTRE PÁGINAS
+# =========================
+# Loader animado, envoltorios de carga y selectores de liga/equipo. Todo lo
+# que cuesta (competiciones, partidos, eventos) pasa por las caches de
+# tactisense.api, así que cada página paga solo por los datos que usa.
+def competiciones():
+    """(competiciones, nombres de liga seleccionables)."""
+    try:
+        comps = cargar_competiciones()
+    except Exception as ex:
+        # Solo llega aquí sin nada en cache: con un manifest guardado se sirve ese
+        st.error(f"Error al conectar con TacticSense API: {ex}")
+        comps = pd.DataFrame()
+    ligas = [l for l in comps['competition_name'].unique().tolist() if not l.startswith("UNDERSTAT")] if not comps.empty else ["(No disponible)"]
+    return comps, ligas or ["(No disponible)"]
+
+
+def show_ball_loader(message="Cargando..."):
+    placeholder = st.empty()
+    placeholder.markdown(f"""
+    <div style="display:flex; flex-direction:column; align-items:center; justify-content:center;
+                padding:30px 0;">
+        <video autoplay loop muted playsinline
+               style="width:180px; height:180px; object-fit:cover; border-radius:16px;"
+               >
+            <source src="data:video/mp4;base64,{recurso_base64('assets/loading_ball.mp4')}#t=5" type="video/mp4">
+        </video>
+        <span style="font-family:'Space Grotesk',sans-serif; font-size:11px; letter-spacing:0.2em;
+                     text-transform:uppercase; color:#B3B2B3; margin-top:14px;">{message}</span>
+    </div>
+    <script>
+        (function() {{
+            var videos = document.querySelectorAll('video');
+            videos.forEach(function(v) {{
+                v.currentTime = 5;
+                v.play();
+            }});
+        }})();
+    </script>
+    """, unsafe_allow_html=True)
+    return placeholder
+ 
+def obtener_datos_eventos_por_nombre(equipo_nombre, matches_df, max_partidos=3, source="bsd", league="league_19", season="296"):
+    _loader = show_ball_loader("Analizando eventos...")
+    result = _obtener_datos_eventos_por_nombre(equipo_nombre, matches_df, max_partidos, source, league, season)
+    result = unir_identidades(result, source, league, season)
+    _loader.empty()
+    return result
+
+def obtener_resumen(equipo_nombre, matches_df, max_partidos=None, source="bsd", league="league_19", season="296"):
+    _loader = show_ball_loader("Calculando totales...")
+    try:
+        result = obtener_resumen_equipo(equipo_nombre, matches_df, max_partidos, source, league, season)
+    except ApiNoDisponible as ex:
+        # Con el disyuntor abierto no hay agregación partido a partido: la página sigue sin totales
+        st.warning(str(ex))
+        result = pd.DataFrame(columns=COLUMNAS_RESUMEN)
+    finally:
+        _loader.empty()
+    return result
+
+def obtener_serie_equipo(equipo_nombre, matches_df, source="bsd", league="league_19", season="296"):
+    _loader = show_ball_loader("Calculando forma...")
+    try:
+        result = serie_equipo(equipo_nombre, matches_df, source, league, season)
+    except ApiNoDisponible as ex:
+        st.warning(str(ex))
+        result = pd.DataFrame()
+    finally:
+        _loader.empty()
+    return result
+
+def obtener_formaciones(equipo_nombre, matches_df, source="bsd", league="league_19", season="296"):
+    _loader = show_ball_loader("Indexando formaciones...")
+    result = formaciones_equipo(equipo_nombre, matches_df, source, league, season)
+    _loader.empty()
+    return result
+
+def obtener_tabla_temporada(matches_df, source="bsd", league="league_19", season="296"):
+    _loader = show_ball_loader("Agregando temporada...")
+    result = tabla_equipos_temporada(matches_df, source, league, season)
+    _loader.empty()
+    return result
+
+def obtener_eventos_temporada(matches_df, source="bsd", league="league_19", season="296"):
+    # Con la temporada ya en el almacén no hay nada que esperar: sin loader
+    if temporada_en_almacen(matches_df, source, league, season):
+        return tabla_eventos_temporada(matches_df, source, league, season)
+    _loader = show_ball_loader("Indexando temporada...")
+    result = tabla_eventos_temporada(matches_df, source, league, season)
+    _loader.empty()
+    return result
+
+def eventos_temporada_disponibles(matches_df, source="bsd", league="league_19", season="296"):
+    """True si la temporada ya está en el almacén y leerla no descarga nada."""
+    return temporada_en_almacen(matches_df, source, league, season)
+
+def obtener_lideres_temporada(matches_df, source="bsd", league="league_19", season="296"):
+    _loader = show_ball_loader("Actualizando líderes...")
+    result = lideres_temporada(matches_df, source, league, season)
+    _loader.empty()
+    return result
+
+
+def render_selectores(need_rival=True, need_prop=True):
+    """Selectores de liga y equipos; las claves de los widgets llevan el nombre de la página."""
+    comps, ligas = competiciones()
+    selected = st.session_state.get("pagina", "")
+    liga_idx = 0
+    if "liga_sel" in st.session_state and st.session_state["liga_sel"] in ligas:
+        liga_idx = ligas.index(st.session_state["liga_sel"])
+
+    ncols = 1 + int(need_rival) + int(need_prop)
+    cols = st.columns(ncols)
+
+    with cols[0]:
+        liga_sel = st.selectbox("Selecciona una liga", ligas, index=liga_idx, key=f"liga_{selected}")
+    st.session_state["liga_sel"] = liga_sel
+ 
+    comp_id = season_id = None
+    source_sel = "bsd"
+    if not comps.empty and liga_sel != "(No disponible)":
+        cond = comps['competition_name'] == liga_sel
+        try:
+            comp_id   = comps[cond].iloc[0]['competition_id']
+            season_id = comps[cond].iloc[0]['season_id']
+        except Exception:
+            comp_id = season_id = None
+        source_sel = comps[cond].iloc[0]["source"] if "source" in comps.columns else "bsd"
+        if comp_id and season_id:
+            # El loader (y su video) solo se envía si de verdad hay que esperar a la API
+            _loader = None
+            if not obtener_partidos.disponible(comp_id, season_id, source=source_sel):
+                _loader = show_ball_loader("Descargando partidos...")
+            try:
+                _matches = obtener_partidos(comp_id, season_id, source=source_sel)
+            except Exception as ex:
+                st.warning(f"No se pudieron descargar partidos: {ex}")
+                _matches = pd.DataFrame()
+            finally:
+                if _loader is not None:
+                    _loader.empty()
+        else:
+            _matches = pd.DataFrame()
+    else:
+        _matches = pd.DataFrame()
+ 
+    _matches, _equipos = extraer_equipos(_matches)
+ 
+    _rival = _prop = None
+    col_idx = 1
+ 
+    if need_rival:
+        with cols[col_idx]:
+            _rival = st.selectbox("Equipo Rival", _equipos if _equipos else ["(sin datos)"], key=f"rival_{selected}")
+        col_idx += 1
+ 
+    if need_prop:
+        with cols[col_idx]:
+            opciones = [e for e in _equipos if e != (_rival or "")]
+            default  = st.session_state.get("equipo_prop", None)
+            idx      = opciones.index(default) if default in opciones else 0
+            _prop    = st.selectbox("Tu Equipo", opciones if opciones else ["(sin datos)"], index=idx, key=f"prop_{selected}")
+        st.session_state["equipo_prop"] = _prop
+ 
+    return _matches, _rival, _prop, source_sel, comp_id, season_id
@@ -0,0 +1,114 @@
+import streamlit as st
+
+from paginas.tema import tema_actual
+
+
+def render():
+    t = tema_actual()
+    st.markdown(f"""
+    <div class="hero-container">
+        <h1 style='font-size:3.6rem; font-weight:900; line-height:1.08;
+                   margin-bottom:20px; color:{t.text_primary};
+                   font-family:Outfit,sans-serif; letter-spacing:-0.04em;'>
+            INTELIGENCIA<br>
+            <span class="gradient-text">TÁCTICA TOTAL</span>
+        </h1>
+        <p style='font-size:1.05rem; color:{t.text_secondary}; max-width:640px;
+                  line-height:1.78; margin-bottom:32px; font-family:Inter,sans-serif;'>
+            La plataforma de análisis táctico de fútbol impulsada por IA que transforma
+            datos históricos en ventaja competitiva real para entrenadores y cuerpos
+            técnicos de cualquier nivel.
+        </p>
+        <div style='display:flex; gap:8px; flex-wrap:wrap;'>
+            <span class="token">⚽ Liga MX</span>
+            <span class="token">📊 BSD Data</span>
+            <span class="token">🤖 IA Táctica LLM</span>
+            <span class="token">📡 Apertura 2025 · Clausura 2026</span>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+ 
+    st.markdown("""
+    <div style='display:grid; grid-template-columns:repeat(4,1fr); gap:14px; margin-bottom:32px;'>
+        <div class="metric-card">
+            <div class="metric-number">2</div>
+            <div class="metric-label">Temporadas Disponibles</div>
+        </div>
+        <div class="metric-card">
+            <div class="metric-number">340+</div>
+            <div class="metric-label">Partidos Analizados</div>
+        </div>
+        <div class="metric-card">
+            <div class="metric-number">18</div>
+            <div class="metric-label">Equipos Liga MX</div>
+        </div>
+        <div class="metric-card">
+            <div class="metric-number">9</div>
+            <div class="metric-label">Módulos Tácticos</div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+ 
+    st.markdown('<div class="glow-divider"></div>', unsafe_allow_html=True)
+ 
+    st.markdown(f'<div class="section-badge">Funcionalidades</div>', unsafe_allow_html=True)
+    st.markdown(f"""
+    <div style='display:grid; grid-template-columns:repeat(3,1fr); gap:14px; margin-bottom:36px;'>
+        <div class="feature-card">
+            <span class="feature-icon">🛡️</span>
+            <div class="feature-title">Análisis de Rival</div>
+            <div class="feature-desc">xG por jugador, formaciones detectadas y patrones de presión del adversario con datos reales de partidos.</div>
+        </div>
+        <div class="feature-card">
+            <span class="feature-icon">🔥</span>
+            <div class="feature-title">Mapas de Calor</div>
+            <div class="feature-desc">Visualización KDE de tiros y zonas de peligro sobre cancha oficial StatsBomb. Profundidad táctica visual.</div>
+        </div>
+        <div class="feature-card">
+            <span class="feature-icon">🤖</span>
+            <div class="feature-title">DT — Chat Táctico IA</div>
+            <div class="feature-desc">Consulta formaciones, estrategias y análisis con nuestra IA especializada, potenciada por LLaMA 3.3-70B.</div>
+        </div>
+        <div class="feature-card">
+            <span class="feature-icon">✏️</span>
+            <div class="feature-title">Pizarra Táctica</div>
+            <div class="feature-desc">Canvas interactivo para posicionar jugadores, trazar rutas de desmarque y diseñar jugadas de estrategia.</div>
+        </div>
+        <div class="feature-card">
+            <span class="feature-icon">📊</span>
+            <div class="feature-title">Simulador xG</div>
+            <div class="feature-desc">Probabilidad de victoria calculada con Expected Goals históricos acumulados. Decisiones respaldadas por datos.</div>
+        </div>
+        <div class="feature-card">
+            <span class="feature-icon">⚡</span>
+            <div class="feature-title">Recomendador Táctico</div>
+            <div class="feature-desc">Sugerencias de formación adaptadas a las fortalezas propias y las debilidades detectadas en el rival.</div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+ 
+    st.markdown(f"""
+    <div class="glow-divider"></div>
+    <div class="investor-block">
+        <div class="section-badge" style="margin-bottom:16px;">Visión del Producto</div>
+        <h3 style='color:{t.text_primary}; font-size:1.45rem; margin-bottom:14px;
+                   font-family:Outfit,sans-serif; font-weight:800; letter-spacing:-0.02em;'>
+            El futuro del análisis táctico de fútbol
+        </h3>
+        <p style='color:{t.text_secondary}; font-size:0.93rem; line-height:1.82;
+                  max-width:800px; font-family:Inter,sans-serif;'>
+            Tactisense AI está construida sobre datos de calidad profesional de Liga MX (Apertura 2025 · Clausura 2026)
+            provistos por BSD, e inteligencia artificial. Tactisense AI demuestra la viabilidad
+            técnica de una plataforma <strong style="color:{t.text_primary};">SaaS escalable</strong> que puede servir
+            desde academias juveniles hasta equipos de primer nivel, con un modelo de negocio B2B replicable
+            a escala global.
+        </p>
+        <div style='display:flex; gap:10px; margin-top:22px; flex-wrap:wrap;'>
+            <span class="token">B2B SaaS</span>
+            <span class="token">Escalable</span>
+            <span class="token">Mercado Global</span>
+            <span class="token">IA + Datos</span>
+            <span class="token">Ventaja Competitiva</span>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
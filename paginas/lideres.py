@@ -0,0 +1,60 @@
+import math
+
+import streamlit as st
+
+from tactisense.lideres import METRICAS_LIDERES
+from paginas.comun import obtener_lideres_temporada, render_selectores
+
+COLUMNAS_TABLA = {
+    "player": "Jugador", "team_name": "Equipo", "partidos": "Partidos", "minutos": "Minutos",
+    "tiros": "Tiros", "a_puerta": "A puerta", "goles": "Goles", "xg": "xG",
+    "xg_por_tiro": "xG / tiro", "goles_menos_xg": "Goles - xG", "rating": "Rating",
+}
+
+
+# Métrica, filtros y página forman un fragmento: la vista ya está materializada,
+# así que cada cambio solo ordena (una vez por combinación) y rebana la página.
+@st.fragment
+def tabla_lideres(vista, identidades):
+    c_met, c_orden, c_equipo = st.columns([2, 1, 2])
+    with c_met:
+        metrica = st.selectbox("Métrica", list(METRICAS_LIDERES), format_func=METRICAS_LIDERES.get)
+    with c_orden:
+        descendente = st.radio("Orden", ["Mayor a menor", "Menor a mayor"], horizontal=True) == "Mayor a menor"
+    with c_equipo:
+        equipos = sorted(vista.tabla(identidades)["team_name"].dropna().unique().tolist())
+        equipo = st.selectbox("Equipo", ["(Todos)"] + equipos)
+    c_tiros, c_partidos, c_filas = st.columns(3)
+    with c_tiros:
+        min_tiros = st.number_input("Tiros mínimos", 0, 200, 10 if metrica == "xg_por_tiro" else 0, step=5)
+    with c_partidos:
+        min_partidos = st.number_input("Partidos mínimos", 0, 60, 0)
+    with c_filas:
+        por_pagina = st.selectbox("Filas por página", [25, 50, 100])
+
+    filtros = dict(metrica=metrica, descendente=descendente, min_tiros=min_tiros, min_partidos=min_partidos,
+                   equipo=None if equipo == "(Todos)" else equipo, identidades=identidades)
+    _, total = vista.pagina(pagina=1, por_pagina=0, **filtros)
+    if total == 0:
+        st.info("Ningún jugador cumple los filtros.")
+        return
+    paginas = math.ceil(total / por_pagina)
+    pagina = st.number_input(f"Página (de {paginas})", 1, paginas, 1, key=f"lideres_pagina_{paginas}")
+    filas, _ = vista.pagina(pagina=pagina, por_pagina=por_pagina, **filtros)
+    inicio = (pagina - 1) * por_pagina
+    st.caption(f"Jugadores {inicio + 1}–{inicio + len(filas)} de {total}")
+    st.dataframe(filas[list(COLUMNAS_TABLA)].rename(columns=COLUMNAS_TABLA).round(3), hide_index=True)
+
+
+def render():
+    st.markdown(f'<div class="section-badge">Liga</div>', unsafe_allow_html=True)
+    st.header("Líderes de la Temporada")
+    matches, _, _, src, lg, ssn = render_selectores(need_rival=False, need_prop=False)
+    if matches.empty:
+        st.warning("Selecciona una liga para ver sus líderes.")
+        return
+    vista, identidades = obtener_lideres_temporada(matches, src, lg, ssn)
+    if vista.version == 0:
+        st.info("Todavía no hay partidos terminados en la temporada.")
+        return
+    tabla_lideres(vista, identidades)
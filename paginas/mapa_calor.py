@@ -0,0 +1,33 @@
+import streamlit as st
+import matplotlib.pyplot as plt
+
+from tactisense.visualizaciones import graficar_mapa_calor
+from tactisense.instrumentacion import medir
+from paginas.comun import obtener_datos_eventos_por_nombre, render_selectores
+from paginas.tema import tema_actual
+
+
+def render():
+    t = tema_actual()
+    st.markdown(f'<div class="section-badge">Análisis Espacial</div>', unsafe_allow_html=True)
+    st.header("Mapa de Calor de Tiros")
+    matches, _, equipo_prop, src, lg, ssn = render_selectores(need_rival=False, need_prop=True)
+    if not matches.empty and equipo_prop and equipo_prop != "(sin datos)":
+        df_p = obtener_datos_eventos_por_nombre(equipo_prop, matches, max_partidos=6, source=src, league=lg, season=ssn)
+        if df_p.empty:
+            st.warning("No se encontraron eventos para generar mapa de calor.")
+        else:
+            shots = df_p[df_p['type_name'] == 'Shot']
+            # CAMBIO: la API retorna x e y como columnas directas, no como lista location
+            if 'x' in shots.columns and 'y' in shots.columns and shots['x'].notna().any():
+                fig = graficar_mapa_calor(shots, pitch_color=t.bg_color, line_color=t.text_secondary)
+                if fig is not None:
+                    with medir("st.pyplot"):
+                        st.pyplot(fig)
+                    plt.close(fig)
+                else:
+                    st.info("No hay datos suficientes para generar el mapa de calor.")
+            else:
+                st.info("No hay tiros con coordenadas de localización.")
+    else:
+        st.warning("Selecciona liga/equipo válido.")
@@ -0,0 +1,61 @@
+import streamlit as st
+from streamlit_drawable_canvas import st_canvas
+
+from tactisense.formaciones import NOMBRES as NOMBRES_FORMACIONES
+from tactisense.pizarra import build_initial_board, rasterizar_tablero, tablero_desde_fabric
+
+
+# Controles del trazo, formaciones y canvas en un fragmento: mover el slider o
+# cambiar de color no vuelve a ejecutar el resto de la app.
+@st.fragment
+def controles_y_tablero():
+    fondo = st.selectbox("Selecciona el fondo de la pizarra:", ["Pizarra táctica (negro)", "Pizarra de campo (verde)"])
+ 
+    st.markdown("### Configuración del trazo")
+    stroke_color = st.color_picker("Color del trazo", "#FF0000")
+    stroke_width = st.slider("Grosor del trazo", 1, 10, 3)
+    drawing_mode = st.selectbox("Modo de dibujo", ["freedraw", "line", "rect", "circle", "transform"])
+ 
+    col_form, col_rival = st.columns(2)
+    with col_form:
+        formacion_inicial = st.selectbox("Formación inicial", ["(sin fichas)"] + list(NOMBRES_FORMACIONES))
+    with col_rival:
+        formacion_rival = st.selectbox("Formación rival", NOMBRES_FORMACIONES, index=NOMBRES_FORMACIONES.index("4-4-2"))
+ 
+    if fondo == "Pizarra táctica (negro)":
+        pitch_bg = "black"
+    else:
+        pitch_bg = "#007A33"
+ 
+    canvas_result = st_canvas(
+        fill_color="rgba(0,0,0,0)",
+        stroke_width=stroke_width,
+        stroke_color=stroke_color,
+        background_color=pitch_bg,
+        height=600,
+        width=900,
+        drawing_mode=drawing_mode,
+        initial_drawing=build_initial_board(900, 600, formacion_inicial, opponent_formation=formacion_rival)
+                        if formacion_inicial != "(sin fichas)" else None,
+        key="canvas_pizarra",
+    )
+ 
+    # Modelo compacto del tablero: el PNG se rasteriza solo al descargar (cache por hash)
+    if canvas_result.json_data is not None:
+        tablero = tablero_desde_fabric(canvas_result.json_data, 900, 600, pitch_bg)
+        st.download_button(
+            "Descargar imagen (PNG)",
+            data=lambda: rasterizar_tablero(tablero),
+            file_name="pizarra.png",
+            mime="image/png",
+            on_click="ignore",
+        )
+ 
+    st.caption("Tip: Usa 'transform' para arrastrar fichas. Cambia a 'line' o 'freedraw' para rutas de desmarque o flechas.")
+
+
+def render():
+    st.markdown(f'<div class="section-badge">Diseño Táctico</div>', unsafe_allow_html=True)
+    st.header("Pizarra Táctica Interactiva")
+ 
+    controles_y_tablero()
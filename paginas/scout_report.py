@@ -0,0 +1,157 @@
+import streamlit as st
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from tactisense.analisis import calcular_metricas_jugador
+from tactisense.consultas import ranking_tiradores
+from tactisense.informes import FORMATOS_INFORME, generar_informe, metricas_equipo
+from tactisense.visualizaciones import graficar_radar
+from tactisense.instrumentacion import medir
+from paginas.comun import (
+    eventos_temporada_disponibles, obtener_datos_eventos_por_nombre, obtener_eventos_temporada, render_selectores,
+)
+
+ORDENES_RANKING = {"xG por tiro": "xg_por_tiro", "xG total": "xg", "Goles": "goles", "Goles - xG": "goles_menos_xg"}
+
+
+# El selector de jugador, el radar y las métricas forman un fragmento: cambiar
+# de jugador solo vuelve a ejecutar este panel, no la página ni la carga de eventos.
+@st.fragment
+def panel_jugador(df_scout, jugadores_disp):
+    col_sel, col_info = st.columns([1, 2])
+    with col_sel:
+        jugador_sel = st.selectbox("Selecciona un jugador", jugadores_disp)
+    with col_info:
+        stats_sel = df_scout[(df_scout['type_name'] == 'PlayerStat') & (df_scout['player'] == jugador_sel)]
+        if not stats_sel.empty:
+            c1, c2, c3 = st.columns(3)
+            c1.metric("Rating medio", f"{pd.to_numeric(stats_sel['rating'], errors='coerce').mean():.2f}")
+            c2.metric("Pases", int(pd.to_numeric(stats_sel['passes'], errors='coerce').sum()))
+            c3.metric("Entradas", int(pd.to_numeric(stats_sel['tackles'], errors='coerce').sum()))
+
+    if jugador_sel:
+        metricas = calcular_metricas_jugador(df_scout, jugador_sel)
+
+        col_radar, col_stats = st.columns([1, 1])
+
+        with col_radar:
+            fig = graficar_radar(metricas, jugador_sel)
+            with medir("st.pyplot"):
+                st.pyplot(fig)
+            plt.close(fig)
+
+        with col_stats:
+            st.markdown(f"""
+            <div style='padding:8px 0 20px;'>
+                <div class='section-badge'>Métricas del jugador</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+            for metrica, valor in metricas.items():
+                color_bar = "#005595" if valor >= 60 else "#003B65" if valor >= 35 else "#1a2a3a"
+                st.markdown(f"""
+                <div style='margin-bottom:14px;'>
+                    <div style='display:flex; justify-content:space-between; margin-bottom:5px;'>
+                        <span style='font-family:Space Grotesk,sans-serif; font-size:12px;
+                                     font-weight:600; color:#B3B2B3; letter-spacing:0.08em;
+                                     text-transform:uppercase;'>{metrica}</span>
+                        <span style='font-family:Outfit,sans-serif; font-size:15px;
+                                     font-weight:900; color:#FFFFFF;'>{valor:.0f}<span
+                              style='font-size:10px; color:#B3B2B3;'>/100</span></span>
+                    </div>
+                    <div style='height:5px; background:rgba(0,85,149,0.15);
+                                border-radius:3px; overflow:hidden;'>
+                        <div style='width:{valor}%; height:100%; background:{color_bar};
+                                    border-radius:3px; transition:width 0.5s ease;'></div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+            percentil_global = round(sum(metricas.values()) / len(metricas), 1)
+            nivel = "Élite" if percentil_global >= 70 else "Alto" if percentil_global >= 45 else "Desarrollo"
+            color_nivel = "#2a9d8f" if percentil_global >= 70 else "#005595" if percentil_global >= 45 else "#B3B2B3"
+
+            st.markdown(f"""
+            <div class='module' style='margin-top:20px; text-align:center;'>
+                <div style='font-family:Space Grotesk,sans-serif; font-size:10px;
+                            letter-spacing:0.2em; text-transform:uppercase;
+                            color:#B3B2B3; margin-bottom:8px;'>Rendimiento Global</div>
+                <div style='font-family:Outfit,sans-serif; font-size:3rem;
+                            font-weight:900; color:{color_nivel};
+                            line-height:1; letter-spacing:-0.04em;'>{percentil_global:.0f}</div>
+                <div style='font-family:Space Grotesk,sans-serif; font-size:12px;
+                            color:{color_nivel}; font-weight:700;
+                            margin-top:6px;'>{nivel}</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+
+# Informe del plantel: el radar de cada jugador del equipo en un PDF o un ZIP de
+# PNGs. Se dibuja en el pool de procesos solo al pulsar descargar.
+@st.fragment
+def informe_plantel(df_scout, equipo):
+    metricas = metricas_equipo(df_scout, equipo)
+    if metricas.empty:
+        return
+    col_formato, col_boton = st.columns([1, 2])
+    with col_formato:
+        formato = st.selectbox("Formato del informe", list(FORMATOS_INFORME))
+    extension, mime = FORMATOS_INFORME[formato]
+    with col_boton:
+        st.download_button(
+            label=f"Descargar radares del plantel ({len(metricas)} jugadores)",
+            data=lambda: open(generar_informe(metricas, formato), "rb"),
+            file_name=f"scout_{equipo}{extension}",
+            mime=mime,
+            on_click="ignore",
+        )
+
+
+# Ranking de toda la liga: consulta Arrow sobre la temporada ya indexada; cambiar
+# el umbral o el orden solo repite la consulta dentro del fragmento. Si la
+# temporada aún no está en el almacén, se descarga solo cuando se pide.
+@st.fragment
+def ranking_liga(matches, src, lg, ssn):
+    st.subheader("Ranking de la liga — tiradores")
+    if not (st.session_state.get("ranking_liga_cargado") or eventos_temporada_disponibles(matches, src, lg, ssn)):
+        st.caption("El ranking recorre todos los partidos de la temporada; la primera vez hay que descargarlos.")
+        if not st.button("Cargar ranking de la liga"):
+            return
+        st.session_state["ranking_liga_cargado"] = True
+    tabla_temporada = obtener_eventos_temporada(matches, src, lg, ssn)
+    col_min, col_orden = st.columns(2)
+    with col_min:
+        min_tiros = st.slider("Tiros mínimos en la temporada", 5, 60, 20, step=5)
+    with col_orden:
+        orden = st.selectbox("Ordenar por", list(ORDENES_RANKING))
+    ranking = ranking_tiradores(tabla_temporada, min_tiros=min_tiros, top=20, metrica=ORDENES_RANKING[orden])
+    if ranking.empty:
+        st.info("Ningún jugador llega a ese número de tiros en la temporada.")
+        return
+    st.dataframe(ranking[["player", "team_name", "tiros", "goles", "xg", "xg_por_tiro", "goles_menos_xg"]].rename(columns={
+        "player": "Jugador", "team_name": "Equipo", "tiros": "Tiros", "goles": "Goles", "xg": "xG",
+        "xg_por_tiro": "xG / tiro", "goles_menos_xg": "Goles - xG",
+    }).round(3), hide_index=True)
+
+
+def render():
+    st.markdown(f'<div class="section-badge">Análisis Individual</div>', unsafe_allow_html=True)
+    st.header("Scout Report — Radar de Jugador")
+    matches, _, equipo_prop, src, lg, ssn = render_selectores(need_rival=False, need_prop=True)
+    if not matches.empty and equipo_prop and equipo_prop != "(sin datos)":
+        df_scout = obtener_datos_eventos_por_nombre(equipo_prop, matches, max_partidos=10, source=src, league=lg, season=ssn)
+ 
+        if df_scout.empty:
+            st.warning("No se encontraron eventos para generar el Scout Report.")
+        else:
+            # CAMBIO: player en /shots es nombre (string), en /player-stats es null para bsd.
+            # Las PlayerStat con identidad v1 ↔ v2 resuelta ya llevan el nombre; las demás
+            # siguen siendo ids numéricos y se omiten
+            jugadores_disp = sorted([j for j in df_scout['player'].dropna().unique().tolist() if not str(j).isdigit()])
+ 
+            panel_jugador(df_scout, jugadores_disp)
+            informe_plantel(df_scout, equipo_prop)
+
+        ranking_liga(matches, src, lg, ssn)
+    else:
+        st.warning("Selecciona una liga y tu equipo para generar el Scout Report.")
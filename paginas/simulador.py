@@ -0,0 +1,45 @@
+import streamlit as st
+import pandas as pd
+
+from paginas.comun import obtener_serie_equipo, render_selectores
+from paginas.tema import tema_actual
+
+
+def render():
+    t = tema_actual()
+    st.markdown(f'<div class="section-badge">Simulation Engine v1.0</div>', unsafe_allow_html=True)
+    st.header("Simulador de Probabilidad")
+    matches, equipo_rival, equipo_prop, src, lg, ssn = render_selectores(need_rival=True, need_prop=True)
+    # Forma reciente (EWMA por partido): xG generado por cada uno y concedido por el otro
+    serie_p = obtener_serie_equipo(equipo_prop, matches, source=src, league=lg, season=ssn) if not matches.empty else pd.DataFrame()
+    serie_r = obtener_serie_equipo(equipo_rival, matches, source=src, league=lg, season=ssn) if not matches.empty else pd.DataFrame()
+    forma_p = serie_p.iloc[-1] if not serie_p.empty else None
+    forma_r = serie_r.iloc[-1] if not serie_r.empty else None
+    xg_p = (forma_p['xg_ewm'] + forma_r['xg_against_ewm']) / 2 if forma_p is not None and forma_r is not None else 0
+    xg_r = (forma_r['xg_ewm'] + forma_p['xg_against_ewm']) / 2 if forma_p is not None and forma_r is not None else 0
+    total = xg_p + xg_r
+    prob = round(100 * xg_p / total, 1) if total > 0 else 50
+ 
+    if prob < 35:
+        color = "#e63946"
+    elif prob <= 65:
+        color = "#f4a261"
+    else:
+        color = "#2a9d8f"
+ 
+    st.markdown(f"""
+        <div style="margin-top:60px; border-left: 2px solid {t.brand_blue}; padding-left: 40px;">
+            <div class="hero-label">Tactisense Simulation Engine v.1.0</div>
+            <div class="hero-metric">{prob}<span style="font-size:40px; vertical-align:top; margin-left:10px;">%</span></div>
+            <div style="font-family:'Space Grotesk'; font-size:32px; color:{t.text_primary}; font-weight:300;">
+                PROBABILIDAD DE VICTORIA PARA <span style="font-weight:700; color:{t.accent_blue};">{equipo_prop.upper()}</span>
+            </div>
+            <div style="background:{t.surface_card}; width:100%; height:4px; margin-top:30px; position:relative; overflow:hidden;">
+                <div style="background:{t.accent_blue}; width:{prob}%; height:100%; box-shadow: 0 0 15px {t.accent_blue};"></div>
+            </div>
+            <div style="display:flex; justify-content:space-between; margin-top:12px;">
+                <span class="label">Expected xG (form): {xg_p:.2f}</span>
+                <span class="label">Rival Risk: {xg_r:.2f}</span>
+            </div>
+        </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,25 @@
+import streamlit as st
+import pandas as pd
+
+from tactisense.exportacion import exportar_datos
+from tactisense.modelo_xg import MODELO_XG_BASE, comparar_xg, predecir_xg_df
+
+
+def render():
+    st.markdown(f'<div class="section-badge">Datos Propios</div>', unsafe_allow_html=True)
+    st.header("Cargar CSV Propio")
+    archivo = st.file_uploader("Selecciona CSV con eventos (formato StatsBomb recomendado)", type=["csv"])
+    if archivo:
+        df_csv = pd.read_csv(archivo)
+        # Tiros con coordenadas: se puntúan con el modelo xG local si el CSV no trae xG
+        if {'x', 'y'} <= set(df_csv.columns):
+            es_tiro = df_csv['type_name'].eq('Shot') if 'type_name' in df_csv.columns else pd.Series(True, index=df_csv.index)
+            xg_local = predecir_xg_df(MODELO_XG_BASE, df_csv[es_tiro])
+            if 'xg' not in df_csv.columns or df_csv.loc[es_tiro, 'xg'].isna().all():
+                df_csv.loc[es_tiro, 'xg'] = xg_local
+                st.info(f"xG calculado con el modelo local (distancia/ángulo) para {int(es_tiro.sum())} tiros.")
+            else:
+                resumen_xg, _ = comparar_xg(df_csv.loc[es_tiro, 'xg'], xg_local)
+                st.caption(f"xG del archivo vs modelo local: MAE {resumen_xg['mae']:.3f} · correlación {resumen_xg['correlacion']:.2f}")
+        st.dataframe(df_csv.head())
+        exportar_datos(df_csv, nombre_archivo="datos_subidos.csv")
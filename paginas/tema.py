@@ -0,0 +1,488 @@
+import base64
+import io
+from typing import NamedTuple
+
+import streamlit as st
+from PIL import Image
+
+from tactisense.instrumentacion import cache_instrumentado
+
+
+# =========================
+# TEMA VISUAL (TACTISENSE OBSIDIAN)
+# =========================
+# Tokens del design system por tema. El CSS que se arma con ellos no cambia
+# entre reruns: se genera una vez por tema y queda en cache. Los recursos
+# binarios (logo, favicon, video del loader) se leen, reescalan y codifican
+# una sola vez por proceso y se comparten entre sesiones.
+class Tema(NamedTuple):
+    bg_color: str
+    surface_base: str
+    surface_card: str
+    surface_overlay: str
+    text_primary: str
+    text_secondary: str
+    brand_blue: str
+    accent_blue: str
+    dark_navy: str
+    ghost_border: str
+    card_shadow: str
+    logo_filter: str
+    logo_bg: str
+    logo_padding: str
+
+
+TEMA_POR_DEFECTO = "TACTICAL DARK"
+TEMAS = {
+    "TACTICAL DARK": Tema(
+        bg_color="#040404",
+        surface_base="#080f1a",
+        surface_card="#0d1f35",
+        surface_overlay="#143252",
+        text_primary="#FFFFFF",
+        text_secondary="#B3B2B3",
+        brand_blue="#005595",
+        accent_blue="#3a8fd4",
+        dark_navy="#003B65",
+        ghost_border="rgba(0, 85, 149, 0.22)",
+        card_shadow="0 20px 48px rgba(0,0,0,0.55), 0 0 0 1px rgba(0,85,149,0.12)",
+        logo_filter="none",
+        logo_bg="transparent",
+        logo_padding="0",
+    ),
+    "TACTICAL LIGHT": Tema(
+        bg_color="#F8FAFC",
+        surface_base="#EEF2F7",
+        surface_card="#FFFFFF",
+        surface_overlay="#DDE8F4",
+        text_primary="#040404",
+        text_secondary="#535354",
+        brand_blue="#005595",
+        accent_blue="#003B65",
+        dark_navy="#003B65",
+        ghost_border="rgba(0, 85, 149, 0.15)",
+        card_shadow="0 8px 32px rgba(0,85,149,0.10)",
+        logo_filter="none",
+        logo_bg="transparent",
+        logo_padding="0",
+    ),
+}
+
+
+def nombre_tema():
+    if "theme" not in st.session_state:
+        st.session_state.theme = TEMA_POR_DEFECTO
+    return st.session_state.theme
+
+
+def tema_actual():
+    """Tokens del tema de la sesión (cualquier nombre distinto del oscuro usa el claro)."""
+    return TEMAS.get(nombre_tema(), TEMAS["TACTICAL LIGHT"])
+
+
+@cache_instrumentado(show_spinner=False)
+def css_tema(nombre):
+    """Hoja de estilos completa del tema `nombre`."""
+    (bg_color, surface_base, surface_card, surface_overlay, text_primary, text_secondary, brand_blue,
+     accent_blue, dark_navy, ghost_border, card_shadow, logo_filter, logo_bg, logo_padding) = TEMAS.get(nombre, TEMAS["TACTICAL LIGHT"])
+    return f"""
+    <style>
+    .stApp {{
+        background: {bg_color};
+        font-family: 'Inter', sans-serif;
+    }}
+    .block-container {{
+        padding: 2.5rem 3rem 4rem !important;
+        max-width: 1400px !important;
+    }}
+    ::-webkit-scrollbar {{ width: 5px; height: 5px; }}
+    ::-webkit-scrollbar-track {{ background: {bg_color}; }}
+    ::-webkit-scrollbar-thumb {{ background: {brand_blue}; border-radius: 4px; }}
+    ::-webkit-scrollbar-thumb:hover {{ background: {accent_blue}; }}
+    [data-testid="stSidebar"] {{
+        background: linear-gradient(175deg, {dark_navy} 0%, {bg_color} 100%) !important;
+        border-right: 1px solid {ghost_border} !important;
+    }}
+    [data-testid="stSidebar"] .block-container {{
+        padding: 1.5rem 0.75rem !important;
+    }}
+    h1, h2, h3, h4 {{
+        font-family: 'Outfit', sans-serif !important;
+        color: {text_primary} !important;
+        font-weight: 800 !important;
+        letter-spacing: -0.03em !important;
+        line-height: 1.15 !important;
+    }}
+    h1 {{ font-size: 2.8rem !important; }}
+    h2 {{ font-size: 2rem !important; }}
+    h3 {{ font-size: 1.3rem !important; font-weight: 700 !important; }}
+    p, li {{ color: {text_primary}; font-family: 'Inter', sans-serif; }}
+    .hero-container {{
+        background: linear-gradient(140deg, rgba(0,59,101,0.92) 0%, rgba(0,85,149,0.28) 55%, rgba(4,4,4,0.96) 100%);
+        border: 1px solid {ghost_border};
+        border-radius: 20px;
+        padding: 56px 52px;
+        margin-bottom: 28px;
+        position: relative;
+        overflow: hidden;
+    }}
+    .hero-container::before {{
+        content: '';
+        position: absolute;
+        top: -80px; right: -60px;
+        width: 420px; height: 420px;
+        background: radial-gradient(circle, rgba(0,85,149,0.28) 0%, transparent 65%);
+        pointer-events: none;
+    }}
+    .hero-container::after {{
+        content: '';
+        position: absolute;
+        bottom: -60px; left: -40px;
+        width: 260px; height: 260px;
+        background: radial-gradient(circle, rgba(0,59,101,0.18) 0%, transparent 70%);
+        pointer-events: none;
+    }}
+    .gradient-text {{
+        background: linear-gradient(125deg, {brand_blue} 0%, {text_secondary} 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+    }}
+    .section-badge {{
+        display: inline-flex;
+        align-items: center;
+        gap: 6px;
+        background: linear-gradient(135deg, {brand_blue} 0%, {dark_navy} 100%);
+        color: #fff;
+        font-size: 10px;
+        font-weight: 700;
+        letter-spacing: 0.22em;
+        text-transform: uppercase;
+        padding: 5px 16px;
+        border-radius: 100px;
+        margin-bottom: 18px;
+        font-family: 'Space Grotesk', sans-serif;
+    }}
+    .metric-card {{
+        background: linear-gradient(145deg, {surface_card} 0%, {surface_base} 100%);
+        border: 1px solid {ghost_border};
+        border-radius: 16px;
+        padding: 28px 20px;
+        text-align: center;
+        transition: transform 0.32s cubic-bezier(0.34,1.56,0.64,1), border-color 0.25s ease, box-shadow 0.25s ease;
+        position: relative;
+        overflow: hidden;
+    }}
+    .metric-card::before {{
+        content: '';
+        position: absolute;
+        top: 0; left: 0; right: 0;
+        height: 2px;
+        background: linear-gradient(90deg, {brand_blue}, {accent_blue});
+    }}
+    .metric-card:hover {{
+        transform: translateY(-7px);
+        border-color: {brand_blue};
+        box-shadow: {card_shadow};
+    }}
+    .metric-number {{
+        font-family: 'Outfit', sans-serif;
+        font-size: 3rem;
+        font-weight: 900;
+        color: {brand_blue};
+        line-height: 1;
+        letter-spacing: -0.04em;
+    }}
+    .metric-label {{
+        color: {text_secondary};
+        font-size: 10px;
+        letter-spacing: 0.18em;
+        text-transform: uppercase;
+        margin-top: 10px;
+        font-family: 'Space Grotesk', sans-serif;
+        font-weight: 600;
+    }}
+    .feature-card {{
+        background: {surface_card};
+        border: 1px solid {ghost_border};
+        border-radius: 14px;
+        padding: 28px 24px;
+        transition: all 0.3s cubic-bezier(0.34,1.56,0.64,1);
+        position: relative;
+    }}
+    .feature-card:hover {{
+        background: {surface_overlay};
+        border-color: {brand_blue};
+        transform: translateY(-5px);
+        box-shadow: {card_shadow};
+    }}
+    .feature-icon {{ font-size: 2rem; margin-bottom: 12px; display: block; }}
+    .feature-title {{
+        font-family: 'Outfit', sans-serif !important;
+        font-size: 1.05rem !important;
+        font-weight: 700 !important;
+        color: {text_primary} !important;
+        margin-bottom: 8px !important;
+        letter-spacing: -0.01em !important;
+    }}
+    .feature-desc {{
+        color: {text_secondary};
+        font-size: 0.875rem;
+        line-height: 1.65;
+        font-family: 'Inter', sans-serif;
+    }}
+    .module {{
+        background: {surface_card};
+        border: 1px solid {ghost_border};
+        border-left: 3px solid transparent;
+        border-radius: 12px;
+        padding: 26px 24px;
+        margin-bottom: 14px;
+        transition: all 0.28s ease;
+    }}
+    .module:hover {{
+        border-left-color: {brand_blue};
+        transform: translateX(5px);
+        background: {surface_overlay};
+        box-shadow: {card_shadow};
+    }}
+    .stat {{
+        font-family: 'Outfit', sans-serif;
+        font-size: 2.8rem;
+        font-weight: 900;
+        color: {brand_blue};
+        line-height: 1;
+        letter-spacing: -0.04em;
+    }}
+    .token {{
+        display: inline-flex;
+        align-items: center;
+        padding: 5px 13px;
+        background: rgba(0,85,149,0.12);
+        color: {text_secondary};
+        border: 1px solid {ghost_border};
+        font-size: 10px;
+        text-transform: uppercase;
+        letter-spacing: 0.15em;
+        border-radius: 100px;
+        margin-right: 8px;
+        margin-bottom: 6px;
+        font-weight: 600;
+        font-family: 'Space Grotesk', sans-serif;
+    }}
+    .glow-divider {{
+        height: 1px;
+        background: linear-gradient(90deg, transparent 0%, {brand_blue} 50%, transparent 100%);
+        margin: 36px 0;
+        opacity: 0.45;
+    }}
+    .hero-metric {{
+        font-family: 'Outfit', sans-serif;
+        font-size: 5.5rem;
+        font-weight: 900;
+        color: {brand_blue};
+        line-height: 0.9;
+        letter-spacing: -0.05em;
+    }}
+    .hero-label {{
+        font-family: 'Space Grotesk', sans-serif;
+        font-size: 10px;
+        text-transform: uppercase;
+        letter-spacing: 0.3em;
+        color: {text_secondary};
+        font-weight: 700;
+    }}
+    .stButton > button {{
+        background: linear-gradient(135deg, {brand_blue} 0%, {dark_navy} 100%) !important;
+        color: #FFFFFF !important;
+        border: none !important;
+        border-radius: 8px !important;
+        font-family: 'Space Grotesk', sans-serif !important;
+        font-weight: 600 !important;
+        padding: 11px 28px !important;
+        letter-spacing: 0.08em !important;
+        font-size: 12px !important;
+        text-transform: uppercase !important;
+        transition: all 0.25s ease !important;
+        box-shadow: 0 4px 18px rgba(0,85,149,0.38) !important;
+    }}
+    .stButton > button:hover {{
+        transform: translateY(-2px) !important;
+        box-shadow: 0 8px 28px rgba(0,85,149,0.55) !important;
+    }}
+    .stSelectbox [data-baseweb="select"] > div {{
+        background: {surface_card} !important;
+        border: 1px solid {ghost_border} !important;
+        border-radius: 8px !important;
+        color: {text_primary} !important;
+    }}
+    .stSelectbox label, .stSlider label,
+    .stColorPicker label, .stFileUploader label,
+    .stMultiSelect label {{
+        color: {text_secondary} !important;
+        font-family: 'Space Grotesk', sans-serif !important;
+        font-size: 10px !important;
+        letter-spacing: 0.12em !important;
+        text-transform: uppercase !important;
+        font-weight: 600 !important;
+    }}
+    .formation-badge {{
+        background: {surface_card};
+        border: 1px solid {ghost_border};
+        border-top: 2px solid {brand_blue};
+        border-radius: 12px;
+        padding: 22px 16px;
+        text-align: center;
+        transition: all 0.28s ease;
+    }}
+    .formation-badge:hover {{
+        transform: translateY(-4px);
+        border-top-color: {accent_blue};
+        box-shadow: {card_shadow};
+    }}
+    .formation-badge .title {{
+        font-family: 'Outfit', sans-serif;
+        font-size: 1.7rem;
+        font-weight: 900;
+        color: {text_primary};
+        letter-spacing: -0.03em;
+    }}
+    .formation-badge .subtitle {{
+        font-family: 'Space Grotesk', sans-serif;
+        font-size: 9px;
+        letter-spacing: 0.22em;
+        text-transform: uppercase;
+        color: {text_secondary};
+        margin: 4px 0;
+    }}
+    .card-container {{
+        display: grid;
+        grid-template-columns: repeat(auto-fill, minmax(260px, 1fr));
+        gap: 16px;
+    }}
+    [data-testid="stChatMessage"] {{
+        background: {surface_card} !important;
+        border: 1px solid {ghost_border} !important;
+        border-radius: 12px !important;
+    }}
+    .investor-block {{
+        background: {surface_card};
+        border: 1px solid {ghost_border};
+        border-left: 3px solid {brand_blue};
+        border-radius: 16px;
+        padding: 36px 40px;
+    }}
+    hr {{
+        border: none !important;
+        height: 1px !important;
+        background: linear-gradient(90deg, transparent, {ghost_border}, transparent) !important;
+        margin: 32px 0 !important;
+    }}
+    .logo-area [data-testid="stImage"] img {{
+        filter: {logo_filter} drop-shadow(0 4px 28px rgba(0,85,149,0.50));
+        background: {logo_bg};
+        padding: {logo_padding};
+        display: block;
+        margin: 0 auto;
+        transition: filter 0.3s ease;
+    }}
+    .sidebar-logo [data-testid="stImage"] img {{
+        filter: {logo_filter};
+        background: transparent;
+        padding: 0;
+        display: block;
+        margin: 0 auto;
+    }}
+    .footer-logo [data-testid="stImage"] img {{
+        background: rgba(255,255,255,0.88);
+        border-radius: 8px;
+        padding: 6px 14px;
+        filter: drop-shadow(0 2px 10px rgba(0,85,149,0.28));
+    }}
+    [data-testid="stSidebar"] > div:first-child {{
+        padding-top: 0 !important;
+    }}
+    [data-testid="stSidebar"] nav a {{
+        transition: background 0.2s ease, color 0.2s ease, box-shadow 0.2s ease !important;
+    }}
+    [data-testid="stSidebar"] nav a:hover {{
+        border-left: 2px solid {brand_blue} !important;
+        padding-left: 14px !important;
+    }}
+    [data-testid="stSidebar"] nav a svg,
+    [data-testid="stSidebar"] nav a i {{
+        opacity: 0.85;
+        transition: opacity 0.2s ease;
+    }}
+    [data-testid="stSidebar"] nav a:hover svg,
+    [data-testid="stSidebar"] nav a:hover i {{
+        opacity: 1;
+    }}
+    [data-testid="stSidebar"] hr {{
+        border-color: {ghost_border} !important;
+    }}
+    [data-testid="stSidebar"] > div:first-child {{
+        background: linear-gradient(175deg, {dark_navy} 0%, {bg_color} 100%) !important;
+    }}
+    .nav-link {{
+        color: {text_secondary} !important;
+        font-family: 'Space Grotesk', sans-serif !important;
+        font-size: 13.5px !important;
+        font-weight: 500 !important;
+        border-radius: 10px !important;
+        margin: 3px 0 !important;
+        padding: 11px 18px !important;
+        background: transparent !important;
+    }}
+    .nav-link:hover {{
+        color: {text_primary} !important;
+        background: #143252 !important;
+    }}
+    .nav-link svg, .nav-link i {{
+        color: #3a8fd4 !important;
+        opacity: 0.9 !important;
+    }}
+    .nav-link-selected {{
+        background: linear-gradient(135deg, {brand_blue} 0%, {dark_navy} 100%) !important;
+        color: #FFFFFF !important;
+        font-weight: 700 !important;
+        border-radius: 10px !important;
+        box-shadow: 0 4px 16px rgba(0,85,149,0.45) !important;
+    }}
+    .nav-link-selected svg, .nav-link-selected i {{
+        color: #FFFFFF !important;
+        opacity: 1 !important;
+    }}
+    #MainMenu {{ visibility: hidden; }}
+    header[data-testid="stHeader"] {{
+        background: {bg_color} !important;
+        border-bottom: 1px solid {ghost_border} !important;
+    }}
+    .stDeployButton {{ display: none; }}
+    </style>
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def recurso_base64(ruta):
+    with open(ruta, "rb") as f:
+        return base64.b64encode(f.read()).decode()
+
+
+def _png_reescalado(ruta, ancho):
+    img = Image.open(ruta)
+    buffer = io.BytesIO()
+    img.resize((ancho, round(img.height * ancho / img.width)), Image.BILINEAR).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@st.cache_resource(show_spinner=False)
+def logo_png(ruta, ancho):
+    """PNG ya reescalado a `ancho`: st.image lo sirve tal cual, sin decodificar ni recomprimir."""
+    return _png_reescalado(ruta, ancho)
+
+
+@st.cache_resource(show_spinner=False)
+def icono_data_url(ruta, lado=64):
+    """Favicon como data URL (set_page_config con una ruta recodifica la imagen en cada rerun)."""
+    return "data:image/png;base64," + base64.b64encode(_png_reescalado(ruta, lado)).decode()
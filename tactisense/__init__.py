@@ -0,0 +1,5 @@
+"""Núcleo de Tactisense AI: datos, análisis y visualizaciones sin UI.
+
+`streamlit_app.py` solo orquesta la interfaz; todo lo que aquí vive se puede
+importar desde benchmarks o scripts sin ejecutar el dashboard.
+"""
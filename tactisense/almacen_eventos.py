@@ -0,0 +1,155 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+
+# =========================
+# ALMACÉN DE EVENTOS POR TEMPORADA (ARROW IPC MAPEADO)
+# =========================
+# Las filas de eventos de cada partido jugado se guardan una sola vez en
+# segmentos Arrow IPC (un archivo por tanda de partidos descargados). Cada
+# segmento se abre con memory-map: los datos viven en la cache de páginas del
+# sistema, compartida entre sesiones y entre workers del mismo host, y no en
+# copias por sesión. Dentro de un segmento las filas van ordenadas como las
+# produce `construir_filas_eventos`: primero los tiros de todos sus partidos y
+# después las PlayerStat, cada partido en un tramo contiguo. El metadato del
+# esquema guarda, por partido, [match_id, inicio_tiros, n_tiros, inicio_stats,
+# n_stats], así que una vista por partidos son rebanadas sin copia.
+DIR_EVENTOS = os.path.join(tempfile.gettempdir(), "tactisense_eventos")
+_CLAVE_RANGOS = b"tactisense.rangos"
+
+
+def ruta_almacen(*clave):
+    return os.path.join(DIR_EVENTOS, "_".join(str(c) for c in clave))
+
+
+class AlmacenEventos:
+    """Eventos de una temporada en segmentos Arrow IPC mapeados en memoria."""
+
+    def __init__(self, directorio):
+        self.directorio = directorio
+        self._lock = threading.Lock()
+        self._segmentos = {}
+        self._rangos = {}
+        self._suscriptores = []
+
+    # ---- segmentos ----
+    def _refrescar(self):
+        """Mapea los segmentos escritos (por este u otro proceso) desde la última vez."""
+        if not os.path.isdir(self.directorio):
+            return
+        for nombre in sorted(os.listdir(self.directorio)):
+            if not nombre.endswith(".arrow") or nombre in self._segmentos:
+                continue
+            tabla = ipc.open_file(pa.memory_map(os.path.join(self.directorio, nombre))).read_all()
+            self._segmentos[nombre] = tabla
+            nuevos = []
+            for mid, i_tiros, n_tiros, i_stats, n_stats in json.loads(tabla.schema.metadata[_CLAVE_RANGOS]):
+                if mid not in self._rangos:
+                    self._rangos[mid] = (tabla, i_tiros, n_tiros, i_stats, n_stats)
+                    nuevos.append(self._rangos[mid])
+            # Un partido guardado dos veces (dos workers a la vez) solo se notifica la primera
+            eventos = self._unir(nuevos) if nuevos and self._suscriptores else None
+            if eventos is not None:
+                for funcion in self._suscriptores:
+                    funcion(eventos)
+
+    def suscribir(self, funcion):
+        """`funcion(pa.Table)` recibe los eventos de cada tanda de partidos nuevos, empezando por los ya guardados."""
+        with self._lock:
+            self._refrescar()
+            self._suscriptores.append(funcion)
+            eventos = self._unir(list(self._rangos.values()), orden_almacen=True)
+            if eventos is not None:
+                funcion(eventos)
+
+    def faltantes(self, mids):
+        """Partidos sin guardar; el directorio solo se vuelve a listar si falta alguno."""
+        with self._lock:
+            faltan = [m for m in mids if m not in self._rangos]
+            if faltan:
+                self._refrescar()
+                faltan = [m for m in faltan if m not in self._rangos]
+            return faltan
+
+    def agregar(self, mids, df_eventos):
+        """Escribe un segmento con los eventos de `mids` (un partido sin eventos también cuenta como guardado)."""
+        if df_eventos is None or df_eventos.empty:
+            df_eventos = pd.DataFrame({"match_id": pd.Series(dtype="int64"), "type_name": pd.Series(dtype="str")})
+        orden = {mid: i for i, mid in enumerate(mids)}
+        dentro = df_eventos[df_eventos["match_id"].isin(orden)]
+        es_stat = dentro["type_name"] == "PlayerStat"
+        partes = [dentro[~es_stat], dentro[es_stat]]
+        # Orden estable por partido dentro de cada parte: conserva el orden de llegada de las filas
+        partes = [p.iloc[p["match_id"].map(orden).argsort(kind="stable")] for p in partes]
+        rangos, inicio = {mid: [mid, 0, 0, 0, 0] for mid in mids}, 0
+        for k, parte in enumerate(partes):
+            for mid, n in parte["match_id"].value_counts(sort=False).reindex(mids).fillna(0).astype(int).items():
+                rangos[mid][1 + 2 * k] = inicio
+                rangos[mid][2 + 2 * k] = int(n)
+                inicio += int(n)
+
+        tabla = pa.Table.from_pandas(pd.concat(partes, ignore_index=True), preserve_index=False)
+        tabla = tabla.replace_schema_metadata({_CLAVE_RANGOS: json.dumps(list(rangos.values()))})
+        os.makedirs(self.directorio, exist_ok=True)
+        # Nombre ordenable por tiempo y único entre procesos; se publica con un rename atómico
+        nombre = f"{time.time_ns():020d}_{uuid.uuid4().hex[:8]}.arrow"
+        fd, tmp = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f, ipc.new_file(f, tabla.schema) as escritor:
+                escritor.write_table(tabla)
+            os.replace(tmp, os.path.join(self.directorio, nombre))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        with self._lock:
+            self._refrescar()
+
+    # ---- consultas ----
+    def vista(self, mids, orden_almacen=False):
+        """Tabla Arrow con los eventos de `mids` (tiros y luego PlayerStat); rebanadas sin copia del segmento.
+
+        Los tramos contiguos se unen en una sola rebanada. Con `orden_almacen`
+        las filas salen en el orden de los segmentos (no en el de `mids`), así
+        que una temporada completa queda en unos pocos trozos grandes.
+        """
+        with self._lock:
+            if any(m not in self._rangos for m in mids):
+                self._refrescar()
+            rangos = [self._rangos[m] for m in dict.fromkeys(mids) if m in self._rangos]
+            return self._unir(rangos, orden_almacen)
+
+    def _unir(self, rangos, orden_almacen=False):
+        tramos = [(tabla, i, n) for tabla, i, n, _, _ in rangos] + [(tabla, i, n) for tabla, _, _, i, n in rangos]
+        if orden_almacen:
+            posicion = {id(tabla): k for k, tabla in enumerate(self._segmentos.values())}
+            tramos.sort(key=lambda t: (posicion[id(t[0])], t[1]))
+        unidos = []
+        for tabla, i, n in tramos:
+            if not n:
+                continue
+            if unidos and unidos[-1][0] is tabla and unidos[-1][1] + unidos[-1][2] == i:
+                unidos[-1][2] += n
+            else:
+                unidos.append([tabla, i, n])
+        if not unidos:
+            return None
+        return pa.concat_tables([tabla.slice(i, n) for tabla, i, n in unidos], promote_options="permissive")
+
+    def eventos(self, mids):
+        """DataFrame de eventos de `mids`: solo se materializan las filas pedidas."""
+        tabla = self.vista(mids)
+        if tabla is None:
+            return pd.DataFrame()
+        return tabla.to_pandas()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._rangos)
@@ -0,0 +1,66 @@
+from tactisense.instrumentacion import instrumentado
+from tactisense.recomendador import ranking_formaciones
+
+
+# =========================
+# ANÁLISIS TÁCTICO SIMPLE
+# =========================
+@instrumentado()
+def evaluar_rendimiento_xg(df_eventos, jugador, umbral=0.1):
+    tiros = df_eventos[(df_eventos['player'] == jugador) & (df_eventos['type_name'] == 'Shot')]
+    if tiros.empty:
+        return f"No hay tiros registrados para {jugador}."
+    xg_promedio = tiros['xg'].mean()
+    if xg_promedio >= umbral:
+        return f"{jugador} tiene un buen promedio de xG: {xg_promedio:.2f}."
+    else:
+        return f"{jugador} podría mejorar su rendimiento con xG promedio de {xg_promedio:.2f}."
+
+
+@instrumentado()
+def sugerir_formacion(fortalezas, debilidades, formacion_rival=None, top=4):
+    """Mejores formaciones [(formación, motivo)] según el motor de `recomendador`.
+
+    `formacion_rival` (p. ej. la más usada por el rival) añade la sobrecarga
+    por zonas frente a su dibujo; si no está en la biblioteca se ignora.
+    """
+    ranking = ranking_formaciones(fortalezas, debilidades, formacion_rival)
+    return [(form, motivo) for form, _, motivo in ranking[:top]]
+
+
+# =========================
+# SCOUT REPORT — MÉTRICAS
+# =========================
+def _calcular_stats_tiros(df_jugador):
+    shots = df_jugador[df_jugador['type_name'] == 'Shot']
+    n = len(shots)
+    xg = shots['xg'].sum() if 'xg' in shots.columns and shots['xg'].notna().any() else 0.0
+    goles = shots['result'].str.contains('goal', case=False, na=False).sum() if 'result' in shots.columns else 0
+    a_puerta = shots['result'].str.contains('goal|save', case=False, na=False).sum() if 'result' in shots.columns else 0
+    return {
+        "xG":        xg,
+        "Tiros":     n,
+        "Goles":     goles,
+        "A Puerta":  a_puerta,
+        "Precisión": (a_puerta / n * 100) if n > 0 else 0.0,
+        "xG/Tiro":   (xg / n) if n > 0 else 0.0,
+    }
+
+
+@instrumentado()
+def calcular_metricas_jugador(df, jugador):
+    df_j = df[df['player'] == jugador]
+    if df_j.empty:
+        return {"xG": 0.0, "Tiros": 0.0, "Goles": 0.0, "A Puerta": 0.0, "Precisión": 0.0, "xG/Tiro": 0.0}
+
+    metricas = _calcular_stats_tiros(df_j)
+
+    todos = {}
+    for jugador_i in df['player'].dropna().unique():
+        todos[jugador_i] = _calcular_stats_tiros(df[df['player'] == jugador_i])
+
+    normalizadas = {}
+    for k, v in metricas.items():
+        maximo = max((todos[j][k] for j in todos), default=1)
+        normalizadas[k] = round(100 * v / maximo, 1) if maximo > 0 else 0.0
+    return normalizadas
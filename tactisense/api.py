@@ -0,0 +1,1039 @@
+import hashlib
+import os
+import threading
+import time
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import requests
+from urllib.parse import urlencode
+
+from tactisense.almacen_eventos import AlmacenEventos, ruta_almacen
+from tactisense.cache import CacheTTL, UnVuelo, crear_cache_compartida
+from tactisense.helpers import extract_name_from_maybe_dict
+from tactisense.identidades import IndiceIdentidades, ruta_identidades
+from tactisense.indice_formaciones import IndiceFormaciones
+from tactisense.lideres import VistaLideres
+from tactisense.resiliencia import ApiNoDisponible, CuboTokens, DatosIncompletos, Disyuntor, no_cachear_incompletos
+from tactisense.series import MotorSeries
+from tactisense.modelo_xg import MODELO_XG_BASE, entrenar_modelo_xg, es_penalti, matriz_rasgos
+from tactisense.instrumentacion import cache_instrumentado, cache_revalidada, instrumentado, medir, registrar_cache, registrar_coalescidas, registrar_http, registrar_resiliencia
+
+# =========================
+# CONFIG DE LA API PROPIA
+# =========================
+# TACTISENSE_API_BASE permite apuntar a la API simulada local (benchmarks/mock_api.py)
+API_BASE = os.getenv("TACTISENSE_API_BASE", "https://t7scohixsj.execute-api.us-east-1.amazonaws.com")
+# Segundo nivel de cache común a todos los workers (ver tactisense/cache.py); las
+# claves son las URLs canónicas de cada recurso
+CACHE_COMPARTIDA = crear_cache_compartida(os.getenv("TACTISENSE_CACHE_URL", ""))
+
+
+@st.cache_resource(show_spinner=False)
+def cliente_http():
+    """Sesión HTTP única del proceso: las conexiones keep-alive se reutilizan entre reruns y sesiones."""
+    sesion = requests.Session()
+    adaptador = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32)
+    sesion.mount("http://", adaptador)
+    sesion.mount("https://", adaptador)
+    return sesion
+
+
+# Un GET idéntico ya en curso (otra sesión, misma URL) se espera en vez de repetirse
+VUELOS_HTTP = UnVuelo()
+# Cupo del gateway (peticiones/s y ráfaga) y disyuntor para cuando la API está caída
+LIMITADOR = CuboTokens(tasa=float(os.getenv("TACTISENSE_API_RPS", "20")),
+                       capacidad=int(os.getenv("TACTISENSE_API_RAFAGA", "40")))
+DISYUNTOR = Disyuntor(umbral=5, enfriamiento=30.0)
+
+
+def _retry_after(r):
+    try:
+        return float(r.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+
+def _get_directo(url, timeout):
+    try:
+        DISYUNTOR.permitir()
+        if LIMITADOR.tomar() > 0:
+            registrar_resiliencia("espera_cupo")
+    except ApiNoDisponible as ex:
+        registrar_resiliencia(type(ex).__name__)
+        raise
+    try:
+        with medir("HTTP"):
+            r = cliente_http().get(url, timeout=timeout)
+    except requests.RequestException:
+        DISYUNTOR.fallo()
+        registrar_resiliencia("fallo")
+        raise
+    registrar_http(len(r.content))
+    # 4xx (salvo 429) son respuestas de una API que funciona: no cuentan como fallo
+    if r.status_code == 429:
+        LIMITADOR.frenar(_retry_after(r))
+        DISYUNTOR.fallo()
+        registrar_resiliencia("429")
+    elif r.status_code >= 500:
+        DISYUNTOR.fallo()
+        registrar_resiliencia("fallo")
+    else:
+        LIMITADOR.acelerar()
+        DISYUNTOR.exito()
+    return r
+
+
+def _get(url, timeout):
+    """GET a la API propia, medido y contabilizado en bytes recibidos; single-flight por URL."""
+    r, compartido = VUELOS_HTTP.hacer(url, lambda: _get_directo(url, timeout))
+    if compartido:
+        registrar_coalescidas("http")
+    return r
+
+
+def _leer_compartida(url):
+    datos = CACHE_COMPARTIDA.get(url)
+    if CACHE_COMPARTIDA.activa:
+        registrar_cache("compartida", datos is not None)
+    return datos
+
+
+def _get_json(url, timeout):
+    """JSON de `url`, leído primero de la cache compartida; solo las respuestas OK se comparten."""
+    datos = _leer_compartida(url)
+    if datos is None:
+        r = _get(url, timeout=timeout)
+        r.raise_for_status()
+        datos = r.json()
+        CACHE_COMPARTIDA.set(url, datos)
+    return datos
+
+
+def _sin_filas(df):
+    """Respuesta correcta pero vacía (p. ej. temporada sin partidos): se guarda con TTL corto."""
+    return df is None or df.empty
+
+
+# Manifest, partidos y resúmenes se sirven vencidos mientras se recargan en
+# segundo plano: al pasar la hora ninguna sesión espera a la API. Los errores
+# no se capturan aquí: en la recarga de fondo `CacheRevalidada` conserva el
+# valor anterior, y en primer plano los muestra la página (paginas/comun.py).
+@cache_revalidada(ttl=3600, vacio=_sin_filas)
+def cargar_competiciones():
+    manifest = _get_json(f"{API_BASE}/manifest", timeout=10)
+    NOMBRES_LIGA = {
+        ("bsd", "league_19", "296"): "Liga MX · Apertura 2025",
+        ("bsd", "league_20", "297"): "Liga MX · Clausura 2026",
+    }
+    rows = []
+    for e in manifest.get("entries", []):
+        key = (e["source"], e["league"], str(e["season"]))
+        nombre = NOMBRES_LIGA.get(key, f"{e['source'].upper()} · {e['league']} · S{e['season']}")
+        rows.append({
+            "competition_name": nombre,
+            "competition_id":   e["league"],
+            "season_id":        e["season"],
+            "source":           e["source"],
+            "datasets":         e["datasets"],
+        })
+    return pd.DataFrame(rows)
+
+
+@cache_revalidada(ttl=3600, vacio=_sin_filas)
+def obtener_partidos(comp_id, season_id, source="bsd"):
+    params = f"source={source}&league={comp_id}&season={season_id}"
+    data = _get_json(f"{API_BASE}/matches?{params}", timeout=15)
+    df = pd.DataFrame(data)
+    # La API retorna home_team y away_team como strings directos
+    if "home_team" in df.columns:
+        df["home_team_name"] = df["home_team"]
+    if "away_team" in df.columns:
+        df["away_team_name"] = df["away_team"]
+    # El campo de fecha es event_date según la documentación
+    if "event_date" in df.columns:
+        df["match_date"] = df["event_date"]
+    # El campo id existe según la documentación
+    if "id" in df.columns:
+        df["match_id"] = df["id"]
+    return df
+
+
+@instrumentado()
+def extraer_equipos(matches_df):
+    """Normaliza los nombres de local/visitante y devuelve (partidos, equipos ordenados)."""
+    if matches_df is None or matches_df.empty:
+        return pd.DataFrame(), []
+    _matches = matches_df.copy()
+    # La API retorna strings directos, extract_name_from_maybe_dict cubre ambos casos
+    _matches['home_team_name'] = _matches['home_team'].apply(extract_name_from_maybe_dict) if 'home_team' in _matches.columns else None
+    _matches['away_team_name'] = _matches['away_team'].apply(extract_name_from_maybe_dict) if 'away_team' in _matches.columns else None
+    _equipos = sorted(list(set(
+        _matches['home_team_name'].dropna().tolist() +
+        _matches['away_team_name'].dropna().tolist()
+    )))
+    return _matches, _equipos
+
+
+# Campos de /shots → columnas del DataFrame de eventos
+CAMPOS_TIRO = {
+    "match_id":  "match_id",
+    # CAMBIO: el campo player en /shots es el nombre del jugador (string),
+    # player_id es el ID numérico (sistema v1, 7 dígitos)
+    "player":    "player",
+    "player_id": "player_id",
+    # CAMBIO: la API retorna xG en mayúscula
+    "xg":        "xG",
+    # CAMBIO: la API retorna x e y como campos directos, no como lista location
+    "x":         "x",
+    "y":         "y",
+    "minute":    "minute",
+    "team_name": "team",
+    "formation": "formation",
+    "result":    "type",
+    "situation": "situation",
+    "body_part": "body_part",
+}
+
+
+@instrumentado()
+def construir_filas_eventos(todos_shots, todos_players):
+    """Convierte las respuestas crudas de /shots y /player-stats al DataFrame de eventos.
+
+    Tiros y PlayerStat se arman columna a columna y se unen en un solo
+    DataFrame, con los mismos dtypes que daría `pd.concat` de ambos.
+    """
+    tiros = {col: [s.get(campo) for s in todos_shots] for col, campo in CAMPOS_TIRO.items()}
+    tiros = {"match_id": tiros.pop("match_id"), "type_name": ["Shot"] * len(todos_shots), **tiros}
+    if not todos_players:
+        return pd.DataFrame(tiros) if todos_shots else pd.DataFrame()
+    stats = _columnas_player_stats(todos_players)
+    if not todos_shots:
+        return pd.DataFrame(stats)
+
+    n_tiros, n_stats = len(todos_shots), len(todos_players)
+    columnas = {}
+    for col in dict.fromkeys([*tiros, *stats]):
+        de_tiros, de_stats = tiros.get(col), stats.get(col)
+        if de_stats is None:
+            columnas[col] = de_tiros + [None] * n_stats
+        elif de_tiros is None:
+            # Campo solo de /player-stats: NaN en los tiros (los enteros pasan a float64)
+            relleno = np.full(n_tiros, np.nan, dtype=de_stats.dtype if de_stats.dtype.kind == "f" else "float64")
+            columnas[col] = np.concatenate([relleno, de_stats])
+        else:
+            columnas[col] = de_tiros + (de_stats.tolist() if isinstance(de_stats, np.ndarray) else de_stats)
+    return pd.DataFrame(columnas)
+
+
+# /player-stats se convierte en bloque (no fila a fila) y conserva todos sus
+# campos numéricos, con el dtype más pequeño que los representa. Algunos se
+# renombran a las columnas comunes del DataFrame de eventos.
+RENOMBRES_PLAYER_STATS = {
+    "expected_goals": "xg",
+    "minutes":        "minute",
+    "passes_total":   "passes",
+    "tackles_total":  "tackles",
+}
+_CAMPOS_ID_PLAYER_STATS = ("match_id", "player_id", "player", "team")
+
+
+def columnas_player_stats(todos_players):
+    """Filas PlayerStat del DataFrame de eventos a partir de las respuestas crudas de /player-stats."""
+    if not todos_players:
+        return pd.DataFrame()
+    return pd.DataFrame(_columnas_player_stats(todos_players))
+
+
+def _columnas_player_stats(todos_players):
+    # Una pasada por campo con numpy y sin DataFrame intermedio: pandas por
+    # columna (to_numeric, dropna, inserción) multiplicaba el costo por 10
+    campos = dict.fromkeys(k for p in todos_players for k in p)
+    ids = {campo: [p.get(campo) for p in todos_players] if campo in campos else None
+           for campo in _CAMPOS_ID_PLAYER_STATS}
+    columnas = {
+        "match_id":  ids["match_id"],
+        "type_name": ["PlayerStat"] * len(todos_players),
+        # CAMBIO: en /player-stats el campo player es null para source bsd,
+        # usar player_id (sistema v2, 5 dígitos) como identificador
+        "player":    [str(v) for v in ids["player_id"]] if ids["player_id"] is not None else None,
+        "player_id": ids["player_id"],
+        "team_name": [extract_name_from_maybe_dict(t) for t in ids["team"]] if ids["team"] is not None else None,
+    }
+    for campo in campos:
+        if campo in _CAMPOS_ID_PLAYER_STATS:
+            continue
+        valores = _columna_numerica([p.get(campo) for p in todos_players])
+        if valores is not None:
+            columnas[RENOMBRES_PLAYER_STATS.get(campo, campo)] = valores
+    return columnas
+
+
+def _columna_numerica(crudos):
+    """Array numérico con el dtype más pequeño que lo representa; None si el campo no es numérico."""
+    objetos = np.empty(len(crudos), dtype=object)
+    objetos[:] = crudos
+    valores = pd.to_numeric(objetos, errors="coerce")
+    if valores.dtype.kind in "iub":
+        return valores.astype(_entero_minimo(valores.min(), valores.max()))
+    valores = valores.astype("float64", copy=False)
+    nulos = np.isnan(valores)
+    if nulos.all():
+        # Todo NaN: campo no numérico, salvo que venga vacío (null en todas las filas)
+        return None if any(v is not None and v == v for v in crudos) else valores.astype("float32")
+    if not nulos.any() and (valores % 1 == 0).all():
+        return valores.astype(_entero_minimo(valores.min(), valores.max()))
+    return valores.astype("float32")
+
+
+def _entero_minimo(minimo, maximo):
+    """El entero con signo más pequeño que contiene [minimo, maximo], como `downcast="integer"`."""
+    for dtype in ("int8", "int16", "int32"):
+        info = np.iinfo(dtype)
+        if info.min <= minimo and maximo <= info.max:
+            return dtype
+    return "int64"
+
+
+# =========================
+# EVENTOS POR PARTIDO (LOTES + CACHE)
+# =========================
+# /shots y /player-stats aceptan `match_ids=1,2,3` y responden
+# {"<match_id>": [...], ...}. Los ids se empaquetan en lotes limitados por el
+# largo de la URL y por el tamaño esperado de la respuesta (estimado con lo
+# observado en lotes anteriores), y el resultado se reparte en la cache por
+# partido. Si la API no soporta lotes se vuelve a una petición por partido.
+MAX_URL = 2000
+MAX_BYTES_LOTE = 5 * 1024 * 1024
+REINTENTO_LOTES_S = 3600
+DATASETS_PARTIDO = ("shots", "player-stats")
+
+CACHE_PARTIDOS = CacheTTL(ttl=3600)
+# Partidos en descarga: un lote que incluye un partido que ya viene en el lote
+# de otra sesión no lo vuelve a pedir, espera esas filas
+VUELOS_PARTIDOS = UnVuelo()
+INDICE_FORMACIONES = IndiceFormaciones()
+_IDENTIDADES = {}
+_LOCK_IDENTIDADES = threading.Lock()
+_ALMACENES = {}
+_LOCK_ALMACENES = threading.Lock()
+_LIDERES = {}
+_bytes_por_partido = {"shots": 16_000, "player-stats": 16_000}
+_lotes_no_soportados = {}
+
+
+class LotesNoSoportados(Exception):
+    pass
+
+
+def partir_en_lotes(mids, url_base, bytes_por_partido, max_url=MAX_URL, max_bytes=MAX_BYTES_LOTE):
+    """Agrupa `mids` en lotes cuya URL y respuesta estimada caben en los límites."""
+    max_por_lote = max(1, int(max_bytes // max(bytes_por_partido, 1)))
+    base = len(url_base) + len("&match_ids=")
+    lotes, lote, largo = [], [], base
+    for mid in mids:
+        extra = len(str(mid)) + (1 if lote else 0)
+        if lote and (largo + extra > max_url or len(lote) >= max_por_lote):
+            lotes.append(lote)
+            lote, largo, extra = [], base, len(str(mid))
+        lote.append(mid)
+        largo += extra
+    if lote:
+        lotes.append(lote)
+    return lotes
+
+
+def _descargar_lote(dataset, lote, params):
+    url = f"{API_BASE}/{dataset}?{params}&match_ids={','.join(str(m) for m in lote)}"
+    r = _get(url, timeout=20)
+    if r.status_code in (400, 404, 405, 501):
+        raise LotesNoSoportados(dataset)
+    r.raise_for_status()
+    # Media móvil del tamaño por partido para dimensionar los próximos lotes
+    _bytes_por_partido[dataset] = 0.7 * _bytes_por_partido[dataset] + 0.3 * len(r.content) / len(lote)
+    # Solo los partidos que vienen en la respuesta: uno omitido no es un partido sin
+    # eventos, y marcarlo como [] lo dejaría vacío en todas las caches y el almacén
+    por_id = {str(m): m for m in lote}
+    return {por_id[clave]: filas for clave, filas in r.json().items() if clave in por_id}
+
+
+def _descargar_partido(dataset, mid, params):
+    """Filas del partido, o None si falló; ApiNoDisponible se propaga para cortar el bucle."""
+    try:
+        r = _get(f"{API_BASE}/matches/{mid}/{dataset}?{params}", timeout=10)
+        if r.ok:
+            return r.json()
+    except ApiNoDisponible:
+        raise
+    except (requests.RequestException, ValueError):
+        pass
+    return None
+
+
+def _descargar_dataset(dataset, mids, params):
+    resultado = {}
+    if time.monotonic() - _lotes_no_soportados.get(dataset, -REINTENTO_LOTES_S) >= REINTENTO_LOTES_S:
+        try:
+            for lote in partir_en_lotes(mids, f"{API_BASE}/{dataset}?{params}", _bytes_por_partido[dataset]):
+                resultado.update(_descargar_lote(dataset, lote, params))
+            if len(resultado) == len(mids):
+                return resultado
+            # Los que el lote omitió se piden uno a uno; si tampoco llegan, quedan fuera y se reintentan
+        except LotesNoSoportados:
+            _lotes_no_soportados[dataset] = time.monotonic()
+        except ApiNoDisponible:
+            # Con la API caída no se reintenta partido a partido: eso multiplicaría las peticiones fallidas
+            return resultado
+        except requests.HTTPError as ex:
+            if ex.response is not None and ex.response.status_code == 429:
+                return resultado
+        except (requests.RequestException, ValueError):
+            pass
+    try:
+        for mid in mids:
+            if mid in resultado:
+                continue
+            filas = _descargar_partido(dataset, mid, params)
+            if filas is not None:
+                resultado[mid] = filas
+    except ApiNoDisponible:
+        pass
+    return resultado
+
+
+def descargar_dataset_partidos(dataset, mids, source="bsd", league="league_19", season="296"):
+    """{mid: filas} de un dataset: cache del proceso, luego cache compartida y lotes para lo que falte."""
+    params = f"source={source}&league={league}&season={season}"
+    datos, faltan = {}, []
+    for mid in mids:
+        filas = CACHE_PARTIDOS.get((dataset, source, league, season, mid))
+        registrar_cache(f"partido/{dataset}", filas is not None)
+        if filas is None:
+            faltan.append(mid)
+        else:
+            datos[mid] = filas
+    if faltan and CACHE_COMPARTIDA.activa:
+        # Misma clave que la URL por partido, compartida por todos los workers
+        compartidas = CACHE_COMPARTIDA.get_muchos([f"{API_BASE}/matches/{mid}/{dataset}?{params}" for mid in faltan])
+        pendientes = []
+        for mid, filas in zip(faltan, compartidas):
+            registrar_cache(f"compartida/{dataset}", filas is not None)
+            if filas is None:
+                pendientes.append(mid)
+            else:
+                CACHE_PARTIDOS.set((dataset, source, league, season, mid), filas)
+                datos[mid] = filas
+        faltan = pendientes
+    if faltan:
+        propias, ajenas = VUELOS_PARTIDOS.reclamar([(dataset, source, league, season, mid) for mid in faltan])
+        registrar_coalescidas(f"partido/{dataset}", len(ajenas))
+        descargados = {}
+        try:
+            if propias:
+                descargados = _descargar_dataset(dataset, [clave[-1] for clave in propias], params)
+            for mid, filas in descargados.items():
+                CACHE_PARTIDOS.set((dataset, source, league, season, mid), filas)
+                CACHE_COMPARTIDA.set(f"{API_BASE}/matches/{mid}/{dataset}?{params}", filas)
+                datos[mid] = filas
+        finally:
+            # Un partido que no se pudo descargar se publica como None: quien lo esperaba tampoco lo tiene
+            for clave in propias:
+                VUELOS_PARTIDOS.terminar(clave, descargados.get(clave[-1]))
+        for clave, vuelo in ajenas.items():
+            filas = vuelo.esperar()
+            if filas is not None:
+                datos[clave[-1]] = filas
+    if dataset == "shots":
+        # Los llamadores piden solo partidos terminados; uno sin tiros todavía no cuenta como indexado
+        for mid, filas in datos.items():
+            if filas:
+                INDICE_FORMACIONES.registrar_partido((source, league, season), mid, filas)
+    return datos
+
+
+def descargar_eventos_partidos(mids, source="bsd", league="league_19", season="296"):
+    """Devuelve ({mid: shots}, {mid: player_stats}) usando la cache por partido y lotes."""
+    shots, players = (descargar_dataset_partidos(dataset, mids, source, league, season) for dataset in DATASETS_PARTIDO)
+    # Cada partido con ambos datasets amplía la evidencia de identidades v1 ↔ v2. Uno
+    # sin filas (sin jugar) no se marca como procesado: se guardaría así en disco
+    identidades = indice_identidades(source, league, season)
+    nuevos = [identidades.registrar_partido(mid, shots[mid], players[mid])
+              for mid in identidades.faltantes(mids) if shots.get(mid) and players.get(mid)]
+    if any(nuevos):
+        identidades.guardar()
+    return shots, players
+
+
+def indice_identidades(source="bsd", league="league_19", season="296"):
+    """Índice v1 ↔ v2 de la temporada (se carga de disco la primera vez)."""
+    clave = (source, league, season)
+    with _LOCK_IDENTIDADES:
+        if clave not in _IDENTIDADES:
+            _IDENTIDADES[clave] = IndiceIdentidades.cargar(ruta_identidades(*clave))
+        return _IDENTIDADES[clave]
+
+
+@instrumentado()
+def unir_identidades(df_eventos, source="bsd", league="league_19", season="296"):
+    """Añade player_id_v1/player_id_v2 a todas las filas y da nombre a las PlayerStat resueltas.
+
+    El cruce es una búsqueda por clave entera sobre la tabla de identidades,
+    así que tiros y rating/pases/entradas del mismo jugador quedan unidos.
+    """
+    if df_eventos is None or df_eventos.empty or "player_id" not in df_eventos.columns:
+        return df_eventos
+    tabla = indice_identidades(source, league, season).tabla()
+    df = df_eventos.copy()
+    ids = pd.to_numeric(df["player_id"], errors="coerce").astype("Int64")
+    es_stat = (df["type_name"] == "PlayerStat").to_numpy()
+    df["player_id_v1"] = ids.where(~es_stat)
+    df["player_id_v2"] = ids.where(es_stat)
+
+    por_v1 = pd.Index(tabla["player_id_v1"])
+    pos_v1 = por_v1.get_indexer(df["player_id_v1"].fillna(-1).astype("int64"))
+    con_v2 = pos_v1 >= 0
+    df.loc[con_v2, "player_id_v2"] = tabla["player_id_v2"].to_numpy()[pos_v1[con_v2]]
+
+    pos_v2 = tabla.index.get_indexer(df["player_id_v2"].fillna(-1).astype("int64"))
+    resueltas = (pos_v2 >= 0) & es_stat
+    df.loc[resueltas, "player_id_v1"] = tabla["player_id_v1"].to_numpy()[pos_v2[resueltas]]
+    nombres = tabla["player_name"].to_numpy()[pos_v2[resueltas]]
+    df.loc[resueltas, "player"] = pd.Series(nombres, index=df.index[resueltas]).fillna(df.loc[resueltas, "player"])
+    return df
+
+
+def almacen_eventos(source="bsd", league="league_19", season="296"):
+    """Almacén Arrow de la temporada; el hash de API_BASE separa la API real de la simulada."""
+    clave = (hashlib.sha1(API_BASE.encode("utf-8")).hexdigest()[:8], source, league, season)
+    with _LOCK_ALMACENES:
+        if clave not in _ALMACENES:
+            _ALMACENES[clave] = AlmacenEventos(ruta_almacen(*clave))
+        return _ALMACENES[clave]
+
+
+@instrumentado()
+def _obtener_datos_eventos_por_nombre(equipo_nombre, matches_df, max_partidos=3, source="bsd", league="league_19", season="296"):
+    """Eventos de los últimos `max_partidos` del equipo leídos del almacén Arrow de la temporada.
+
+    Sin `st.cache_data`: cada acceso es una vista por partidos sobre segmentos
+    mapeados, no una copia deserializada del DataFrame completo.
+    """
+    if matches_df is None or matches_df.empty:
+        return pd.DataFrame()
+
+    partidos_equipo = matches_df[
+        (matches_df["home_team_name"] == equipo_nombre) |
+        (matches_df["away_team_name"] == equipo_nombre)
+    ].copy()
+
+    if partidos_equipo.empty:
+        return pd.DataFrame()
+    if "match_date" in partidos_equipo.columns:
+        partidos_equipo = partidos_equipo.sort_values("match_date", ascending=False)
+
+    partidos_equipo = partidos_equipo.head(max_partidos)
+    mids = partidos_equipo["match_id"].tolist()
+    almacen = almacen_eventos(source, league, season)
+    extra, sin_guardar = _completar_almacen(almacen, partidos_equipo, source, league, season)
+    guardados = almacen.eventos([m for m in mids if m not in sin_guardar])
+    if extra.empty:
+        return guardados
+    return pd.concat([guardados, extra], ignore_index=True) if not guardados.empty else extra
+
+
+def _completar_almacen(almacen, partidos, source="bsd", league="league_19", season="296"):
+    """Descarga y guarda en el almacén los partidos de `partidos` que falten.
+
+    Solo los partidos terminados y descargados se guardan: el resto se reintenta
+    en la próxima consulta. Devuelve (eventos de los no guardados, sus ids).
+    """
+    faltan = almacen.faltantes(partidos["match_id"].drop_duplicates().tolist())
+    if "status" in partidos.columns:
+        # Un partido sin jugar no tiene eventos: ni se descarga ni entra en los índices
+        terminados = set(partidos.loc[partidos["status"] == "finished", "match_id"])
+        faltan = [m for m in faltan if m in terminados]
+    registrar_cache("almacen_eventos", not faltan)
+    if not faltan:
+        return pd.DataFrame(), []
+
+    shots_por_partido, players_por_partido = descargar_eventos_partidos(faltan, source, league, season)
+    descargados = [m for m in faltan if m in shots_por_partido and m in players_por_partido]
+    todos_shots = []
+    todos_players = []
+    for mid in faltan:
+        todos_shots.extend(dict(s, match_id=mid) for s in shots_por_partido.get(mid, []))
+        todos_players.extend(players_por_partido.get(mid, []))
+    nuevos = construir_filas_eventos(todos_shots, todos_players) if todos_shots or todos_players else pd.DataFrame()
+    if descargados:
+        almacen.agregar(descargados, nuevos)
+
+    sin_guardar = [m for m in faltan if m not in descargados]
+    if not sin_guardar or nuevos.empty:
+        return pd.DataFrame(), sin_guardar
+    return nuevos[nuevos["match_id"].isin(sin_guardar)].reset_index(drop=True), sin_guardar
+
+
+@instrumentado()
+def tabla_eventos_temporada(matches_df, source="bsd", league="league_19", season="296"):
+    """Vista Arrow (sin copia) de los eventos de todos los partidos terminados de la temporada.
+
+    Es la entrada de las consultas de liga completa de `tactisense.consultas`;
+    la primera vez descarga en lotes lo que falte en el almacén.
+    """
+    if matches_df is None or matches_df.empty:
+        return None
+    jugados = matches_df
+    if "status" in jugados.columns:
+        jugados = jugados[jugados["status"] == "finished"]
+    almacen = almacen_eventos(source, league, season)
+    _completar_almacen(almacen, jugados, source, league, season)
+    return almacen.vista(jugados["match_id"].drop_duplicates().tolist(), orden_almacen=True)
+
+
+def temporada_en_almacen(matches_df, source="bsd", league="league_19", season="296"):
+    """True si el almacén ya guarda todos los partidos terminados: `tabla_eventos_temporada` no tocará la API."""
+    if matches_df is None or matches_df.empty:
+        return True
+    jugados = matches_df
+    if "status" in jugados.columns:
+        jugados = jugados[jugados["status"] == "finished"]
+    return not almacen_eventos(source, league, season).faltantes(jugados["match_id"].drop_duplicates().tolist())
+
+
+def vista_lideres(source="bsd", league="league_19", season="296"):
+    """Vista de líderes de la temporada, suscrita al almacén: se actualiza con cada partido guardado."""
+    almacen = almacen_eventos(source, league, season)
+    with _LOCK_ALMACENES:
+        vista = _LIDERES.get(id(almacen))
+        if vista is None:
+            vista = _LIDERES[id(almacen)] = VistaLideres()
+            almacen.suscribir(vista.incorporar)
+    return vista
+
+
+@instrumentado()
+def lideres_temporada(matches_df, source="bsd", league="league_19", season="296"):
+    """(vista de líderes, tabla de identidades) tras guardar los partidos terminados que falten.
+
+    Cada partido guardado llega a la vista por la suscripción al almacén, así
+    que ordenar y paginar después (`VistaLideres.pagina`) no toca la API.
+    """
+    vista = vista_lideres(source, league, season)
+    if matches_df is not None and not matches_df.empty:
+        jugados = matches_df[matches_df["status"] == "finished"] if "status" in matches_df.columns else matches_df
+        _completar_almacen(almacen_eventos(source, league, season), jugados, source, league, season)
+    return vista, indice_identidades(source, league, season).tabla()
+
+
+# =========================
+# RESUMEN POR EQUIPO / TEMPORADA
+# =========================
+# Totales por partido de un equipo. La API los sirve ya agregados en
+# /team-summary (una sola petición por equipo y temporada); si el recurso no
+# existe se calculan localmente sobre los eventos crudos cacheados.
+COLUMNAS_RESUMEN = [
+    "match_id", "match_date", "opponent", "home", "formation",
+    "shots", "shots_on_target", "goals", "xg",
+    "shots_against", "goals_against", "xg_against",
+    "yellow_cards", "red_cards",
+]
+
+
+def _formacion_por_partido(tiros):
+    """Formación más repetida en los tiros de cada partido (conteo con bincount 2D)."""
+    tiros = tiros[tiros["formation"].notna()]
+    codigos, formaciones = pd.factorize(tiros["formation"])
+    mids, fila = np.unique(tiros["match_id"].to_numpy(), return_inverse=True)
+    conteo = np.zeros((len(mids), max(len(formaciones), 1)), dtype=np.int64)
+    np.add.at(conteo, (fila, codigos), 1)
+    return pd.Series(np.asarray(formaciones, dtype=object)[conteo.argmax(axis=1)] if len(formaciones) else [],
+                     index=pd.Index(mids, name="match_id"), name="formation", dtype=object)
+
+
+@instrumentado()
+def agregar_resumen_partidos(df_eventos, equipo_nombre, matches_df):
+    """Agregación local equivalente a /team-summary sobre el DataFrame de eventos."""
+    if df_eventos is None or df_eventos.empty:
+        return pd.DataFrame(columns=COLUMNAS_RESUMEN)
+
+    shots = df_eventos[df_eventos["type_name"] == "Shot"]
+    resultado = shots["result"].fillna("").astype(str) if "result" in shots.columns else pd.Series("", index=shots.index)
+    tiros = pd.DataFrame({
+        "match_id": shots["match_id"],
+        "propio":   shots["team_name"] == equipo_nombre,
+        "xg":       pd.to_numeric(shots["xg"], errors="coerce").fillna(0.0),
+        "gol":      resultado.str.contains("goal", case=False),
+        "a_puerta": resultado.str.contains("goal|save", case=False),
+    })
+    a_favor = tiros[tiros["propio"]].groupby("match_id").agg(
+        shots=("xg", "size"), shots_on_target=("a_puerta", "sum"), goals=("gol", "sum"), xg=("xg", "sum"))
+    en_contra = tiros[~tiros["propio"]].groupby("match_id").agg(
+        shots_against=("xg", "size"), goals_against=("gol", "sum"), xg_against=("xg", "sum"))
+    if "formation" in shots.columns:
+        a_favor = a_favor.join(_formacion_por_partido(shots[tiros["propio"]]))
+
+    stats = df_eventos[(df_eventos["type_name"] == "PlayerStat") & (df_eventos["team_name"] == equipo_nombre)]
+    tarjetas = pd.DataFrame(index=pd.Index([], name="match_id"))
+    for col, destino in (("yellow_card", "yellow_cards"), ("red_card", "red_cards")):
+        if col in stats.columns:
+            tarjetas[destino] = pd.to_numeric(stats[col], errors="coerce").groupby(stats["match_id"]).sum()
+
+    ids = pd.Index(df_eventos["match_id"].dropna().unique(), name="match_id")
+    resumen = pd.DataFrame(index=ids).join(a_favor).join(en_contra).join(tarjetas)
+
+    partidos = matches_df[matches_df["match_id"].isin(ids)].set_index("match_id") if matches_df is not None and not matches_df.empty else pd.DataFrame()
+    if not partidos.empty:
+        local = partidos["home_team_name"] == equipo_nombre
+        resumen["match_date"] = partidos["match_date"] if "match_date" in partidos.columns else None
+        resumen["home"] = local
+        resumen["opponent"] = partidos["away_team_name"].where(local, partidos["home_team_name"])
+
+    resumen = resumen.reset_index().reindex(columns=COLUMNAS_RESUMEN)
+    conteos = [c for c in COLUMNAS_RESUMEN[5:] if c not in ("xg", "xg_against")]
+    resumen[conteos] = resumen[conteos].fillna(0).astype(int)
+    resumen[["xg", "xg_against"]] = resumen[["xg", "xg_against"]].fillna(0.0)
+    return resumen
+
+
+@cache_revalidada(ttl=3600)
+def _descargar_resumen_equipo(equipo_nombre, source="bsd", league="league_19", season="296"):
+    """Totales por partido desde /team-summary; None si la API no expone el recurso."""
+    params = urlencode({"source": source, "league": league, "season": season, "team": equipo_nombre})
+    url = f"{API_BASE}/team-summary?{params}"
+    datos = _leer_compartida(url)
+    if datos is None:
+        r = _get(url, timeout=15)
+        if r.status_code in (404, 405, 501):
+            return None
+        r.raise_for_status()
+        datos = r.json()
+        CACHE_COMPARTIDA.set(url, datos)
+    df = pd.DataFrame(datos)
+    if "event_date" in df.columns:
+        df["match_date"] = df["event_date"]
+    return df.reindex(columns=COLUMNAS_RESUMEN)
+
+
+def obtener_resumen_equipo(equipo_nombre, matches_df, max_partidos=None, source="bsd", league="league_19", season="296"):
+    """Totales de los últimos `max_partidos` (None = temporada completa), más reciente primero."""
+    # Solo un recurso no soportado (None) o un error de red pasan a la agregación
+    # local; con el disyuntor abierto (ApiNoDisponible) no se pide partido a partido
+    try:
+        resumen = _descargar_resumen_equipo(equipo_nombre, source, league, season)
+    except ApiNoDisponible:
+        raise
+    except requests.RequestException:
+        resumen = None
+    if resumen is None:
+        # Como en `_completar_almacen`: un partido sin jugar no tiene eventos y solo
+        # dejaría respuestas vacías en CACHE_PARTIDOS a cada consulta
+        jugados = matches_df
+        if jugados is not None and "status" in jugados.columns:
+            jugados = jugados[jugados["status"] == "finished"]
+        if jugados is None or jugados.empty:
+            return pd.DataFrame(columns=COLUMNAS_RESUMEN)
+        n = max_partidos if max_partidos is not None else len(jugados)
+        eventos = _obtener_datos_eventos_por_nombre(equipo_nombre, jugados, n, source, league, season)
+        resumen = agregar_resumen_partidos(eventos, equipo_nombre, jugados)
+    resumen = resumen.sort_values("match_date", ascending=False, na_position="last")
+    if max_partidos is not None:
+        resumen = resumen.head(max_partidos)
+    return resumen.reset_index(drop=True)
+
+
+# =========================
+# ÍNDICE DE FORMACIONES
+# =========================
+# El índice se alimenta solo con cada descarga de tiros. Para que cualquier
+# equipo tenga la temporada completa, la primera consulta descarga (en lotes)
+# los tiros de los partidos jugados que aún no estén indexados; las siguientes
+# consultas, con cualquier rival, no tocan la red.
+def asegurar_indice_formaciones(matches_df, source="bsd", league="league_19", season="296"):
+    if matches_df is None or matches_df.empty or "match_id" not in matches_df.columns:
+        return
+    jugados = matches_df
+    if "status" in jugados.columns:
+        jugados = jugados[jugados["status"] == "finished"]
+    faltan = INDICE_FORMACIONES.faltantes((source, league, season), jugados["match_id"].tolist())
+    if faltan:
+        descargar_dataset_partidos("shots", faltan, source, league, season)
+
+
+@instrumentado()
+def formaciones_equipo(equipo_nombre, matches_df, source="bsd", league="league_19", season="296"):
+    """(uso, cruces) de formaciones del equipo en la temporada; ver `IndiceFormaciones`."""
+    asegurar_indice_formaciones(matches_df, source, league, season)
+    temporada = (source, league, season)
+    return INDICE_FORMACIONES.uso(temporada, equipo_nombre), INDICE_FORMACIONES.cruces(temporada, equipo_nombre)
+
+
+# =========================
+# MODELO xG LOCAL POR TEMPORADA
+# =========================
+# La matriz de rasgos de cada partido se guarda en CACHE_RASGOS: reentrenar
+# tras una jornada nueva solo arma las filas de los partidos nuevos y apila
+# el resto. Los penaltis quedan fuera del ajuste (valor fijo en el modelo).
+CACHE_RASGOS = CacheTTL(ttl=3600, max_entradas=4096)
+
+
+def rasgos_partido(shots, clave):
+    """(X, goles, penaltis) de los tiros crudos de un partido, cacheado por `clave`."""
+    rasgos = CACHE_RASGOS.get(clave)
+    registrar_cache("rasgos_xg", rasgos is not None)
+    if rasgos is None:
+        columnas = {c: [s.get(c) for s in shots] for c in ("x", "y", "situation", "body_part", "minute", "type")}
+        X = matriz_rasgos(columnas["x"], columnas["y"], columnas["situation"], columnas["body_part"], columnas["minute"])
+        rasgos = (X, np.asarray(columnas["type"], dtype=object) == "Goal", es_penalti(columnas["situation"]))
+        CACHE_RASGOS.set(clave, rasgos)
+    return rasgos
+
+
+@no_cachear_incompletos
+@cache_instrumentado(ttl=3600, show_spinner=False)
+def modelo_xg_temporada(matches_df, source="bsd", league="league_19", season="296"):
+    """Modelo xG ajustado con todos los tiros jugados de la temporada (o el modelo base)."""
+    if matches_df is None or matches_df.empty or "match_id" not in matches_df.columns:
+        return MODELO_XG_BASE
+    jugados = matches_df
+    if "status" in jugados.columns:
+        jugados = jugados[jugados["status"] == "finished"]
+    mids = jugados["match_id"].drop_duplicates().tolist()
+    shots = descargar_dataset_partidos("shots", mids, source, league, season)
+    partes = [rasgos_partido(filas, (source, league, season, mid)) for mid, filas in shots.items() if filas]
+    modelo = MODELO_XG_BASE
+    if partes:
+        X, goles, penaltis = (np.concatenate(p) for p in zip(*partes))
+        modelo = entrenar_modelo_xg(X[~penaltis], goles[~penaltis])
+    if len(shots) < len(mids):
+        raise DatosIncompletos(modelo)
+    return modelo
+
+
+# =========================
+# SERIES DE FORMA
+# =========================
+# Las páginas leen la forma reciente de MOTOR_SERIES. Los equipos se alimentan
+# del resumen por partido (/team-summary o su agregación local) y los
+# jugadores de los eventos por partido; en ambos casos solo se procesan los
+# partidos que la serie aún no tiene, en orden de fecha.
+MOTOR_SERIES = MotorSeries()
+
+
+def _partidos_jugados(equipo_nombre, matches_df):
+    partidos = matches_df[(matches_df["home_team_name"] == equipo_nombre) | (matches_df["away_team_name"] == equipo_nombre)]
+    if "status" in partidos.columns:
+        partidos = partidos[partidos["status"] == "finished"]
+    return partidos.sort_values("match_date") if "match_date" in partidos.columns else partidos
+
+
+def serie_equipo(equipo_nombre, matches_df, source="bsd", league="league_19", season="296"):
+    """Serie por partido del equipo (xG, tiros y goles a favor/en contra) con media móvil y EWMA."""
+    temporada = (source, league, season)
+    resumen = obtener_resumen_equipo(equipo_nombre, matches_df, None, source, league, season)
+    nuevos = resumen[[not MOTOR_SERIES.contiene(temporada, "equipo", equipo_nombre, m) for m in resumen["match_id"]]]
+    for fila in nuevos.sort_values("match_date", na_position="first").to_dict("records"):
+        MOTOR_SERIES.agregar(temporada, "equipo", equipo_nombre, fila["match_date"], fila["match_id"], fila)
+    return MOTOR_SERIES.tabla(temporada, "equipo", equipo_nombre)
+
+
+@instrumentado()
+def agregados_jugadores(df_eventos):
+    """Agregados por (match_id, player): xG, tiros y goles de los tiros; rating y minutos de PlayerStat."""
+    tiros = df_eventos[df_eventos["type_name"] == "Shot"]
+    stats = df_eventos[df_eventos["type_name"] == "PlayerStat"]
+    por_tiros = tiros.assign(
+        xg=pd.to_numeric(tiros["xg"], errors="coerce"),
+        gol=tiros["result"].eq("Goal") if "result" in tiros.columns else False,
+    ).groupby(["match_id", "player"]).agg(xg=("xg", "sum"), shots=("xg", "size"), goals=("gol", "sum"))
+    por_stats = stats.assign(
+        rating=pd.to_numeric(stats["rating"], errors="coerce") if "rating" in stats.columns else np.nan,
+        minutes=pd.to_numeric(stats["minute"], errors="coerce"),
+    ).groupby(["match_id", "player"]).agg(rating=("rating", "mean"), minutes=("minutes", "sum"))
+    return por_tiros.join(por_stats, how="outer").reset_index()
+
+
+def series_jugadores(equipo_nombre, matches_df, source="bsd", league="league_19", season="296"):
+    """Último estado de forma de cada jugador del equipo en la temporada."""
+    temporada = (source, league, season)
+    partidos = _partidos_jugados(equipo_nombre, matches_df)
+    faltan = MOTOR_SERIES.pendientes(temporada, equipo_nombre, partidos["match_id"].tolist())
+    if faltan:
+        shots, players = descargar_eventos_partidos(faltan, source, league, season)
+        eventos = construir_filas_eventos(
+            [dict(s, match_id=mid) for mid in faltan for s in shots.get(mid, [])],
+            [p for mid in faltan for p in players.get(mid, [])],
+        )
+        jugadores = []
+        if not eventos.empty:
+            eventos = unir_identidades(eventos[eventos["team_name"] == equipo_nombre], source, league, season)
+            fechas = partidos.set_index("match_id")["match_date"] if "match_date" in partidos.columns else pd.Series(dtype=object)
+            agregados = agregados_jugadores(eventos)
+            agregados["match_date"] = agregados["match_id"].map(fechas)
+            for fila in agregados.sort_values("match_date", na_position="first").to_dict("records"):
+                MOTOR_SERIES.agregar(temporada, "jugador", fila["player"], fila["match_date"], fila["match_id"], fila)
+            jugadores = agregados["player"].dropna().unique().tolist()
+        MOTOR_SERIES.marcar_ingeridos(temporada, equipo_nombre, faltan, jugadores)
+    return MOTOR_SERIES.ultimos(temporada, "jugador", MOTOR_SERIES.plantilla(temporada, equipo_nombre))
+
+
+# =========================
+# DISCIPLINA Y ACTIVIDAD POR EQUIPO
+# =========================
+# Totales por equipo y partido sacados de /player-stats (tarjetas, faltas,
+# entradas, pases). Se calculan una sola vez por partido sobre la forma
+# columnar de sus filas y quedan en CACHE_EQUIPOS_PARTIDO; Comparativa y
+# Análisis Propio solo concatenan las filas ya agregadas.
+CAMPOS_DISCIPLINA = {
+    "yellow_card":     "yellow_cards",
+    "red_card":        "red_cards",
+    "fouls_committed": "fouls",
+    "tackles":         "tackles",
+    "passes":          "passes",
+}
+CACHE_EQUIPOS_PARTIDO = CacheTTL(ttl=3600, max_entradas=4096)
+
+
+def agregados_equipos_partido(players, clave):
+    """DataFrame (índice: equipo) con los totales de un partido, cacheado por `clave`."""
+    agregados = CACHE_EQUIPOS_PARTIDO.get(clave)
+    registrar_cache("equipos_partido", agregados is not None)
+    if agregados is None:
+        stats = columnas_player_stats(players)
+        columnas = list(CAMPOS_DISCIPLINA.values())
+        if stats.empty:
+            agregados = pd.DataFrame(columns=columnas)
+        else:
+            presentes = [c for c in CAMPOS_DISCIPLINA if c in stats.columns]
+            agregados = (stats.groupby("team_name")[presentes].sum()
+                         .rename(columns=CAMPOS_DISCIPLINA).reindex(columns=columnas).fillna(0).astype("int32"))
+        CACHE_EQUIPOS_PARTIDO.set(clave, agregados)
+    return agregados
+
+
+@instrumentado()
+def disciplina_equipo(equipo_nombre, matches_df, max_partidos=None, source="bsd", league="league_19", season="296"):
+    """Totales por partido (tarjetas, faltas, entradas, pases) de los últimos `max_partidos` del equipo."""
+    columnas = ["match_id", "match_date"] + list(CAMPOS_DISCIPLINA.values())
+    if matches_df is None or matches_df.empty:
+        return pd.DataFrame(columns=columnas)
+    partidos = _partidos_jugados(equipo_nombre, matches_df)
+    if max_partidos is not None:
+        partidos = partidos.tail(max_partidos)
+    mids = partidos["match_id"].tolist()
+    players = descargar_dataset_partidos("player-stats", mids, source, league, season)
+    filas = []
+    for mid in mids:
+        if mid not in players:
+            continue    # descarga fallida: no se cachea un partido vacío
+        agregados = agregados_equipos_partido(players[mid], (source, league, season, mid))
+        if equipo_nombre in agregados.index:
+            filas.append({"match_id": mid, **agregados.loc[equipo_nombre].to_dict()})
+    df = pd.DataFrame(filas, columns=[c for c in columnas if c != "match_date"])
+    fechas = partidos.set_index("match_id")["match_date"] if "match_date" in partidos.columns else pd.Series(dtype=object)
+    df.insert(1, "match_date", df["match_id"].map(fechas))
+    return df.sort_values("match_date", ascending=False, na_position="last").reset_index(drop=True)
+
+
+# =========================
+# AGREGADOS DE TEMPORADA POR EQUIPO
+# =========================
+# Cada partido jugado se reduce una vez a dos filas (una por equipo) con
+# tiros, tiros a puerta, goles y xG a favor y en contra, y esas filas quedan
+# en CACHE_TIROS_PARTIDO. La tabla de temporada y el cara a cara son sumas
+# sobre las filas ya reducidas: comparar dos equipos no descarga eventos.
+COLUMNAS_EQUIPO_PARTIDO = [
+    "match_id", "match_date", "team", "opponent",
+    "shots", "shots_on_target", "goals", "xg",
+    "shots_against", "shots_on_target_against", "goals_against", "xg_against",
+]
+_CONTEOS_EQUIPO = ["shots", "shots_on_target", "goals", "shots_against", "shots_on_target_against", "goals_against"]
+CACHE_TIROS_PARTIDO = CacheTTL(ttl=3600, max_entradas=4096)
+
+
+def filas_equipos_partidos(shots_por_partido, partidos):
+    """Filas (partido, equipo) de varios partidos en una sola pasada; `partidos` indexado por match_id."""
+    mids = [m for m in shots_por_partido if m in partidos.index]
+    if not mids:
+        return pd.DataFrame(columns=COLUMNAS_EQUIPO_PARTIDO)
+    jugados = partidos.loc[mids]
+    fechas = jugados["match_date"] if "match_date" in jugados.columns else None
+    base = pd.concat([
+        pd.DataFrame({"match_id": mids, "match_date": fechas, "team": jugados["home_team_name"], "opponent": jugados["away_team_name"]}),
+        pd.DataFrame({"match_id": mids, "match_date": fechas, "team": jugados["away_team_name"], "opponent": jugados["home_team_name"]}),
+    ], ignore_index=True)
+
+    tiros = pd.DataFrame(
+        [(mid, extract_name_from_maybe_dict(s.get("team")), s.get("xG"), s.get("type"))
+         for mid in mids for s in shots_por_partido[mid]],
+        columns=["match_id", "team", "xg", "result"],
+    )
+    resultado = tiros["result"].fillna("").astype(str)
+    a_favor = tiros.assign(
+        xg=pd.to_numeric(tiros["xg"], errors="coerce").fillna(0.0),
+        gol=resultado.str.contains("goal", case=False),
+        a_puerta=resultado.str.contains("goal|save", case=False),
+    ).groupby(["match_id", "team"]).agg(
+        shots=("xg", "size"), shots_on_target=("a_puerta", "sum"), goals=("gol", "sum"), xg=("xg", "sum"))
+    en_contra = a_favor.rename_axis(["match_id", "opponent"]).add_suffix("_against")
+
+    filas = base.join(a_favor, on=["match_id", "team"]).join(en_contra, on=["match_id", "opponent"])
+    filas[_CONTEOS_EQUIPO] = filas[_CONTEOS_EQUIPO].fillna(0).astype("int32")
+    filas[["xg", "xg_against"]] = filas[["xg", "xg_against"]].fillna(0.0)
+    return filas.reindex(columns=COLUMNAS_EQUIPO_PARTIDO)
+
+
+def agregar_equipos(filas):
+    """Totales por equipo con medias por 90' (un partido = 90') y ratios de tiro."""
+    g = filas.groupby("team")
+    tabla = g[_CONTEOS_EQUIPO + ["xg", "xg_against"]].sum()
+    tabla.insert(0, "matches", g.size())
+    partidos = tabla["matches"].where(tabla["matches"] > 0)
+    for col in ("shots", "shots_on_target", "goals", "xg", "shots_against", "goals_against", "xg_against"):
+        tabla[f"{col}_p90"] = tabla[col] / partidos
+    tabla["on_target_pct"] = tabla["shots_on_target"] / tabla["shots"].where(tabla["shots"] > 0)
+    tabla["xg_per_shot"] = tabla["xg"] / tabla["shots"].where(tabla["shots"] > 0)
+    tabla["xg_diff"] = tabla["xg"] - tabla["xg_against"]
+    return tabla
+
+
+@no_cachear_incompletos
+@cache_instrumentado(ttl=3600, show_spinner=False)
+def tabla_equipos_temporada(matches_df, source="bsd", league="league_19", season="296"):
+    """(filas por partido y equipo, tabla por equipo) de todos los partidos jugados de la temporada."""
+    if matches_df is None or matches_df.empty:
+        return pd.DataFrame(columns=COLUMNAS_EQUIPO_PARTIDO), agregar_equipos(pd.DataFrame(columns=COLUMNAS_EQUIPO_PARTIDO))
+    jugados = matches_df
+    if "status" in jugados.columns:
+        jugados = jugados[jugados["status"] == "finished"]
+    jugados = jugados.drop_duplicates("match_id").set_index("match_id")
+
+    bloques, faltan, incompleto = [], [], False
+    for mid in jugados.index:
+        filas = CACHE_TIROS_PARTIDO.get((source, league, season, mid))
+        registrar_cache("tiros_partido", filas is not None)
+        if filas is None:
+            faltan.append(mid)
+        else:
+            bloques.append(filas)
+    if faltan:
+        # Solo los partidos descargados se reducen y cachean: un fallo se reintenta en la próxima consulta
+        descargados = descargar_dataset_partidos("shots", faltan, source, league, season)
+        incompleto = len(descargados) < len(faltan)
+        nuevas = filas_equipos_partidos(descargados, jugados)
+        for mid, filas in nuevas.groupby("match_id", sort=False):
+            CACHE_TIROS_PARTIDO.set((source, league, season, mid), filas)
+        bloques.append(nuevas)
+
+    filas = pd.concat(bloques, ignore_index=True) if bloques else pd.DataFrame(columns=COLUMNAS_EQUIPO_PARTIDO)
+    if incompleto:
+        raise DatosIncompletos((filas, agregar_equipos(filas)))
+    return filas, agregar_equipos(filas)
+
+
+def cara_a_cara(equipo_a, equipo_b, filas):
+    """(partidos entre ambos, tabla de los dos equipos restringida a esos partidos)."""
+    pareja = filas["team"].isin([equipo_a, equipo_b]) & filas["opponent"].isin([equipo_a, equipo_b])
+    cruces = filas[pareja & (filas["team"] != filas["opponent"])]
+    partidos = cruces[cruces["team"] == equipo_a].sort_values("match_date", ascending=False, na_position="last")
+    return partidos.reset_index(drop=True), agregar_equipos(cruces).reindex([equipo_a, equipo_b])
@@ -0,0 +1,388 @@
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+
+# =========================
+# CACHE EN PROCESO
+# =========================
+class CacheTTL:
+    """Diccionario LRU con expiración, seguro entre hilos (sesiones de Streamlit).
+
+    Complementa a `st.cache_data`: guarda piezas finas (p. ej. los eventos de
+    un partido) que varias consultas distintas reutilizan.
+    """
+
+    def __init__(self, ttl=3600, max_entradas=20_000):
+        self.ttl = ttl
+        self.max_entradas = max_entradas
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, clave, default=None):
+        with self._lock:
+            item = self._datos.get(clave)
+            if item is None:
+                return default
+            expira, valor = item
+            if expira < time.monotonic():
+                del self._datos[clave]
+                return default
+            self._datos.move_to_end(clave)
+            return valor
+
+    def set(self, clave, valor):
+        with self._lock:
+            self._datos[clave] = (time.monotonic() + self.ttl, valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.max_entradas:
+                self._datos.popitem(last=False)
+
+    def _guardar_cargado(self, clave, valor, vacio):
+        # Un valor vacío se guarda como si tuviera ttl_vacio s de vigencia
+        guardado = time.monotonic()
+        if vacio is not None and vacio(valor):
+            guardado -= self.ttl - self.ttl_vacio
+        self._guardar(clave, valor, guardado)
+
+    def clear(self):
+        with self._lock:
+            self._datos.clear()
+
+    def __len__(self):
+        return len(self._datos)
+
+
+# =========================
+# SINGLE-FLIGHT
+# =========================
+# Cuando termina un partido muchas sesiones piden a la vez lo mismo y todas
+# fallan la cache al mismo tiempo. Con `UnVuelo` la primera petición de una
+# clave la ejecuta y las concurrentes con la misma clave esperan su resultado
+# (o su excepción) en vez de repetirla. No guarda nada: al terminar el vuelo la
+# clave queda libre y de la cache se encargan las capas de arriba.
+class Vuelo:
+    def __init__(self):
+        self.listo = threading.Event()
+        self.resultado = None
+        self.error = None
+
+    def esperar(self):
+        self.listo.wait()
+        if self.error is not None:
+            raise self.error
+        return self.resultado
+
+
+class UnVuelo:
+    """Ejecuciones en curso por clave, compartidas por los hilos que la piden a la vez."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._vuelos = {}
+
+    def reclamar(self, claves):
+        """(claves que este hilo debe traer, {clave: Vuelo} ya en curso en otro hilo)."""
+        propias, ajenas = [], {}
+        with self._lock:
+            for clave in claves:
+                vuelo = self._vuelos.get(clave)
+                if vuelo is None:
+                    self._vuelos[clave] = Vuelo()
+                    propias.append(clave)
+                else:
+                    ajenas[clave] = vuelo
+        return propias, ajenas
+
+    def terminar(self, clave, resultado=None, error=None):
+        """Publica el resultado de una clave reclamada y despierta a quienes la esperan."""
+        with self._lock:
+            vuelo = self._vuelos.pop(clave)
+        vuelo.resultado, vuelo.error = resultado, error
+        vuelo.listo.set()
+
+    def hacer(self, clave, funcion):
+        """(funcion(), compartido): si la clave ya está en vuelo se espera ese resultado."""
+        propias, ajenas = self.reclamar([clave])
+        if ajenas:
+            return ajenas[clave].esperar(), True
+        try:
+            resultado = funcion()
+        except BaseException as ex:
+            self.terminar(clave, error=ex)
+            raise
+        self.terminar(clave, resultado)
+        return resultado, False
+
+    def __len__(self):
+        return len(self._vuelos)
+
+
+# =========================
+# CACHE CON REVALIDACIÓN EN SEGUNDO PLANO
+# =========================
+# stale-while-revalidate: al vencer el TTL el valor anterior se sigue
+# sirviendo al instante y un hilo del proceso lo recarga; la siguiente lectura
+# ve el valor nuevo. Solo hay una recarga en curso por clave, la pidan cuantas
+# sesiones la pidan, y una recarga fallida (excepción) deja el anterior y se
+# reintenta pasado `reintento`. Un valor `vacio` es una respuesta válida: se
+# guarda, pero vence a los `ttl_vacio` s. La primera carga de una clave sí
+# bloquea, con un lock por clave para que las sesiones concurrentes esperen a
+# una sola descarga en vez de repetirla.
+class CacheRevalidada:
+    """Valores por clave que se sirven vencidos (hasta `max_obsoleto` s) mientras se recargan."""
+
+    def __init__(self, ttl=3600, max_obsoleto=24 * 3600, reintento=60, ttl_vacio=60, max_entradas=1024, hilos=2):
+        self.ttl = ttl
+        self.ttl_vacio = ttl_vacio
+        self.max_obsoleto = max_obsoleto
+        self.reintento = reintento
+        self.max_entradas = max_entradas
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+        self._locks_carga = {}
+        self._revalidando = set()
+        self._hilos = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="tactisense-revalidar")
+
+    def _guardar(self, clave, valor, guardado):
+        with self._lock:
+            self._datos[clave] = (guardado, valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.max_entradas:
+                self._datos.popitem(last=False)
+
+    def _guardar_cargado(self, clave, valor, vacio):
+        # Un valor vacío se guarda como si tuviera ttl_vacio s de vigencia
+        guardado = time.monotonic()
+        if vacio is not None and vacio(valor):
+            guardado -= self.ttl - self.ttl_vacio
+        self._guardar(clave, valor, guardado)
+
+    def _leer(self, clave, cargar, vacio):
+        """(valor, estado) sin bloquear: "hit", "obsoleto" o (None, "miss") si no hay valor servible."""
+        with self._lock:
+            item = self._datos.get(clave)
+            if item is None:
+                return None, "miss"
+            guardado, valor = item
+            edad = time.monotonic() - guardado
+            if edad >= self.ttl + self.max_obsoleto:
+                return None, "miss"
+            self._datos.move_to_end(clave)
+            if edad < self.ttl:
+                return valor, "hit"
+            if clave not in self._revalidando:
+                self._revalidando.add(clave)
+                self._hilos.submit(self._revalidar, clave, cargar, vacio, valor)
+            return valor, "obsoleto"
+
+    def _revalidar(self, clave, cargar, vacio, anterior):
+        try:
+            valor = cargar()
+        except Exception:
+            # Se conserva el valor anterior como vigente hasta el próximo intento
+            self._guardar(clave, anterior, time.monotonic() - self.ttl + self.reintento)
+        else:
+            self._guardar_cargado(clave, valor, vacio)
+        with self._lock:
+            self._revalidando.discard(clave)
+
+    def obtener(self, clave, cargar, vacio=None):
+        """(valor, estado); estado es "hit", "obsoleto" (se lanzó la recarga) o "miss" (se cargó ahora)."""
+        valor, estado = self._leer(clave, cargar, vacio)
+        if estado != "miss":
+            return valor, estado
+        with self._lock:
+            lock_carga = self._locks_carga.setdefault(clave, threading.Lock())
+        with lock_carga:
+            # Otra sesión pudo completar la carga mientras esperábamos el lock
+            valor, estado = self._leer(clave, cargar, vacio)
+            if estado != "miss":
+                return valor, estado
+            valor = cargar()
+            self._guardar_cargado(clave, valor, vacio)
+            return valor, "miss"
+
+    def disponible(self, clave):
+        """True si `obtener` devolvería un valor sin esperar a la API."""
+        with self._lock:
+            item = self._datos.get(clave)
+            return item is not None and time.monotonic() - item[0] < self.ttl + self.max_obsoleto
+
+    def clear(self):
+        with self._lock:
+            self._datos.clear()
+
+    def __len__(self):
+        return len(self._datos)
+
+
+# =========================
+# CACHE COMPARTIDA ENTRE WORKERS
+# =========================
+# Con varios procesos de Streamlit detrás de un balanceador, cada uno tiene su
+# propia `st.cache_data` y su propia CacheTTL. Esta capa guarda las respuestas
+# JSON de la API (manifest, partidos, eventos por partido) en un almacén común
+# para que la descarga de un worker caliente a los demás. Se elige con
+# TACTISENSE_CACHE_URL:
+#   memoria://             almacén del proceso (pruebas)
+#   file:///ruta/al/dir    un archivo por clave, compartido entre procesos del host
+#   redis://host:6379/0    cualquier servidor compatible con Redis (paquete `redis`)
+# Sin URL la capa queda desactivada y todo funciona como antes.
+DIR_CACHE_DISCO = os.path.join(tempfile.gettempdir(), "tactisense_cache")
+
+
+class BackendMemoria:
+    """Bytes por clave en el propio proceso."""
+
+    def __init__(self):
+        self._datos = {}
+        self._lock = threading.Lock()
+
+    def leer_muchos(self, claves):
+        ahora = time.time()
+        with self._lock:
+            items = [self._datos.get(clave) for clave in claves]
+        return [item[1] if item is not None and item[0] >= ahora else None for item in items]
+
+    def escribir(self, clave, valor, ttl):
+        with self._lock:
+            self._datos[clave] = (time.time() + ttl, valor)
+
+    def limpiar(self):
+        with self._lock:
+            self._datos.clear()
+
+
+class BackendDisco:
+    """Un archivo por clave: 8 bytes con la expiración (epoch) y luego el valor.
+
+    La escritura va a un temporal del mismo directorio y se renombra, así que
+    otro proceso nunca lee un archivo a medio escribir.
+    """
+
+    def __init__(self, directorio=DIR_CACHE_DISCO):
+        self.directorio = directorio
+        os.makedirs(directorio, exist_ok=True)
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, hashlib.sha1(clave.encode("utf-8")).hexdigest())
+
+    def _leer(self, clave, ahora):
+        try:
+            with open(self._ruta(clave), "rb") as f:
+                contenido = f.read()
+        except FileNotFoundError:
+            return None
+        if len(contenido) < 8 or struct.unpack_from(">d", contenido)[0] < ahora:
+            return None
+        return contenido[8:]
+
+    def leer_muchos(self, claves):
+        ahora = time.time()
+        return [self._leer(clave, ahora) for clave in claves]
+
+    def escribir(self, clave, valor, ttl):
+        fd, tmp = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(struct.pack(">d", time.time() + ttl))
+                f.write(valor)
+            os.replace(tmp, self._ruta(clave))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def limpiar(self):
+        for nombre in os.listdir(self.directorio):
+            try:
+                os.unlink(os.path.join(self.directorio, nombre))
+            except FileNotFoundError:
+                pass
+
+
+class BackendRedis:
+    """Adaptador sobre un cliente con la interfaz de `redis.Redis` (get/mget/set/scan_iter/delete)."""
+
+    def __init__(self, cliente, prefijo="tactisense:"):
+        self.cliente = cliente
+        self.prefijo = prefijo
+
+    @classmethod
+    def desde_url(cls, url):
+        import redis
+        return cls(redis.Redis.from_url(url))
+
+    def leer_muchos(self, claves):
+        return self.cliente.mget([self.prefijo + clave for clave in claves])
+
+    def escribir(self, clave, valor, ttl):
+        self.cliente.set(self.prefijo + clave, valor, ex=max(1, int(ttl)))
+
+    def limpiar(self):
+        claves = list(self.cliente.scan_iter(match=self.prefijo + "*"))
+        if claves:
+            self.cliente.delete(*claves)
+
+
+class CacheCompartida:
+    """Valores JSON (comprimidos) sobre un backend de bytes; sin backend no guarda nada.
+
+    Un backend caído cuenta como miss: la app sigue yendo a la API.
+    """
+
+    def __init__(self, backend=None, ttl=3600):
+        self.backend = backend
+        self.ttl = ttl
+        self.errores = 0
+
+    @property
+    def activa(self):
+        return self.backend is not None
+
+    def get_muchos(self, claves):
+        if self.backend is None or not claves:
+            return [None] * len(claves)
+        try:
+            crudos = self.backend.leer_muchos(claves)
+        except Exception:
+            self.errores += 1
+            return [None] * len(claves)
+        return [None if crudo is None else json.loads(zlib.decompress(crudo)) for crudo in crudos]
+
+    def get(self, clave):
+        return self.get_muchos([clave])[0]
+
+    def set(self, clave, valor):
+        if self.backend is None:
+            return
+        try:
+            self.backend.escribir(clave, zlib.compress(json.dumps(valor, separators=(",", ":")).encode("utf-8"), 1), self.ttl)
+        except Exception:
+            self.errores += 1
+
+    def clear(self):
+        if self.backend is not None:
+            self.backend.limpiar()
+
+
+def crear_cache_compartida(url, ttl=3600):
+    """CacheCompartida según TACTISENSE_CACHE_URL; una URL vacía la deja desactivada."""
+    if not url:
+        return CacheCompartida(None, ttl)
+    esquema = urlparse(url).scheme
+    if esquema == "memoria":
+        return CacheCompartida(BackendMemoria(), ttl)
+    if esquema == "file":
+        return CacheCompartida(BackendDisco(urlparse(url).path or DIR_CACHE_DISCO), ttl)
+    if esquema in ("redis", "rediss", "unix"):
+        return CacheCompartida(BackendRedis.desde_url(url), ttl)
+    raise ValueError(f"TACTISENSE_CACHE_URL no reconocida: {url}")
@@ -0,0 +1,94 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from tactisense.instrumentacion import instrumentado
+
+
+# =========================
+# CONSULTAS DE TEMPORADA SOBRE EL ALMACÉN DE EVENTOS
+# =========================
+# Las preguntas de liga completa (rankings de jugadores, uso de formaciones)
+# se resuelven con el motor de consultas de Arrow directamente sobre la vista
+# mapeada de `api.tabla_eventos_temporada`. El filtro y las columnas calculadas
+# se aplican lote a lote durante el escaneo, la agregación es un group_by
+# nativo y solo el resultado (unas decenas de filas) pasa a pandas.
+ES_TIRO = pc.field("type_name") == "Shot"
+
+
+def marca_resultado(tabla, patron):
+    """1 si `result` contiene `patron` (sin distinguir mayúsculas), como en `analisis._calcular_stats_tiros`.
+
+    La expresión regular se evalúa solo sobre los pocos valores distintos de
+    `result`; el escaneo hace una pertenencia a conjunto, mucho más barata.
+    """
+    distintos = pc.unique(tabla["result"]).drop_null()
+    valores = distintos.filter(pc.match_substring_regex(distintos, patron, ignore_case=True))
+    return pc.field("result").isin(valores).cast(pa.int64())
+
+
+def consultar(tabla, filtro=None, columnas=None, por=None, agregados=None, derivadas=None,
+              condicion=None, orden=None, limite=None):
+    """SELECT columnas WHERE filtro GROUP BY por HAVING condicion ORDER BY orden LIMIT limite.
+
+    `columnas` y `derivadas` son {nombre: expresión} (o lista de nombres), las
+    segundas evaluadas tras agregar; `agregados` usa la forma de
+    `pa.Table.group_by().aggregate` y sus columnas se llaman `<col>_<función>`.
+    """
+    if tabla is None or tabla.num_rows == 0:
+        return pd.DataFrame()
+    datos = ds.dataset(tabla).to_table(filter=filtro, columns=columnas)
+    if por is not None:
+        # Sin hilos: "first"/"last" necesitan un orden determinista
+        datos = datos.group_by(por, use_threads=False).aggregate(agregados or [([], "count_all")])
+    if derivadas or condicion is not None:
+        proyeccion = {nombre: pc.field(nombre) for nombre in datos.column_names}
+        proyeccion.update(derivadas or {})
+        datos = ds.dataset(datos).to_table(filter=condicion, columns=proyeccion)
+    if orden:
+        datos = datos.sort_by(orden)
+    if limite is not None:
+        datos = datos.slice(0, limite)
+    return datos.to_pandas()
+
+
+@instrumentado()
+def ranking_tiradores(tabla, min_tiros=20, top=20, metrica="xg_por_tiro"):
+    """Jugadores con al menos `min_tiros` tiros en la temporada, ordenados por `metrica` descendente."""
+    if tabla is None or "result" not in tabla.column_names:
+        return pd.DataFrame()
+    return consultar(
+        tabla,
+        filtro=ES_TIRO,
+        columnas={"player_id": pc.field("player_id"), "player": pc.field("player"),
+                  "team_name": pc.field("team_name"), "xg": pc.field("xg"),
+                  "gol": marca_resultado(tabla, "goal"), "a_puerta": marca_resultado(tabla, "goal|save")},
+        por=["player_id"],
+        agregados=[("player", "last"), ("team_name", "last"), ([], "count_all"),
+                   ("xg", "sum"), ("gol", "sum"), ("a_puerta", "sum")],
+        derivadas={"tiros": pc.field("count_all"),
+                   "xg_por_tiro": pc.divide(pc.field("xg_sum"), pc.field("count_all").cast(pa.float64())),
+                   "goles_menos_xg": pc.subtract(pc.field("gol_sum").cast(pa.float64()), pc.field("xg_sum"))},
+        condicion=pc.field("count_all") >= min_tiros,
+        orden=[(metrica, "descending"), ("tiros", "descending")],
+        limite=top,
+    ).rename(columns={"player_last": "player", "team_name_last": "team_name", "xg_sum": "xg",
+                      "gol_sum": "goles", "a_puerta_sum": "a_puerta"}).drop(columns="count_all", errors="ignore")
+
+
+@instrumentado()
+def uso_formaciones_liga(tabla):
+    """Tiros, goles y xG por formación del equipo que tira, con el número de equipos que la usaron."""
+    if tabla is None or "formation" not in tabla.column_names:
+        return pd.DataFrame()
+    return consultar(
+        tabla,
+        filtro=ES_TIRO & pc.field("formation").is_valid(),
+        columnas={"formation": pc.field("formation"), "team_name": pc.field("team_name"),
+                  "xg": pc.field("xg"), "gol": marca_resultado(tabla, "goal")},
+        por=["formation"],
+        agregados=[("team_name", "count_distinct"), ([], "count_all"), ("xg", "sum"), ("gol", "sum")],
+        derivadas={"xg_por_tiro": pc.divide(pc.field("xg_sum"), pc.field("count_all").cast(pa.float64()))},
+        orden=[("count_all", "descending")],
+    ).rename(columns={"team_name_count_distinct": "equipos", "count_all": "tiros", "xg_sum": "xg", "gol_sum": "goles"})
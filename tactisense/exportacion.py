@@ -0,0 +1,138 @@
+import gzip
+import hashlib
+import os
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+
+from tactisense.instrumentacion import instrumentado
+
+
+# =========================
+# EXPORTACIÓN
+# =========================
+# El archivo se genera solo cuando el usuario pulsa descargar (data= callable)
+# y se guarda en disco por huella de datos + formato: los reruns no serializan
+# nada y una segunda descarga del mismo DataFrame sale de la cache. La
+# escritura va por bloques de filas para no armar un único bytes gigante.
+FORMATOS = {
+    "CSV":        (".csv",     "text/csv"),
+    "CSV (gzip)": (".csv.gz",  "application/gzip"),
+    "Parquet":    (".parquet", "application/vnd.apache.parquet"),
+    "Feather":    (".feather", "application/vnd.apache.arrow.file"),
+}
+FILAS_POR_BLOQUE = 50_000
+MAX_ARCHIVOS_CACHE = 32
+DIR_EXPORTACIONES = os.path.join(tempfile.gettempdir(), "tactisense_exportaciones")
+
+
+def huella_df(df):
+    """Hash estable del contenido (valores, columnas y dtypes) de un DataFrame."""
+    h = hashlib.sha1()
+    h.update(repr((list(df.columns), [str(t) for t in df.dtypes])).encode("utf-8"))
+    try:
+        valores = pd.util.hash_pandas_object(df, index=False).values
+    except TypeError:
+        # Celdas no hasheables (listas, dicts): se hashea su representación
+        valores = pd.util.hash_pandas_object(df.astype(str), index=False).values
+    h.update(valores.tobytes())
+    return h.hexdigest()
+
+
+def _bloques(df):
+    for inicio in range(0, max(len(df), 1), FILAS_POR_BLOQUE):
+        yield df.iloc[inicio:inicio + FILAS_POR_BLOQUE]
+
+
+def _tabla_arrow(df, schema):
+    return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+
+def _schema_arrow(df):
+    try:
+        return df, pa.Schema.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Columnas object con tipos mezclados: se exportan como texto
+        objetos = df.select_dtypes(include="object").columns
+        df = df.astype({c: "string" for c in objetos})
+        return df, pa.Schema.from_pandas(df, preserve_index=False)
+
+
+def _escribir(df, formato, ruta):
+    if formato in ("CSV", "CSV (gzip)"):
+        abrir = gzip.open if formato == "CSV (gzip)" else open
+        with abrir(ruta, "wt", encoding="utf-8", newline="") as f:
+            for i, bloque in enumerate(_bloques(df)):
+                bloque.to_csv(f, header=(i == 0), index=False)
+        return
+    df, schema = _schema_arrow(df)
+    if formato == "Parquet":
+        with pq.ParquetWriter(ruta, schema, compression="zstd") as writer:
+            for bloque in _bloques(df):
+                writer.write_table(_tabla_arrow(bloque, schema))
+    elif formato == "Feather":
+        opciones = pa.ipc.IpcWriteOptions(compression="zstd")
+        with pa.OSFile(ruta, "wb") as sink, pa.ipc.new_file(sink, schema, options=opciones) as writer:
+            for bloque in _bloques(df):
+                writer.write_table(_tabla_arrow(bloque, schema))
+    else:
+        raise ValueError(f"Formato de exportación desconocido: {formato}")
+
+
+def podar_cache():
+    """Deja en DIR_EXPORTACIONES solo los MAX_ARCHIVOS_CACHE archivos usados más recientemente."""
+    # El directorio lo comparten las sesiones y el pool de informes: un archivo puede
+    # reemplazarse o borrarse entre listdir y stat, y un .tmp aún se está escribiendo
+    archivos = []
+    for nombre in os.listdir(DIR_EXPORTACIONES):
+        if nombre.endswith(".tmp"):
+            continue
+        ruta = os.path.join(DIR_EXPORTACIONES, nombre)
+        try:
+            archivos.append((os.path.getmtime(ruta), ruta))
+        except FileNotFoundError:
+            continue
+    archivos.sort(reverse=True)
+    for _, ruta in archivos[MAX_ARCHIVOS_CACHE:]:
+        try:
+            os.remove(ruta)
+        except OSError:
+            pass
+
+
+@instrumentado()
+def generar_exportacion(df, formato):
+    """Ruta al archivo exportado, reutilizando el de la cache si ya existe."""
+    extension, _ = FORMATOS[formato]
+    os.makedirs(DIR_EXPORTACIONES, exist_ok=True)
+    ruta = os.path.join(DIR_EXPORTACIONES, huella_df(df) + extension)
+    try:
+        os.utime(ruta)
+        return ruta
+    except FileNotFoundError:
+        pass    # no existe, o otra sesión acaba de podarlo
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    try:
+        _escribir(df, formato, temporal)
+        os.replace(temporal, ruta)
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+    podar_cache()
+    return ruta
+
+
+def exportar_datos(df, nombre_archivo="datos_exportados.csv"):
+    base = nombre_archivo.rsplit(".", 1)[0]
+    formato = st.selectbox("Formato de exportación", list(FORMATOS), key=f"formato_export_{nombre_archivo}")
+    extension, mime = FORMATOS[formato]
+    st.download_button(
+        label=f"Exportar datos a {formato}",
+        data=lambda: open(generar_exportacion(df, formato), "rb"),
+        file_name=base + extension,
+        mime=mime,
+        on_click="ignore",
+    )
@@ -0,0 +1,92 @@
+import json
+import os
+
+import numpy as np
+
+
+# =========================
+# BIBLIOTECA DE FORMACIONES
+# =========================
+# Se carga una sola vez al importar: POSICIONES es un array (F × 11 × 2) con
+# coordenadas normalizadas (x: de portería propia a rival, y: de banda a banda,
+# portero primero). Distancias y cobertura por zonas se precalculan aquí para
+# que montar la pizarra o puntuar formaciones sea pura indexación.
+RUTA_FORMACIONES = os.path.join(os.path.dirname(__file__), "data", "formaciones.json")
+FORMACION_POR_DEFECTO = "4-3-3"
+
+# Rejilla de zonas: 6 franjas a lo largo (juego de posición) × 5 carriles
+# (bandas, intervalos y carril central).
+ZONAS_LARGO, ZONAS_ANCHO = 6, 5
+SIGMA_COBERTURA = 0.12
+
+
+def cargar_formaciones(ruta=RUTA_FORMACIONES):
+    """Lee un JSON {"formaciones": [{"nombre", "posiciones": [[x, y] × 11]}]}."""
+    with open(ruta, encoding="utf-8") as f:
+        datos = json.load(f)
+    nombres = tuple(f["nombre"] for f in datos["formaciones"])
+    posiciones = np.asarray([f["posiciones"] for f in datos["formaciones"]], dtype="f8")
+    if posiciones.ndim != 3 or posiciones.shape[1:] != (11, 2):
+        raise ValueError(f"{ruta}: cada formación debe tener 11 posiciones [x, y]")
+    return nombres, posiciones
+
+
+def _centros_zonas():
+    cx = (np.arange(ZONAS_LARGO, dtype="f8") + 0.5) / ZONAS_LARGO
+    cy = (np.arange(ZONAS_ANCHO, dtype="f8") + 0.5) / ZONAS_ANCHO
+    return np.stack(np.meshgrid(cx, cy, indexing="ij"), axis=-1)          # (6, 5, 2)
+
+
+def calcular_distancias(posiciones):
+    """Distancias entre jugadores por formación: (F, 11, 11)."""
+    diff = posiciones[:, :, None, :] - posiciones[:, None, :, :]
+    return np.sqrt((diff ** 2).sum(axis=-1))
+
+
+def calcular_ocupacion(posiciones):
+    """Jugadores de campo por zona: (F, ZONAS_LARGO, ZONAS_ANCHO)."""
+    campo = posiciones[:, 1:, :]
+    ix = np.clip((campo[..., 0] * ZONAS_LARGO).astype(int), 0, ZONAS_LARGO - 1)
+    iy = np.clip((campo[..., 1] * ZONAS_ANCHO).astype(int), 0, ZONAS_ANCHO - 1)
+    ocupacion = np.zeros((len(posiciones), ZONAS_LARGO, ZONAS_ANCHO), dtype="f8")
+    f = np.repeat(np.arange(len(posiciones)), campo.shape[1])
+    np.add.at(ocupacion, (f, ix.ravel(), iy.ravel()), 1)
+    return ocupacion
+
+
+def calcular_cobertura(posiciones):
+    """Presencia gaussiana de los jugadores de campo en cada centro de zona: (F, 6, 5)."""
+    centros = _centros_zonas().reshape(-1, 2)                               # (Z, 2)
+    campo = posiciones[:, 1:, :]                                            # (F, 10, 2)
+    d2 = ((campo[:, :, None, :] - centros[None, None, :, :]) ** 2).sum(-1)  # (F, 10, Z)
+    cobertura = np.exp(-d2 / (2 * SIGMA_COBERTURA ** 2)).sum(axis=1)
+    return cobertura.reshape(len(posiciones), ZONAS_LARGO, ZONAS_ANCHO)
+
+
+NOMBRES, POSICIONES = cargar_formaciones()
+INDICE = {n: i for i, n in enumerate(NOMBRES)}
+DISTANCIAS = calcular_distancias(POSICIONES)
+OCUPACION = calcular_ocupacion(POSICIONES)
+COBERTURA = calcular_cobertura(POSICIONES)
+
+
+def indice_formacion(nombre):
+    return INDICE.get(nombre, INDICE[FORMACION_POR_DEFECTO])
+
+
+def transformar(posiciones, width=1.0, height=1.0, espejo=False, invertir=False):
+    """Escala coordenadas normalizadas (…, 2) al lienzo.
+
+    `espejo` refleja a lo largo (equipo que ataca hacia el otro lado) e
+    `invertir` intercambia las bandas. Acepta una formación o la biblioteca entera.
+    """
+    pos = np.array(posiciones, dtype="f8", copy=True)
+    if espejo:
+        pos[..., 0] = 1.0 - pos[..., 0]
+    if invertir:
+        pos[..., 1] = 1.0 - pos[..., 1]
+    return pos * np.array([width, height], dtype="f8")
+
+
+def posiciones_formacion(nombre, width=1.0, height=1.0, espejo=False, invertir=False):
+    return transformar(POSICIONES[indice_formacion(nombre)], width, height, espejo, invertir)
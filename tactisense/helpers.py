@@ -0,0 +1,22 @@
+# =========================
+# HELPERS ROBUSTOS
+# =========================
+def extract_name_from_maybe_dict(v):
+    if isinstance(v, dict):
+        if 'name' in v and isinstance(v['name'], str):
+            return v['name']
+        for val in v.values():
+            if isinstance(val, str):
+                return val
+        return str(v)
+    return v
+
+
+def safe_type_name(x):
+    if isinstance(x, dict):
+        return x.get('name') or x.get('type') or None
+    return x
+
+
+def safe_team_name(x):
+    return extract_name_from_maybe_dict(x)
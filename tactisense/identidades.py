@@ -0,0 +1,175 @@
+import json
+import os
+import tempfile
+import threading
+from collections import Counter, defaultdict
+
+import pandas as pd
+
+from tactisense.helpers import extract_name_from_maybe_dict
+
+
+# =========================
+# IDENTIDADES DE JUGADORES (v1 ↔ v2)
+# =========================
+# /shots identifica al jugador con nombre e id v1 (7 dígitos) y /player-stats
+# solo con id v2 (5 dígitos). Por cada partido y equipo:
+#   - los candidatos v2 de un v1 se intersecan con los v2 presentes en cada
+#     partido en el que tiró (deben haber jugado juntos todos esos partidos);
+#   - un v2 cuyo expected_goals coincide con la suma de xG de los tiros del
+#     v1 en ese partido suma una coincidencia; un v2 con expected_goals 0 se
+#     descarta (quien tiró no puede tener xG nulo).
+# Un v1 queda resuelto con el candidato de más coincidencias (sin empate) o
+# con el único candidato que sobreviva a las intersecciones. La evidencia se
+# guarda en disco por temporada y se amplía partido a partido.
+TOLERANCIA_XG = 0.002
+DIR_IDENTIDADES = os.path.join(tempfile.gettempdir(), "tactisense_identidades")
+COLUMNAS_IDENTIDADES = ["player_id_v1", "player_id_v2", "player_name"]
+
+
+def _entero(valor):
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        return None
+
+
+def _numero(valor):
+    try:
+        return float(valor)
+    except (TypeError, ValueError):
+        return None
+
+
+class IndiceIdentidades:
+    """Correspondencia v1 → v2 de una temporada, construida de forma incremental."""
+
+    def __init__(self, ruta=None):
+        self.ruta = ruta
+        self._lock = threading.Lock()
+        self._partidos = set()
+        self._candidatos = {}
+        self._coincidencias = Counter()
+        self._nombres = {}
+        self._v1_a_v2 = {}
+        self._v2_a_v1 = {}
+        self._tabla = None
+
+    # ---- evidencia ----
+    def registrar_partido(self, mid, shots, players):
+        """Incorpora un partido; devuelve False si ya estaba procesado."""
+        with self._lock:
+            if mid in self._partidos:
+                return False
+            self._partidos.add(mid)
+
+            xg_v1 = defaultdict(lambda: defaultdict(float))
+            for s in shots or []:
+                v1 = _entero(s.get("player_id"))
+                if v1 is None:
+                    continue
+                equipo = extract_name_from_maybe_dict(s.get("team"))
+                xg_v1[equipo][v1] += _numero(s.get("xG")) or 0.0
+                if s.get("player"):
+                    self._nombres[v1] = s["player"]
+            xg_v2 = defaultdict(dict)
+            for p in players or []:
+                v2 = _entero(p.get("player_id"))
+                if v2 is not None:
+                    xg_v2[extract_name_from_maybe_dict(p.get("team"))][v2] = _numero(p.get("expected_goals"))
+
+            tocados = set()
+            for equipo, tiradores in xg_v1.items():
+                presentes = xg_v2.get(equipo)
+                if not presentes:
+                    continue
+                for v1, xg in tiradores.items():
+                    validos = {v2 for v2, eg in presentes.items() if not (eg == 0.0 and xg > 0)}
+                    previos = self._candidatos.get(v1)
+                    self._candidatos[v1] = validos if previos is None else (previos & validos)
+                    for v2, eg in presentes.items():
+                        if eg is not None and xg > 0 and abs(eg - xg) <= TOLERANCIA_XG:
+                            self._coincidencias[(v1, v2)] += 1
+                    tocados.add(v1)
+            for v1 in tocados:
+                self._resolver(v1)
+            if tocados:
+                self._tabla = None
+            return True
+
+    def _resolver(self, v1):
+        candidatos = self._candidatos.get(v1) or set()
+        puntos = sorted(((self._coincidencias.get((v1, v2), 0), v2) for v2 in candidatos), reverse=True)
+        mejor = None
+        if len(puntos) == 1 or (puntos and puntos[0][0] > 0 and puntos[0][0] > puntos[1][0]):
+            mejor = puntos[0][1]
+
+        previo = self._v1_a_v2.pop(v1, None)
+        if previo is not None and self._v2_a_v1.get(previo) == v1:
+            del self._v2_a_v1[previo]
+        if mejor is None:
+            return
+        # Correspondencia uno a uno: si el v2 ya es de otro v1, gana quien tenga más coincidencias
+        otro = self._v2_a_v1.get(mejor)
+        if otro is not None and otro != v1:
+            if self._coincidencias.get((otro, mejor), 0) >= self._coincidencias.get((v1, mejor), 0):
+                return
+            del self._v1_a_v2[otro]
+        self._v1_a_v2[v1] = mejor
+        self._v2_a_v1[mejor] = v1
+
+    # ---- consulta ----
+    def faltantes(self, mids):
+        with self._lock:
+            return [m for m in mids if m not in self._partidos]
+
+    def tabla(self):
+        """DataFrame (player_id_v1, player_id_v2, player_name) con claves enteras, indexado por v2."""
+        with self._lock:
+            if self._tabla is None:
+                filas = [(v1, v2, self._nombres.get(v1)) for v1, v2 in self._v1_a_v2.items()]
+                tabla = pd.DataFrame(filas, columns=COLUMNAS_IDENTIDADES).astype(
+                    {"player_id_v1": "int64", "player_id_v2": "int64"})
+                self._tabla = tabla.set_index("player_id_v2", drop=False)
+            return self._tabla
+
+    def __len__(self):
+        return len(self._v1_a_v2)
+
+    # ---- persistencia ----
+    def guardar(self):
+        if not self.ruta:
+            return
+        with self._lock:
+            datos = {
+                "partidos": sorted(self._partidos),
+                "candidatos": {str(v1): sorted(c) for v1, c in self._candidatos.items()},
+                "coincidencias": [[v1, v2, n] for (v1, v2), n in self._coincidencias.items()],
+                "nombres": {str(v1): n for v1, n in self._nombres.items()},
+            }
+        os.makedirs(os.path.dirname(self.ruta), exist_ok=True)
+        temporal = f"{self.ruta}.{os.getpid()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump(datos, f)
+        os.replace(temporal, self.ruta)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Índice desde `ruta`; vacío si el archivo no existe o está dañado."""
+        indice = cls(ruta)
+        try:
+            with open(ruta, encoding="utf-8") as f:
+                datos = json.load(f)
+        except (OSError, ValueError):
+            return indice
+        indice._partidos = set(datos.get("partidos", []))
+        indice._candidatos = {int(v1): set(c) for v1, c in datos.get("candidatos", {}).items()}
+        indice._coincidencias = Counter({(v1, v2): n for v1, v2, n in datos.get("coincidencias", [])})
+        indice._nombres = {int(v1): n for v1, n in datos.get("nombres", {}).items()}
+        for v1 in indice._candidatos:
+            indice._resolver(v1)
+        return indice
+
+
+def ruta_identidades(source, league, season):
+    return os.path.join(DIR_IDENTIDADES, f"{source}_{league}_{season}.json")
@@ -0,0 +1,145 @@
+import threading
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from tactisense.helpers import extract_name_from_maybe_dict
+
+
+# =========================
+# ÍNDICE DE FORMACIONES POR TEMPORADA
+# =========================
+# Cada partido se procesa una sola vez al llegar sus tiros (de la API o de la
+# cache por partido). De los tiros se reconstruye la línea temporal de cada
+# equipo minuto a minuto (la formación de un tiro rige hasta el punto medio
+# con el siguiente) y se acumulan, por equipo:
+#   uso    {formación: [partidos, minutos, tiros]}
+#   cruces {(formación, formación rival): [minutos, tiros_favor, xg_favor,
+#                                           tiros_contra, xg_contra]}
+# Consultar un equipo es leer esos diccionarios: no se vuelve a tocar eventos.
+MINUTOS_PARTIDO = 90
+COLUMNAS_USO = ["formation", "partidos", "minutos", "tiros", "pct_minutos"]
+COLUMNAS_CRUCES = ["formation", "formation_rival", "minutos", "tiros_favor", "xg_favor",
+                   "tiros_contra", "xg_contra", "xg_favor_90", "xg_contra_90"]
+
+
+def _minuto(valor):
+    try:
+        return max(0, int(valor))
+    except (TypeError, ValueError):
+        return None
+
+
+def _xg(valor):
+    try:
+        return float(valor) if valor is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def linea_temporal(minutos, formaciones, duracion):
+    """Formación vigente en cada minuto [0, duracion) a partir de tiros ordenados por minuto."""
+    minutos = np.asarray(minutos, dtype="f8")
+    cortes = (minutos[1:] + minutos[:-1]) / 2.0
+    return np.asarray(formaciones, dtype=object)[np.searchsorted(cortes, np.arange(duracion), side="right")]
+
+
+class IndiceFormaciones:
+    """Uso de formaciones y xG por enfrentamiento de formaciones, por temporada."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._partidos = defaultdict(set)
+        self._uso = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: [0, 0, 0])))
+        self._cruces = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: [0, 0, 0.0, 0, 0.0])))
+
+    def contiene(self, temporada, mid):
+        with self._lock:
+            return mid in self._partidos[temporada]
+
+    def faltantes(self, temporada, mids):
+        with self._lock:
+            indexados = self._partidos[temporada]
+            return [m for m in mids if m not in indexados]
+
+    def registrar_partido(self, temporada, mid, shots):
+        """Incorpora los tiros crudos de un partido; devuelve False si ya estaba indexado."""
+        with self._lock:
+            if mid in self._partidos[temporada]:
+                return False
+            self._partidos[temporada].add(mid)
+
+        por_equipo = defaultdict(list)
+        for s in shots or []:
+            minuto = _minuto(s.get("minute"))
+            equipo = extract_name_from_maybe_dict(s.get("team"))
+            if minuto is not None and equipo:
+                por_equipo[equipo].append((minuto, s.get("formation"), _xg(s.get("xG"))))
+        if not por_equipo:
+            return True
+
+        duracion = max(MINUTOS_PARTIDO, max(m for tiros in por_equipo.values() for m, _, _ in tiros) + 1)
+        lineas = {}
+        for equipo, tiros in por_equipo.items():
+            tiros.sort(key=lambda t: t[0])
+            conocidos = [(m, f) for m, f, _ in tiros if f]
+            if conocidos:
+                lineas[equipo] = linea_temporal(*zip(*conocidos), duracion)
+
+        with self._lock:
+            for equipo, tiros in por_equipo.items():
+                uso = self._uso[temporada][equipo]
+                linea = lineas.get(equipo)
+                if linea is not None:
+                    formaciones, minutos = np.unique(linea, return_counts=True)
+                    for f, n in zip(formaciones, minutos):
+                        uso[f][0] += 1
+                        uso[f][1] += int(n)
+                for _, f, _ in tiros:
+                    if f:
+                        uso[f][2] += 1
+
+            # Cruces: solo con ambas líneas temporales conocidas
+            if len(lineas) == 2:
+                (a, linea_a), (b, linea_b) = lineas.items()
+                for propio, rival, linea_p, linea_r in ((a, b, linea_a, linea_b), (b, a, linea_b, linea_a)):
+                    cruces = self._cruces[temporada][propio]
+                    pares, minutos = np.unique(np.char.add(linea_p.astype(str), "|" + linea_r.astype(str)),
+                                               return_counts=True)
+                    for par, n in zip(pares, minutos):
+                        cruces[tuple(par.split("|", 1))][0] += int(n)
+                    for m, f, xg in por_equipo[propio]:
+                        clave = (f or linea_p[m], linea_r[m])
+                        cruces[clave][1] += 1
+                        cruces[clave][2] += xg
+                    for m, f, xg in por_equipo[rival]:
+                        clave = (linea_p[m], f or linea_r[m])
+                        cruces[clave][3] += 1
+                        cruces[clave][4] += xg
+        return True
+
+    def uso(self, temporada, equipo):
+        """Formaciones del equipo ordenadas por minutos jugados con ellas."""
+        with self._lock:
+            filas = [[f, *v] for f, v in self._uso[temporada].get(equipo, {}).items()]
+        df = pd.DataFrame(filas, columns=COLUMNAS_USO[:-1])
+        total = df["minutos"].sum()
+        df["pct_minutos"] = 100.0 * df["minutos"] / total if total else 0.0
+        return df.sort_values(["minutos", "tiros"], ascending=False).reset_index(drop=True)
+
+    def cruces(self, temporada, equipo):
+        """xG a favor y en contra por (formación propia, formación rival), con tasas por 90'."""
+        with self._lock:
+            filas = [[f, g, *v] for (f, g), v in self._cruces[temporada].get(equipo, {}).items()]
+        df = pd.DataFrame(filas, columns=COLUMNAS_CRUCES[:-2])
+        por_90 = 90.0 / df["minutos"].where(df["minutos"] > 0)
+        df["xg_favor_90"] = df["xg_favor"] * por_90
+        df["xg_contra_90"] = df["xg_contra"] * por_90
+        return df.sort_values("minutos", ascending=False).reset_index(drop=True)
+
+    def clear(self):
+        with self._lock:
+            self._partidos.clear()
+            self._uso.clear()
+            self._cruces.clear()
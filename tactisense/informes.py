@@ -0,0 +1,288 @@
+"""Informes de scouting en lote: el radar de cada jugador de un plantel o de una liga.
+
+    $ python -m tactisense.informes --liga "Liga MX · Apertura 2025" --equipo "Club América" --salida america.pdf
+    $ python -m tactisense.informes --liga "Liga MX · Apertura 2025" --ambito liga --formato zip --salida liga.zip
+"""
+import argparse
+import concurrent.futures
+import io
+import multiprocessing
+import os
+import re
+import shutil
+import threading
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from tactisense.instrumentacion import instrumentado
+
+
+# =========================
+# MÉTRICAS DEL RADAR PARA TODO EL PLANTEL
+# =========================
+# Las mismas métricas 0-100 que `calcular_metricas_jugador`, pero para todos los
+# jugadores de una vez: un groupby sobre los tiros en lugar de recorrer el
+# DataFrame una vez por jugador (y otra por cada jugador dentro de esa). En el
+# ámbito de liga las sumas ya están en la vista de líderes y no se toca un evento.
+METRICAS_RADAR = ["xG", "Tiros", "Goles", "A Puerta", "Precisión", "xG/Tiro"]
+_SUMAS = ["tiros", "a_puerta", "goles", "xg"]
+
+
+def sumas_tiros_jugadores(df_eventos):
+    """Tiros, a puerta, goles y xG por jugador (índice: nombre); 0 para quien no tiró."""
+    jugadores = pd.Index(df_eventos["player"].dropna().unique(), name="player")
+    tiros = df_eventos[df_eventos["type_name"] == "Shot"]
+    if "result" in tiros.columns:
+        resultado = tiros["result"].astype("string")
+        marcas = pd.DataFrame({"goles": resultado.str.contains("goal", case=False, na=False),
+                               "a_puerta": resultado.str.contains("goal|save", case=False, na=False)})
+    else:
+        marcas = pd.DataFrame({"goles": False, "a_puerta": False}, index=tiros.index)
+    marcas["xg"] = pd.to_numeric(tiros["xg"], errors="coerce") if "xg" in tiros.columns else 0.0
+    marcas["tiros"] = 1
+    sumas = marcas.groupby(tiros["player"]).sum(min_count=0)
+    return sumas.reindex(jugadores, fill_value=0)[_SUMAS].astype(float)
+
+
+def normalizar_metricas(sumas):
+    """Métricas del radar (0-100, respecto al máximo de `sumas`) con el índice de `sumas`."""
+    tiros = sumas["tiros"].to_numpy(dtype=float)
+    xg = sumas["xg"].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crudas = np.column_stack([
+            xg, tiros, sumas["goles"].to_numpy(dtype=float), sumas["a_puerta"].to_numpy(dtype=float),
+            np.where(tiros > 0, sumas["a_puerta"].to_numpy(dtype=float) / tiros * 100, 0.0),
+            np.where(tiros > 0, xg / tiros, 0.0),
+        ])
+    maximos = crudas.max(axis=0) if len(crudas) else np.ones(len(METRICAS_RADAR))
+    normalizadas = [[round(100 * v / m, 1) if m > 0 else 0.0 for v, m in zip(fila, maximos)]
+                    for fila in crudas.tolist()]
+    return pd.DataFrame(normalizadas, index=sumas.index, columns=METRICAS_RADAR)
+
+
+def _con_nombre(metricas):
+    # Las PlayerStat sin identidad v1 ↔ v2 resuelta solo traen el id numérico
+    return metricas[[not str(j).isdigit() for j in metricas.index]].sort_index()
+
+
+@instrumentado("informes.metricas_equipo")
+def metricas_equipo(df_eventos, equipo=None):
+    """Radar de cada jugador de `equipo` normalizado con todos los de `df_eventos`, igual que en el Scout Report.
+
+    `df_eventos` son los partidos del equipo e incluye a los rivales; sin
+    `equipo` el informe los lleva también.
+    """
+    if df_eventos is None or df_eventos.empty:
+        return pd.DataFrame(columns=METRICAS_RADAR)
+    metricas = normalizar_metricas(sumas_tiros_jugadores(df_eventos))
+    if equipo and "team_name" in df_eventos.columns:
+        plantel = df_eventos.loc[df_eventos["team_name"] == equipo, "player"].dropna().unique()
+        metricas = metricas[metricas.index.isin(plantel)]
+    return _con_nombre(metricas)
+
+
+@instrumentado("informes.metricas_liga")
+def metricas_liga(tabla_lideres, equipo=None, min_tiros=1):
+    """Radares normalizados contra toda la liga a partir de `VistaLideres.tabla()`; `equipo` filtra el plantel."""
+    if tabla_lideres is None or tabla_lideres.empty:
+        return pd.DataFrame(columns=METRICAS_RADAR)
+    metricas = normalizar_metricas(tabla_lideres.set_index("player")[_SUMAS])
+    incluidos = (tabla_lideres["tiros"] >= min_tiros).to_numpy()
+    if equipo:
+        incluidos &= (tabla_lideres["team_name"] == equipo).to_numpy()
+    return _con_nombre(metricas[incluidos])
+
+
+# =========================
+# RENDER EN UN POOL DE PROCESOS
+# =========================
+# Dibujar un radar con Agg cuesta ~0,15 s de CPU aun reutilizando el lienzo
+# (ver `_dibujar_lote`) y matplotlib no libera el GIL, así que los radares se
+# reparten en lotes entre procesos. El pool se crea la
+# primera vez y queda vivo: los workers importan matplotlib y las
+# visualizaciones una sola vez por proceso del servidor. Con
+# `procesos=1` (o una sola CPU) se dibuja en el propio proceso. Cada worker
+# devuelve PNGs; el PDF de varias páginas se arma después con Pillow.
+FORMATOS_INFORME = {
+    "PDF":       (".pdf", "application/pdf"),
+    "PNG (ZIP)": (".zip", "application/zip"),
+}
+PROCESOS_INFORMES = int(os.getenv("TACTISENSE_INFORMES_PROCESOS", "0")) or min(4, os.cpu_count() or 1)
+DPI_INFORME = 120
+_POOL = None
+_LOCK_POOL = threading.Lock()
+
+
+def _iniciar_worker():
+    import matplotlib
+    matplotlib.use("Agg")
+    import tactisense.visualizaciones  # noqa: F401  (se paga el import al arrancar, no en el primer lote)
+
+
+def _dibujar_lote(lote, dpi):
+    """[(jugador, {métrica: valor})] → [PNG en bytes], en el mismo orden.
+
+    El lienzo (rejilla, ejes y etiquetas) es el mismo para todos los jugadores
+    con las mismas métricas: se crea y se ajusta (tight_layout) una vez, y por
+    jugador solo se dibujan y se quitan el polígono, los valores y el título.
+    """
+    import matplotlib.pyplot as plt
+    from tactisense.visualizaciones import _lienzo_radar, _trazar_radar
+
+    lienzos, pngs = {}, []
+    try:
+        for jugador, metricas in lote:
+            etiquetas = tuple(metricas)
+            nuevo = etiquetas not in lienzos
+            if nuevo:
+                lienzos[etiquetas] = _lienzo_radar(list(etiquetas))
+            fig, ax, angulos = lienzos[etiquetas]
+            artistas = _trazar_radar(ax, angulos, metricas.values(), jugador)
+            if nuevo:
+                fig.tight_layout()
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format="png", dpi=dpi, facecolor=fig.get_facecolor())
+            pngs.append(buffer.getvalue())
+            for artista in artistas:
+                artista.remove()
+    finally:
+        for fig, _, _ in lienzos.values():
+            plt.close(fig)
+    return pngs
+
+
+def _pool(procesos):
+    global _POOL
+    with _LOCK_POOL:
+        if _POOL is None or _POOL._max_workers != procesos:
+            if _POOL is not None:
+                _POOL.shutdown(wait=False)
+            # forkserver: los workers no heredan los hilos del servidor de Streamlit
+            metodo = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _POOL = concurrent.futures.ProcessPoolExecutor(
+                max_workers=procesos, mp_context=multiprocessing.get_context(metodo),
+                initializer=_iniciar_worker)
+        return _POOL
+
+
+def _lotes(elementos, n_lotes):
+    tamano = -(-len(elementos) // max(1, n_lotes))
+    return [elementos[i:i + tamano] for i in range(0, len(elementos), max(1, tamano))]
+
+
+@instrumentado("informes.radares")
+def dibujar_radares(metricas, dpi=DPI_INFORME, procesos=None):
+    """PNG del radar de cada fila de `metricas` (índice: jugador), en el orden de la tabla."""
+    procesos = procesos or PROCESOS_INFORMES
+    elementos = [(str(jugador), fila) for jugador, fila in zip(metricas.index, metricas.to_dict("records"))]
+    if procesos <= 1 or len(elementos) <= 1:
+        return _dibujar_lote(elementos, dpi)
+    # Dos lotes por worker: si uno va más lento, el otro worker toma el lote que queda
+    futuros = [_pool(procesos).submit(_dibujar_lote, lote, dpi) for lote in _lotes(elementos, 2 * procesos)]
+    try:
+        return [png for futuro in futuros for png in futuro.result()]
+    except concurrent.futures.process.BrokenProcessPool:
+        global _POOL
+        with _LOCK_POOL:
+            _POOL = None
+        raise
+
+
+def _nombre_archivo(k, jugador):
+    return f"{k:02d}_{re.sub(r'[^0-9A-Za-z]+', '_', jugador).strip('_') or 'jugador'}.png"
+
+
+def empaquetar(jugadores, pngs, formato, dpi=DPI_INFORME):
+    """Bytes del informe: un PDF con una página por radar o un ZIP con un PNG por jugador."""
+    salida = io.BytesIO()
+    if formato == "PDF":
+        from PIL import Image
+
+        paginas = [Image.open(io.BytesIO(png)).convert("RGB") for png in pngs]
+        if paginas:
+            paginas[0].save(salida, "PDF", save_all=True, append_images=paginas[1:], resolution=dpi, quality=92)
+    elif formato == "PNG (ZIP)":
+        # Los PNG ya van comprimidos: se guardan sin volver a comprimir
+        with zipfile.ZipFile(salida, "w", zipfile.ZIP_STORED) as zf:
+            for k, (jugador, png) in enumerate(zip(jugadores, pngs), 1):
+                zf.writestr(_nombre_archivo(k, jugador), png)
+    else:
+        raise ValueError(f"Formato de informe desconocido: {formato}")
+    return salida.getvalue()
+
+
+@instrumentado()
+def generar_informe(metricas, formato="PDF", dpi=DPI_INFORME, procesos=None):
+    """Ruta al informe de `metricas`; como las exportaciones, se guarda en disco por huella y formato."""
+    from tactisense.exportacion import DIR_EXPORTACIONES, huella_df, podar_cache
+
+    extension, _ = FORMATOS_INFORME[formato]
+    os.makedirs(DIR_EXPORTACIONES, exist_ok=True)
+    tabla = metricas.reset_index(names="player")
+    ruta = os.path.join(DIR_EXPORTACIONES, f"radares_{huella_df(tabla)}_{dpi}{extension}")
+    try:
+        os.utime(ruta)
+        return ruta
+    except FileNotFoundError:
+        pass    # no existe, o otra sesión acaba de podarlo
+    datos = empaquetar([str(j) for j in metricas.index], dibujar_radares(metricas, dpi, procesos), formato, dpi)
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    try:
+        with open(temporal, "wb") as f:
+            f.write(datos)
+        os.replace(temporal, ruta)
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+    podar_cache()
+    return ruta
+
+
+# =========================
+# LÍNEA DE COMANDOS
+# =========================
+def _metricas_cli(args):
+    from tactisense import api
+
+    comps = api.cargar_competiciones()
+    fila = comps[comps["competition_name"] == args.liga] if not comps.empty else comps
+    if fila.empty:
+        raise SystemExit(f"Liga desconocida: {args.liga!r}. Disponibles: {', '.join(comps.get('competition_name', []))}")
+    league, season, source = fila.iloc[0][["competition_id", "season_id", "source"]]
+    partidos, equipos = api.extraer_equipos(api.obtener_partidos(league, season, source=source))
+    if args.equipo and args.equipo not in equipos:
+        raise SystemExit(f"Equipo desconocido: {args.equipo!r}. Disponibles: {', '.join(equipos)}")
+    if args.ambito == "equipo":
+        if not args.equipo:
+            raise SystemExit("--ambito equipo necesita --equipo")
+        eventos = api._obtener_datos_eventos_por_nombre(args.equipo, partidos, args.partidos, source, league, season)
+        return metricas_equipo(api.unir_identidades(eventos, source, league, season), args.equipo)
+    vista, identidades = api.lideres_temporada(partidos, source, league, season)
+    return metricas_liga(vista.tabla(identidades), equipo=args.equipo, min_tiros=args.min_tiros)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--liga", required=True, help="Nombre de la competición, como en el selector de la app.")
+    parser.add_argument("--equipo", help="Plantel del informe; sin él, con --ambito liga, sale toda la liga.")
+    parser.add_argument("--ambito", choices=["equipo", "liga"], default="equipo",
+                        help="equipo: normalizado dentro del plantel (últimos --partidos); liga: contra toda la temporada.")
+    parser.add_argument("--partidos", type=int, default=10)
+    parser.add_argument("--min-tiros", type=int, default=1, help="Solo con --ambito liga.")
+    parser.add_argument("--formato", choices=["pdf", "zip"], default="pdf")
+    parser.add_argument("--dpi", type=int, default=DPI_INFORME)
+    parser.add_argument("--procesos", type=int, default=None)
+    parser.add_argument("--salida", required=True)
+    args = parser.parse_args()
+
+    # Las funciones que viajan al pool tienen que ser las del módulo importado, no las de __main__
+    from tactisense import informes
+
+    metricas = informes._metricas_cli(args)
+    if metricas.empty:
+        raise SystemExit("No hay jugadores con eventos para ese filtro.")
+    ruta = informes.generar_informe(metricas, "PDF" if args.formato == "pdf" else "PNG (ZIP)", args.dpi, args.procesos)
+    shutil.copyfile(ruta, args.salida)
+    print(f"{len(metricas)} radares → {args.salida}")
@@ -0,0 +1,305 @@
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+
+from tactisense.cache import CacheRevalidada
+
+
+# =========================
+# INSTRUMENTACIÓN POR RERUN
+# =========================
+# Cada rerun de Streamlit corre en el hilo de su sesión: el registro del rerun
+# vive en un threading.local y, en paralelo, se acumula en un registro global
+# del proceso (contadores monótonos, listos para Prometheus).
+class Registro:
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.secciones = {}
+        self.cache = {}
+        self.http_peticiones = 0
+        self.http_bytes = 0
+        self.coalescidas = {}
+        self.resiliencia = {}
+        self.reruns = 0
+
+    def sumar_seccion(self, nombre, segundos):
+        s = self.secciones.setdefault(nombre, {"llamadas": 0, "total_s": 0.0, "max_s": 0.0})
+        s["llamadas"] += 1
+        s["total_s"] += segundos
+        s["max_s"] = max(s["max_s"], segundos)
+
+    def sumar_cache(self, nombre, hit):
+        c = self.cache.setdefault(nombre, {"hits": 0, "misses": 0})
+        c["hits" if hit else "misses"] += 1
+
+    def sumar_http(self, n_bytes):
+        self.http_peticiones += 1
+        self.http_bytes += n_bytes
+
+    def sumar_coalescidas(self, capa, n):
+        self.coalescidas[capa] = self.coalescidas.get(capa, 0) + n
+
+    def sumar_resiliencia(self, evento):
+        self.resiliencia[evento] = self.resiliencia.get(evento, 0) + 1
+
+    def a_dict(self):
+        return {
+            "duracion_s": round(time.perf_counter() - self.inicio, 6),
+            "secciones": self.secciones,
+            "cache": self.cache,
+            "http": {"peticiones": self.http_peticiones, "bytes": self.http_bytes},
+            "coalescidas": self.coalescidas,
+            "resiliencia": self.resiliencia,
+        }
+
+
+_local = threading.local()
+_lock_global = threading.Lock()
+REGISTRO_GLOBAL = Registro()
+
+
+def registro_actual():
+    reg = getattr(_local, "registro", None)
+    if reg is None:
+        reg = _local.registro = Registro()
+    return reg
+
+
+def iniciar_rerun():
+    """Abre un registro limpio para el rerun que arranca en este hilo."""
+    _local.registro = Registro()
+    with _lock_global:
+        REGISTRO_GLOBAL.reruns += 1
+    return _local.registro
+
+
+def _registrar(metodo, *args):
+    getattr(registro_actual(), metodo)(*args)
+    with _lock_global:
+        getattr(REGISTRO_GLOBAL, metodo)(*args)
+
+
+def registrar_tiempo(seccion, segundos):
+    _registrar("sumar_seccion", seccion, segundos)
+
+
+@contextmanager
+def medir(seccion):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar_tiempo(seccion, time.perf_counter() - t0)
+
+
+def instrumentado(seccion=None):
+    """Decorador: mide cada llamada bajo `seccion` (por defecto, el nombre de la función)."""
+    def deco(func):
+        nombre = seccion or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with medir(nombre):
+                return func(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+def registrar_http(n_bytes):
+    _registrar("sumar_http", n_bytes)
+
+
+def registrar_cache(nombre, hit):
+    _registrar("sumar_cache", nombre, hit)
+
+
+def registrar_resiliencia(evento):
+    """Fallos de la API, rechazos del disyuntor, respuestas 429 y esperas por cupo."""
+    _registrar("sumar_resiliencia", evento)
+
+
+def registrar_coalescidas(capa, n=1):
+    """Peticiones que esperaron una descarga idéntica ya en curso en vez de repetirla."""
+    if n:
+        _registrar("sumar_coalescidas", capa, n)
+
+
+def cache_instrumentado(seccion=None, **kwargs_cache):
+    """Equivalente a `st.cache_data(**kwargs_cache)` que además cuenta hits y misses.
+
+    Un miss es una llamada en la que el cuerpo de la función llegó a ejecutarse;
+    el tiempo de un hit es el costo de hashear argumentos y deserializar.
+    """
+    def deco(func):
+        nombre = seccion or func.__name__
+
+        @functools.wraps(func)
+        def cuerpo(*args, **kwargs):
+            _local.ejecuciones = getattr(_local, "ejecuciones", 0) + 1
+            return func(*args, **kwargs)
+
+        cacheada = st.cache_data(**kwargs_cache)(cuerpo)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            antes = getattr(_local, "ejecuciones", 0)
+            t0 = time.perf_counter()
+            try:
+                return cacheada(*args, **kwargs)
+            finally:
+                hit = getattr(_local, "ejecuciones", 0) == antes
+                registrar_tiempo(f"{nombre} ({'hit' if hit else 'miss'})", time.perf_counter() - t0)
+                registrar_cache(nombre, hit)
+
+        wrapper.clear = cacheada.clear
+        return wrapper
+    return deco
+
+
+def cache_revalidada(seccion=None, ttl=3600, max_obsoleto=24 * 3600, vacio=None, ttl_vacio=60):
+    """Como `cache_instrumentado`, pero con stale-while-revalidate (ver `CacheRevalidada`).
+
+    Para cargas desde la API con argumentos hashables: vencido el TTL se
+    devuelve el valor anterior y la recarga corre en segundo plano. Un valor
+    vencido cuenta como hit; su tiempo va a "<nombre> (obsoleto)" y el de la
+    recarga a "<nombre> (revalidación)". Un resultado para el que `vacio`
+    es verdadero se guarda solo `ttl_vacio` s; una excepción no se guarda.
+    `wrapper.disponible(...)` dice si la llamada con esos argumentos
+    respondería sin esperar a la red.
+    """
+    def deco(func):
+        nombre = seccion or func.__name__
+        firma = inspect.signature(func)
+        cache = CacheRevalidada(ttl=ttl, max_obsoleto=max_obsoleto, ttl_vacio=ttl_vacio)
+
+        def clave(args, kwargs):
+            ligados = firma.bind(*args, **kwargs)
+            ligados.apply_defaults()
+            return tuple(ligados.arguments.items())
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            def cargar():
+                if threading.current_thread() is hilo:
+                    return func(*args, **kwargs)
+                with medir(f"{nombre} (revalidación)"):
+                    return func(*args, **kwargs)
+
+            hilo = threading.current_thread()
+            t0 = time.perf_counter()
+            valor, estado = cache.obtener(clave(args, kwargs), cargar, vacio)
+            registrar_tiempo(f"{nombre} ({estado})", time.perf_counter() - t0)
+            registrar_cache(nombre, estado != "miss")
+            return valor
+
+        wrapper.disponible = lambda *args, **kwargs: cache.disponible(clave(args, kwargs))
+        wrapper.clear = cache.clear
+        wrapper.cache = cache
+        return wrapper
+    return deco
+
+
+# =========================
+# EXPORTACIÓN DE MÉTRICAS
+# =========================
+def exportar_json(registro=None):
+    return json.dumps((registro or registro_actual()).a_dict(), indent=2, ensure_ascii=False)
+
+
+def _etiqueta(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def exportar_prometheus(registro=None):
+    """Formato de texto de Prometheus (contadores acumulados del proceso por defecto)."""
+    reg = registro or REGISTRO_GLOBAL
+    with _lock_global:
+        secciones = {k: dict(v) for k, v in reg.secciones.items()}
+        cache = {k: dict(v) for k, v in reg.cache.items()}
+        coalescidas = dict(reg.coalescidas)
+        resiliencia = dict(reg.resiliencia)
+        http_peticiones, http_bytes, reruns = reg.http_peticiones, reg.http_bytes, reg.reruns
+    lineas = [
+        "# HELP tactisense_reruns_total Reruns del script de Streamlit.",
+        "# TYPE tactisense_reruns_total counter",
+        f"tactisense_reruns_total {reruns}",
+        "# HELP tactisense_seccion_segundos_total Tiempo acumulado por sección instrumentada.",
+        "# TYPE tactisense_seccion_segundos_total counter",
+    ]
+    lineas += [f'tactisense_seccion_segundos_total{{seccion="{_etiqueta(k)}"}} {v["total_s"]:.6f}'
+               for k, v in sorted(secciones.items())]
+    lineas += [
+        "# HELP tactisense_seccion_llamadas_total Llamadas por sección instrumentada.",
+        "# TYPE tactisense_seccion_llamadas_total counter",
+    ]
+    lineas += [f'tactisense_seccion_llamadas_total{{seccion="{_etiqueta(k)}"}} {v["llamadas"]}'
+               for k, v in sorted(secciones.items())]
+    lineas += [
+        "# HELP tactisense_cache_total Consultas a st.cache_data por resultado.",
+        "# TYPE tactisense_cache_total counter",
+    ]
+    for k, v in sorted(cache.items()):
+        lineas.append(f'tactisense_cache_total{{funcion="{_etiqueta(k)}",resultado="hit"}} {v["hits"]}')
+        lineas.append(f'tactisense_cache_total{{funcion="{_etiqueta(k)}",resultado="miss"}} {v["misses"]}')
+    lineas += [
+        "# HELP tactisense_http_peticiones_total Peticiones HTTP a la TacticSense API.",
+        "# TYPE tactisense_http_peticiones_total counter",
+        f"tactisense_http_peticiones_total {http_peticiones}",
+        "# HELP tactisense_http_bytes_total Bytes recibidos de la TacticSense API.",
+        "# TYPE tactisense_http_bytes_total counter",
+        f"tactisense_http_bytes_total {http_bytes}",
+        "# HELP tactisense_coalescidas_total Peticiones unidas a una descarga idéntica en curso.",
+        "# TYPE tactisense_coalescidas_total counter",
+    ]
+    lineas += [f'tactisense_coalescidas_total{{capa="{_etiqueta(k)}"}} {v}' for k, v in sorted(coalescidas.items())]
+    lineas += [
+        "# HELP tactisense_resiliencia_total Fallos, rechazos del disyuntor, 429 y esperas por cupo de la API.",
+        "# TYPE tactisense_resiliencia_total counter",
+    ]
+    lineas += [f'tactisense_resiliencia_total{{evento="{_etiqueta(k)}"}} {v}' for k, v in sorted(resiliencia.items())]
+    return "\n".join(lineas) + "\n"
+
+
+# =========================
+# PANEL DE ADMINISTRACIÓN
+# =========================
+def es_admin():
+    """Admin si `?admin=<token>` coincide con TACTISENSE_ADMIN_TOKEN (env o Secrets)."""
+    try:
+        token = os.getenv("TACTISENSE_ADMIN_TOKEN") or st.secrets.get("TACTISENSE_ADMIN_TOKEN")
+    except Exception:
+        token = None
+    return bool(token) and st.query_params.get("admin") == token
+
+
+def panel_instrumentacion():
+    if not es_admin():
+        return
+    reg = registro_actual()
+    datos = reg.a_dict()
+    with st.sidebar.expander("⏱ Instrumentación del rerun", expanded=False):
+        st.caption(f"Rerun: {datos['duracion_s'] * 1000:.0f} ms · "
+                   f"HTTP: {datos['http']['peticiones']} peticiones, {datos['http']['bytes'] / 1024:.1f} KB"
+                   + (f" · {sum(datos['coalescidas'].values())} coalescidas" if datos["coalescidas"] else ""))
+        if datos["secciones"]:
+            filas = sorted(datos["secciones"].items(), key=lambda kv: kv[1]["total_s"], reverse=True)
+            st.dataframe(
+                [{"sección": k, "llamadas": v["llamadas"], "total ms": round(v["total_s"] * 1000, 1),
+                  "máx ms": round(v["max_s"] * 1000, 1)} for k, v in filas],
+                hide_index=True,
+            )
+        if datos["cache"]:
+            st.dataframe(
+                [{"función": k, "hits": v["hits"], "misses": v["misses"]} for k, v in sorted(datos["cache"].items())],
+                hide_index=True,
+            )
+        st.download_button("Exportar JSON", data=exportar_json(reg),
+                           file_name="rerun_metricas.json", mime="application/json")
+        st.download_button("Exportar Prometheus", data=exportar_prometheus(),
+                           file_name="tactisense_metricas.prom", mime="text/plain")
@@ -0,0 +1,179 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pyarrow.compute as pc
+
+from tactisense.consultas import ES_TIRO, consultar, marca_resultado
+from tactisense.instrumentacion import instrumentado
+
+
+# =========================
+# TABLAS DE LÍDERES DE LA LIGA (VISTA MATERIALIZADA)
+# =========================
+# Sumas por jugador de toda la temporada, mantenidas de forma incremental: el
+# almacén de eventos avisa con cada tanda de partidos nuevos (propia o de otro
+# worker) y la vista suma sus agregados. Se guardan dos acumuladores:
+#   tiros  por player_id v1: tiros, a puerta, goles, xG (+ nombre y equipo)
+#   stats  por player_id v2: partidos, minutos, suma y número de ratings
+# Leer la tabla cruza ambos con las identidades v1 ↔ v2 vigentes y deriva
+# xG/tiro, goles − xG y rating medio; el orden por métrica se calcula una vez
+# por versión y cada consulta devuelve solo la página pedida.
+METRICAS_LIDERES = {
+    "xg": "xG", "xg_por_tiro": "xG por tiro", "goles_menos_xg": "Goles − xG",
+    "a_puerta": "Tiros a puerta", "goles": "Goles", "tiros": "Tiros", "rating": "Rating medio",
+}
+COLUMNAS_LIDERES = ["player", "team_name", "partidos", "minutos", "tiros", "a_puerta", "goles", "xg",
+                    "xg_por_tiro", "goles_menos_xg", "rating"]
+_SUMAS_TIROS = ["tiros", "a_puerta", "goles", "xg"]
+_SUMAS_STATS = ["partidos", "minutos", "rating_suma", "rating_n"]
+
+
+_CONTEOS = ["tiros", "a_puerta", "goles", "partidos", "rating_n"]
+
+
+class _Acumulador:
+    """Sumas por jugador en arrays posicionales: sumar una tanda cuesta lo que sus filas, no la liga."""
+
+    def __init__(self, sumas, ultimos):
+        self.sumas, self.ultimos = sumas, ultimos
+        self.posicion = {}
+        self.valores = np.zeros((0, len(sumas)))
+        self.textos = np.empty((0, len(ultimos)), dtype=object)
+
+    def sumar(self, nuevo):
+        """Suma `nuevo` (un jugador por fila, indexado por id); en `ultimos` gana el valor más reciente."""
+        filas = [self.posicion.setdefault(i, len(self.posicion)) for i in nuevo.index.tolist()]
+        faltan = len(self.posicion) - len(self.valores)
+        if faltan > 0:
+            self.valores = np.vstack([self.valores, np.zeros((faltan, len(self.sumas)))])
+            self.textos = np.vstack([self.textos, np.full((faltan, len(self.ultimos)), None, dtype=object)])
+        self.valores[filas] += nuevo[self.sumas].to_numpy(dtype=float, na_value=0.0)
+        textos = nuevo[self.ultimos].to_numpy(dtype=object)
+        self.textos[filas] = np.where(pd.notna(textos), textos, self.textos[filas])
+
+    def copia(self):
+        """(ids, sumas, textos) en el orden de llegada de los jugadores."""
+        return list(self.posicion), self.valores.copy(), self.textos.copy()
+
+
+class VistaLideres:
+    """Líderes por jugador de una temporada; `incorporar` suma cada tanda de partidos una sola vez."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tiros = _Acumulador(_SUMAS_TIROS, ["player", "team_name"])
+        self._stats = _Acumulador(_SUMAS_STATS, ["team_name"])
+        self.version = 0
+        self._cache_tabla = None
+        self._ordenes = {}
+
+    # ---- refresco incremental ----
+    @instrumentado("lideres.incorporar")
+    def incorporar(self, eventos):
+        """Suma los eventos (pa.Table) de partidos que la vista aún no había visto."""
+        columnas = set(eventos.column_names)
+        tiros = stats = None
+        if {"result", "xg", "player_id"} <= columnas:
+            tiros = consultar(
+                eventos, filtro=ES_TIRO,
+                columnas={"player_id": pc.field("player_id"), "player": pc.field("player"),
+                          "team_name": pc.field("team_name"), "xg": pc.field("xg"),
+                          "gol": marca_resultado(eventos, "goal"), "a_puerta": marca_resultado(eventos, "goal|save")},
+                por=["player_id"],
+                agregados=[("player", "last"), ("team_name", "last"), ([], "count_all"),
+                           ("a_puerta", "sum"), ("gol", "sum"), ("xg", "sum")],
+            ).rename(columns={"player_last": "player", "team_name_last": "team_name", "count_all": "tiros",
+                              "a_puerta_sum": "a_puerta", "gol_sum": "goles", "xg_sum": "xg"}).set_index("player_id")
+        if {"rating", "minute", "player_id"} <= columnas:
+            stats = consultar(
+                eventos, filtro=pc.field("type_name") == "PlayerStat",
+                columnas=["player_id", "team_name", "rating", "minute"],
+                por=["player_id"],
+                agregados=[("team_name", "last"), ([], "count_all"), ("minute", "sum"),
+                           ("rating", "sum"), ("rating", "count")],
+            ).rename(columns={"team_name_last": "team_name", "count_all": "partidos", "minute_sum": "minutos",
+                              "rating_sum": "rating_suma", "rating_count": "rating_n"}).set_index("player_id")
+        with self._lock:
+            if tiros is not None and not tiros.empty:
+                self._tiros.sumar(tiros)
+            if stats is not None and not stats.empty:
+                self._stats.sumar(stats)
+            self.version += 1
+
+    # ---- lectura ----
+    def tabla(self, identidades=None):
+        """Una fila por jugador (índice: v1 si se conoce, si no el v2 de /player-stats) con todas las métricas.
+
+        `identidades` es `IndiceIdentidades.tabla()`; la tabla se reconstruye
+        solo si cambió la versión de la vista o el objeto de identidades.
+        """
+        with self._lock:
+            cache = self._cache_tabla
+            if cache is not None and cache[0] == self.version and cache[1] is identidades:
+                return cache[2]
+            version = self.version
+            ids_tiros, sumas_tiros, textos_tiros = self._tiros.copia()
+            ids_stats, sumas_stats, textos_stats = self._stats.copia()
+
+        # Las PlayerStat con identidad v1 ↔ v2 resuelta se suman a la fila del tirador (v1)
+        v1, nombres = {}, {}
+        if identidades is not None and not identidades.empty:
+            v1 = dict(zip(identidades.index.tolist(), identidades["player_id_v1"].tolist()))
+            nombres = dict(zip(identidades.index.tolist(), identidades["player_name"].tolist()))
+        posicion = {pid: k for k, pid in enumerate(ids_tiros)}
+        filas_stats = [posicion.setdefault(v1.get(pid, pid), len(posicion)) for pid in ids_stats]
+        n = len(posicion)
+
+        sumas = np.zeros((n, len(_SUMAS_TIROS) + len(_SUMAS_STATS)))
+        sumas[:len(ids_tiros), :len(_SUMAS_TIROS)] = sumas_tiros
+        np.add.at(sumas[:, len(_SUMAS_TIROS):], filas_stats, sumas_stats)
+        jugador = np.full(n, None, dtype=object)
+        equipo = np.full(n, None, dtype=object)
+        jugador[:len(ids_tiros)] = textos_tiros[:, 0]
+        equipo[:len(ids_tiros)] = textos_tiros[:, 1]
+        for fila, pid, equipo_stat in zip(filas_stats, ids_stats, textos_stats[:, 0]):
+            if jugador[fila] is None:
+                jugador[fila] = nombres.get(pid)
+            if equipo[fila] is None:
+                equipo[fila] = equipo_stat
+
+        tabla = pd.DataFrame(sumas, columns=_SUMAS_TIROS + _SUMAS_STATS,
+                             index=pd.Index(list(posicion), dtype="int64", name="player_id"))
+        tabla[_CONTEOS] = tabla[_CONTEOS].astype("int64")
+        tabla["player"] = [j if j is not None else str(pid) for j, pid in zip(jugador, posicion)]
+        tabla["team_name"] = equipo
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tabla["xg_por_tiro"] = np.where(sumas[:, 0] > 0, sumas[:, 3] / sumas[:, 0], np.nan)
+            tabla["rating"] = np.where(sumas[:, 7] > 0, sumas[:, 6] / sumas[:, 7], np.nan)
+        tabla["goles_menos_xg"] = tabla["goles"] - tabla["xg"]
+        tabla = tabla[COLUMNAS_LIDERES]
+
+        with self._lock:
+            if self.version == version:
+                self._cache_tabla = (version, identidades, tabla)
+                self._ordenes = {}
+        return tabla
+
+    @instrumentado("lideres.pagina")
+    def pagina(self, metrica="xg", descendente=True, pagina=1, por_pagina=25, min_tiros=0, min_partidos=0,
+               equipo=None, identidades=None):
+        """(filas de la página pedida, total de jugadores que cumplen los filtros), ordenadas por `metrica`.
+
+        El orden de cada combinación de métrica y filtros se guarda hasta la
+        próxima actualización de la vista: paginar es rebanar un índice.
+        """
+        tabla = self.tabla(identidades)
+        clave = (id(tabla), metrica, descendente, min_tiros, min_partidos, equipo)
+        with self._lock:
+            orden = self._ordenes.get(clave)
+        if orden is None:
+            filtro = (tabla["tiros"] >= min_tiros) & (tabla["partidos"] >= min_partidos) & tabla[metrica].notna()
+            if equipo:
+                filtro &= tabla["team_name"] == equipo
+            orden = tabla[filtro].sort_values([metrica, "xg"], ascending=[not descendente, False], kind="stable").index
+            with self._lock:
+                if self._cache_tabla is not None and self._cache_tabla[2] is tabla:
+                    self._ordenes[clave] = orden
+        inicio = max(0, (pagina - 1) * por_pagina)
+        return tabla.loc[orden[inicio:inicio + por_pagina]], len(orden)
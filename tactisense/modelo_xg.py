@@ -0,0 +1,152 @@
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+
+# =========================
+# MODELO xG LOCAL
+# =========================
+# Regresión logística sobre los campos de tiro que ya trae la API (x, y en
+# coordenadas StatsBomb 120 × 80 atacando hacia x = 120, situation, body_part,
+# minute). Todo es NumPy: la matriz de rasgos se arma columna a columna sin
+# bucles por fila y puntuar una temporada entera es un único producto
+# matriz-vector. Los penaltis no se modelan: llevan un valor fijo.
+LARGO_CAMPO, CENTRO_PORTERIA, ANCHO_PORTERIA = 120.0, 40.0, 8.0
+XG_PENALTI = 0.76
+MIN_TIROS_ENTRENAMIENTO = 500
+
+RASGOS_XG = ("intercepto", "distancia", "angulo", "cabeza", "corner", "balon_parado", "tiro_libre", "minuto")
+_SITUACIONES = {"corner": ("FromCorner",), "balon_parado": ("SetPiece",), "tiro_libre": ("DirectFreekick",)}
+
+
+class ModeloXG(NamedTuple):
+    coef: np.ndarray        # (K,) sobre rasgos sin estandarizar
+    n_tiros: int
+    origen: str
+
+
+# Modelo base distancia/ángulo para cuando no hay tiros suficientes para entrenar
+MODELO_XG_BASE = ModeloXG(
+    coef=np.array([-1.2, -0.09, 1.3, -0.9, -0.2, -0.1, 0.0, 0.0]),
+    n_tiros=0,
+    origen="base",
+)
+
+
+def _columna(df, nombre, default=None):
+    if nombre in df.columns:
+        return df[nombre]
+    return pd.Series(default, index=df.index)
+
+
+def _indicadoras(valores, grupos):
+    """Columnas 0/1 por grupo de categorías; las cadenas se comparan una vez por valor único."""
+    codigos, unicos = pd.factorize(pd.Series(valores, dtype=object))
+    unicos = np.append(np.asarray(unicos, dtype=object), None)       # código -1 (nulo) → None
+    return [np.isin(unicos, g)[codigos] for g in grupos]
+
+
+def matriz_rasgos(x, y, situation, body_part, minute):
+    """Matriz (N, K) de rasgos; filas sin coordenadas quedan en NaN."""
+    x = np.asarray(x, dtype="f8")
+    y = np.asarray(y, dtype="f8")
+    minute = np.nan_to_num(np.asarray(minute, dtype="f8"), nan=45.0)
+
+    dx = LARGO_CAMPO - x
+    dy = np.abs(y - CENTRO_PORTERIA)
+    distancia = np.hypot(dx, dy)
+    # Ángulo con el que se ve la portería desde el punto de tiro (radianes)
+    angulo = np.arctan2(ANCHO_PORTERIA * dx, dx ** 2 + dy ** 2 - (ANCHO_PORTERIA / 2) ** 2)
+    angulo = np.where(angulo < 0, angulo + np.pi, angulo)
+
+    X = np.empty((len(x), len(RASGOS_XG)), dtype="f8")
+    X[:, 0] = 1.0
+    X[:, 1] = distancia
+    X[:, 2] = angulo
+    (X[:, 3],) = _indicadoras(body_part, [("Head",)])
+    X[:, 4:7] = np.column_stack(_indicadoras(situation, [_SITUACIONES[r] for r in RASGOS_XG[4:7]]))
+    X[:, 7] = minute / 90.0
+    return X
+
+
+def matriz_rasgos_df(df):
+    """Rasgos de un DataFrame de tiros con las columnas del DataFrame de eventos."""
+    return matriz_rasgos(_columna(df, "x"), _columna(df, "y"), _columna(df, "situation"),
+                         _columna(df, "body_part"), _columna(df, "minute"))
+
+
+def es_penalti(situation):
+    return pd.Series(situation, dtype=object).to_numpy() == "Penalty"
+
+
+def predecir_xg(modelo, X, penaltis=None):
+    """Probabilidad de gol por fila de X en una sola operación vectorizada."""
+    xg = 1.0 / (1.0 + np.exp(-(X @ modelo.coef)))
+    if penaltis is not None:
+        xg = np.where(penaltis, XG_PENALTI, xg)
+    return xg
+
+
+def predecir_xg_df(modelo, df):
+    return pd.Series(predecir_xg(modelo, matriz_rasgos_df(df), es_penalti(_columna(df, "situation"))),
+                     index=df.index, name="xg_local")
+
+
+def entrenar_modelo_xg(X, goles, l2=1.0, max_iter=50, tol=1e-8):
+    """Regresión logística L2 por Newton (IRLS) sobre rasgos estandarizados.
+
+    Los coeficientes se devuelven ya deshechos de la estandarización, así que
+    predecir es `X @ coef` sobre la matriz sin transformar.
+    """
+    validas = np.isfinite(X).all(axis=1)
+    X, goles = X[validas], np.asarray(goles, dtype="f8")[validas]
+    if len(X) < MIN_TIROS_ENTRENAMIENTO or goles.min() == goles.max():
+        return MODELO_XG_BASE
+
+    media = X[:, 1:].mean(axis=0)
+    escala = X[:, 1:].std(axis=0)
+    escala[escala == 0] = 1.0
+    Z = X.copy()
+    Z[:, 1:] = (X[:, 1:] - media) / escala
+
+    penal = np.full(Z.shape[1], l2)
+    penal[0] = 0.0
+    w = np.zeros(Z.shape[1])
+    w[0] = np.log(goles.mean() / (1 - goles.mean()))
+    for _ in range(max_iter):
+        p = 1.0 / (1.0 + np.exp(-(Z @ w)))
+        gradiente = Z.T @ (p - goles) + penal * w
+        hessiana = (Z.T * (p * (1 - p))) @ Z + np.diag(penal)
+        paso = np.linalg.solve(hessiana, gradiente)
+        w -= paso
+        if np.abs(paso).max() < tol:
+            break
+
+    coef = np.empty_like(w)
+    coef[1:] = w[1:] / escala
+    coef[0] = w[0] - (w[1:] * media / escala).sum()
+    return ModeloXG(coef=coef, n_tiros=int(len(X)), origen="temporada")
+
+
+def comparar_xg(xg_proveedor, xg_local, goles=None, n_bins=5):
+    """Resumen (MAE, correlación) y tabla de calibración por quintil del xG del proveedor."""
+    proveedor = np.asarray(xg_proveedor, dtype="f8")
+    local = np.asarray(xg_local, dtype="f8")
+    validas = np.isfinite(proveedor) & np.isfinite(local)
+    proveedor, local = proveedor[validas], local[validas]
+    if len(proveedor) < 2:
+        return {"tiros": int(len(proveedor)), "mae": np.nan, "correlacion": np.nan}, pd.DataFrame()
+
+    tabla = pd.DataFrame({"xg_proveedor": proveedor, "xg_local": local})
+    if goles is not None:
+        tabla["goles"] = np.asarray(goles, dtype="f8")[validas]
+    tabla["tramo"] = pd.qcut(tabla["xg_proveedor"].rank(method="first"), q=min(n_bins, len(tabla)), labels=False)
+    calibracion = tabla.groupby("tramo").agg(
+        tiros=("xg_proveedor", "size"), **{c: (c, "mean") for c in tabla.columns if c != "tramo"})
+    resumen = {
+        "tiros": int(len(proveedor)),
+        "mae": float(np.abs(proveedor - local).mean()),
+        "correlacion": float(np.corrcoef(proveedor, local)[0, 1]) if proveedor.std() and local.std() else np.nan,
+    }
+    return resumen, calibracion.reset_index(drop=True)
@@ -0,0 +1,292 @@
+import hashlib
+from typing import NamedTuple
+
+import numpy as np
+import matplotlib.pyplot as plt
+from mplsoccer import Pitch
+from PIL import Image, ImageColor, ImageDraw
+from io import BytesIO
+
+from tactisense.cache import CacheTTL
+from tactisense.formaciones import POSICIONES, indice_formacion, posiciones_formacion
+from tactisense.instrumentacion import instrumentado
+
+
+# =========================
+# UTILIDADES PIZARRA / CANVAS
+# =========================
+def render_pitch_image(width=900, height=600, theme="green"):
+    pitch = Pitch(pitch_type='statsbomb',
+                  pitch_color='black' if theme == "black" else '#2E7D32',
+                  line_color='white')
+    fig, ax = pitch.draw(figsize=(width/100, height/100), tight_layout=False)
+    ax.set_xlim(0, 120)
+    ax.set_ylim(80, 0)
+    buf = BytesIO()
+    fig.savefig(buf, format="png", dpi=100, facecolor=fig.get_facecolor(), bbox_inches="tight")
+    plt.close(fig)
+    buf.seek(0)
+    return Image.open(buf)
+
+
+def formation_template(name):
+    return [tuple(p) for p in POSICIONES[indice_formacion(name)].tolist()]
+
+
+def make_token(x, y, label, fill="#1976D2", radius=16, selectable=True):
+    return {
+        "type": "circle",
+        "left": float(x - radius),
+        "top": float(y - radius),
+        "radius": float(radius),
+        "fill": fill,
+        "stroke": "#ffffff",
+        "strokeWidth": 2,
+        "opacity": 0.95,
+        "selectable": selectable,
+        "hasControls": False,
+        "hasBorders": False,
+        "lockScalingX": True,
+        "lockScalingY": True,
+        "lockRotation": True,
+        "text": label
+    }
+
+
+def make_label(x, y, text, color="#ffffff", selectable=False):
+    return {
+        "type": "textbox",
+        "left": float(x),
+        "top": float(y),
+        "text": text,
+        "fontSize": 14,
+        "fill": color,
+        "backgroundColor": "rgba(0,0,0,0.0)",
+        "selectable": selectable,
+        "editable": False
+    }
+
+
+def make_zone_rect(x, y, w, h, label, stroke="#FF5252", fill="rgba(255,82,82,0.15)"):
+    return [
+        {
+            "type": "rect",
+            "left": float(x),
+            "top": float(y),
+            "width": float(w),
+            "height": float(h),
+            "fill": fill,
+            "stroke": stroke,
+            "strokeWidth": 2,
+            "rx": 6,
+            "ry": 6,
+            "selectable": False
+        },
+        make_label(x + 6, y + 6, label, color=stroke, selectable=False)
+    ]
+
+
+# =========================
+# MODELO COMPACTO DEL TABLERO
+# =========================
+# Las fichas viven en un array estructurado de NumPy y el resto de lo dibujado
+# en una tupla de primitivas. Los dicts de fabric.js solo se generan para el
+# canvas y el PNG solo cuando se pide la descarga, cacheado por hash.
+FICHA_DTYPE = np.dtype([("x", "f4"), ("y", "f4"), ("r", "f4"), ("color", "u1"), ("etiqueta", "U4")])
+COLOR_TRAZO_FICHA = "#ffffff"
+
+
+class Tablero(NamedTuple):
+    ancho: int
+    alto: int
+    fondo: str
+    fichas: np.ndarray      # FICHA_DTYPE, centros en píxeles
+    colores: tuple          # paleta indexada por fichas["color"]
+    primitivas: tuple       # ("zona"|"rect"|"linea"|"circulo"|"trazo"|"texto", ...)
+
+
+def _etiquetas(n):
+    return np.array(["GK"] + [str(i) for i in range(2, n + 1)], dtype="U4")
+
+
+def tablero_inicial(width, height, formation_name, color="#1976D2", opponent_color="#E53935",
+                    show_weak_left=False, show_weak_right=False, show_halfspace=False,
+                    fondo="transparent", opponent_formation="4-4-2"):
+    primitivas = []
+    if show_weak_left:
+        primitivas.append(("zona", width*0.55, height*0.05, width*0.40, height*0.20, "Zona débil: Lado Izquierdo", "#FF7043", "rgba(255,82,82,0.15)"))
+    if show_weak_right:
+        primitivas.append(("zona", width*0.55, height*0.75, width*0.40, height*0.20, "Zona débil: Lado Derecho", "#FF7043", "rgba(255,82,82,0.15)"))
+    if show_halfspace:
+        primitivas.append(("zona", width*0.45, height*0.30, width*0.20, height*0.40, "Entre líneas / Media luna", "#FF5252", "rgba(255,82,82,0.12)"))
+
+    propias = posiciones_formacion(formation_name, width, height)
+    rivales = posiciones_formacion(opponent_formation, width, height, espejo=True, invertir=True)
+    fichas = np.zeros(len(propias) + len(rivales), dtype=FICHA_DTYPE)
+    coords = np.concatenate([propias, rivales])
+    fichas["x"], fichas["y"] = coords[:, 0], coords[:, 1]
+    fichas["r"] = 16
+    fichas["color"][len(propias):] = 1
+    fichas["etiqueta"] = np.concatenate([_etiquetas(len(propias)), _etiquetas(len(rivales))])
+    return Tablero(width, height, fondo, fichas, (color, opponent_color), tuple(primitivas))
+
+
+def tablero_a_fabric(tablero):
+    """Objetos fabric.js para `initial_drawing` de st_canvas."""
+    objs = []
+    for p in tablero.primitivas:
+        if p[0] == "zona":
+            _, x, y, w, h, label, stroke, fill = p
+            objs += make_zone_rect(x, y, w, h, label, stroke=stroke, fill=fill)
+    for f in tablero.fichas:
+        propia = f["color"] == 0
+        label = str(f["etiqueta"])
+        objs.append(make_token(f["x"], f["y"], label, fill=tablero.colores[f["color"]],
+                               radius=float(f["r"]), selectable=bool(propia)))
+        if propia:
+            objs.append(make_label(f["x"]-6, f["y"]-32, label, color="#fff"))
+    return {"objects": objs, "background": tablero.fondo}
+
+
+def build_initial_board(width, height, formation_name, color="#1976D2", opponent_color="#E53935",
+                        show_weak_left=False, show_weak_right=False, show_halfspace=False,
+                        opponent_formation="4-4-2"):
+    return tablero_a_fabric(tablero_inicial(width, height, formation_name, color, opponent_color,
+                                            show_weak_left, show_weak_right, show_halfspace,
+                                            opponent_formation=opponent_formation))
+
+
+def _escala(o):
+    return float(o.get("scaleX", 1) or 1), float(o.get("scaleY", 1) or 1)
+
+
+def _puntos_path(o, sx, sy):
+    """Puntos del trazo en coordenadas del lienzo, con el desplazamiento y la escala del objeto.
+
+    fabric.js guarda `path` en coordenadas propias: el punto p se dibuja en
+    centro + (p - pathOffset) · escala, y `left`/`top` marcan la esquina de la
+    caja con el grosor del trazo incluido.
+    """
+    puntos = np.asarray([cmd[-2:] for cmd in o.get("path") or [] if len(cmd) >= 3], dtype="f8").reshape(-1, 2)
+    if not len(puntos):
+        return puntos.astype("f4")
+    offset = o.get("pathOffset")
+    if offset:
+        origen = np.array([float(offset.get("x", 0)), float(offset.get("y", 0))])
+    else:
+        # pathOffset no se serializa: es el centro de la caja del trazo original
+        origen = (puntos.min(axis=0) + puntos.max(axis=0)) / 2
+    grosor = float(o.get("strokeWidth", 1) or 1)
+    centro = np.array([float(o.get("left", 0)), float(o.get("top", 0))])
+    if o.get("originX", "left") == "left":
+        centro[0] += (float(o.get("width", 0)) + grosor) * sx / 2
+    if o.get("originY", "top") == "top":
+        centro[1] += (float(o.get("height", 0)) + grosor) * sy / 2
+    return (centro + (puntos - origen) * (sx, sy)).astype("f4")
+
+
+@instrumentado()
+def tablero_desde_fabric(json_data, ancho, alto, fondo):
+    """Reduce el JSON de fabric.js que devuelve st_canvas al modelo compacto."""
+    fichas, colores, primitivas = [], [], []
+    for o in (json_data or {}).get("objects", []):
+        tipo = o.get("type")
+        sx, sy = _escala(o)
+        left, top = float(o.get("left", 0)), float(o.get("top", 0))
+        stroke, ancho_trazo = o.get("stroke") or "#000000", float(o.get("strokeWidth", 1) or 1)
+        if tipo == "circle":
+            r = float(o.get("radius", 0)) * sx
+            # Fichas: círculos rellenos con borde blanco (make_token); el resto, dibujo libre
+            if stroke.lower() == COLOR_TRAZO_FICHA and o.get("fill", "").startswith("#"):
+                if o["fill"] not in colores:
+                    colores.append(o["fill"])
+                fichas.append((left + r, top + r, r, colores.index(o["fill"]), str(o.get("text", ""))[:4]))
+            else:
+                primitivas.append(("circulo", left + r, top + r, r, stroke, o.get("fill"), ancho_trazo))
+        elif tipo == "rect":
+            primitivas.append(("rect", left, top, float(o.get("width", 0)) * sx, float(o.get("height", 0)) * sy,
+                               stroke, o.get("fill"), ancho_trazo))
+        elif tipo == "line":
+            cx = left + float(o.get("width", 0)) * sx / 2
+            cy = top + float(o.get("height", 0)) * sy / 2
+            primitivas.append(("linea", cx + float(o.get("x1", 0)) * sx, cy + float(o.get("y1", 0)) * sy,
+                               cx + float(o.get("x2", 0)) * sx, cy + float(o.get("y2", 0)) * sy, stroke, ancho_trazo))
+        elif tipo == "path":
+            puntos = _puntos_path(o, sx, sy)
+            if len(puntos):
+                primitivas.append(("trazo", puntos, stroke, ancho_trazo))
+        elif tipo in ("textbox", "text", "i-text") and o.get("text"):
+            primitivas.append(("texto", left, top, str(o["text"]), o.get("fill") or "#ffffff"))
+    return Tablero(ancho, alto, fondo, np.array(fichas, dtype=FICHA_DTYPE), tuple(colores), tuple(primitivas))
+
+
+def hash_tablero(tablero):
+    h = hashlib.sha1()
+    h.update(repr((tablero.ancho, tablero.alto, tablero.fondo, tablero.colores)).encode("utf-8"))
+    h.update(tablero.fichas.tobytes())
+    for p in tablero.primitivas:
+        h.update(b"|".join(v.tobytes() if isinstance(v, np.ndarray) else repr(v).encode("utf-8") for v in p))
+    return h.hexdigest()
+
+
+def _color(valor, defecto=None):
+    if not valor or valor == "transparent":
+        return defecto
+    try:
+        return ImageColor.getcolor(valor, "RGBA")
+    except ValueError:
+        # rgba(r,g,b,a) con alfa en [0, 1], como lo escribe fabric.js
+        if valor.startswith("rgba(") and valor.endswith(")"):
+            r, g, b, a = [float(v) for v in valor[5:-1].split(",")]
+            return (int(r), int(g), int(b), int(round(a * 255)))
+        return defecto
+
+
+_CACHE_PNG = CacheTTL(ttl=3600, max_entradas=256)
+
+
+@instrumentado()
+def rasterizar_tablero(tablero):
+    """PNG (bytes) del tablero; se reutiliza mientras el hash no cambie."""
+    clave = hash_tablero(tablero)
+    png = _CACHE_PNG.get(clave)
+    if png is not None:
+        return png
+    img = Image.new("RGBA", (int(tablero.ancho), int(tablero.alto)), _color(tablero.fondo, (0, 0, 0, 0)))
+    capa = Image.new("RGBA", img.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(capa)
+    for p in tablero.primitivas:
+        if p[0] in ("zona", "rect"):
+            if p[0] == "zona":
+                _, x, y, w, h, label, stroke, fill = p
+                ancho_trazo = 2
+            else:
+                _, x, y, w, h, stroke, fill, ancho_trazo = p
+                label = None
+            draw.rectangle([x, y, x + w, y + h], fill=_color(fill), outline=_color(stroke), width=int(ancho_trazo))
+            if label:
+                draw.text((x + 6, y + 6), label, fill=_color(stroke))
+        elif p[0] == "linea":
+            _, x1, y1, x2, y2, stroke, ancho_trazo = p
+            draw.line([x1, y1, x2, y2], fill=_color(stroke), width=int(ancho_trazo))
+        elif p[0] == "circulo":
+            _, cx, cy, r, stroke, fill, ancho_trazo = p
+            draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=_color(fill), outline=_color(stroke), width=int(ancho_trazo))
+        elif p[0] == "trazo":
+            _, puntos, stroke, ancho_trazo = p
+            draw.line(puntos.ravel().tolist(), fill=_color(stroke), width=int(ancho_trazo), joint="curve")
+        elif p[0] == "texto":
+            _, x, y, texto, color = p
+            draw.text((x, y), texto, fill=_color(color, (255, 255, 255, 255)))
+    for f in tablero.fichas:
+        x, y, r = float(f["x"]), float(f["y"]), float(f["r"])
+        draw.ellipse([x - r, y - r, x + r, y + r], fill=_color(tablero.colores[f["color"]]),
+                     outline=_color(COLOR_TRAZO_FICHA), width=2)
+        if f["etiqueta"]:
+            draw.text((x, y), str(f["etiqueta"]), fill=(255, 255, 255, 255), anchor="mm")
+    img = Image.alpha_composite(img, capa)
+    buf = BytesIO()
+    img.save(buf, format="PNG", optimize=False)
+    png = buf.getvalue()
+    _CACHE_PNG.set(clave, png)
+    return png
@@ -0,0 +1,134 @@
+import re
+
+import numpy as np
+
+from tactisense.formaciones import COBERTURA, NOMBRES, POSICIONES, ZONAS_ANCHO, ZONAS_LARGO, INDICE
+
+
+# =========================
+# MOTOR DE PUNTUACIÓN DE FORMACIONES
+# =========================
+# Cada formación de la biblioteca se describe con rasgos geométricos
+# calculados de sus coordenadas (matriz F × K, una vez al importar). Las
+# fortalezas propias y debilidades del rival se traducen a un vector de pesos
+# sobre esos rasgos, y la sobrecarga por zona frente a la formación rival se
+# obtiene restando su cobertura reflejada. Puntuar todas las candidatas es un
+# único producto matriz-vector.
+RASGOS = ("amplitud", "centro", "entre_lineas", "profundidad", "area", "presion", "solidez", "sobrecarga")
+
+PESOS_FORTALEZAS = {
+    "Bandas fuertes":      {"amplitud": 1.0},
+    "Centros precisos":    {"amplitud": 0.6, "area": 0.8},
+    "Juego interior":      {"centro": 1.0, "entre_lineas": 0.5},
+    "Mediapunta creativo": {"entre_lineas": 1.0, "centro": 0.3},
+    "Presión alta":        {"presion": 1.0, "profundidad": 0.3},
+}
+PESOS_DEBILIDADES = {
+    "Laterales débiles":     {"amplitud": 1.0},
+    "Juego aéreo débil":     {"area": 1.0, "amplitud": 0.3},
+    "Mediocentro débil":     {"centro": 1.0},
+    "Entre líneas":          {"entre_lineas": 1.0},
+    "Espalda de la defensa": {"profundidad": 1.0},
+    "Sufre transiciones":    {"solidez": 0.6, "profundidad": 0.6},
+}
+PESO_SOBRECARGA_RIVAL = 0.5
+
+MOTIVOS = {
+    "amplitud":     "Amplitud en campo rival ({amplitud:.1f} de presencia en bandas) para castigar los costados.",
+    "centro":       "Superioridad en carril central del mediocampo ({centro:.1f} de presencia).",
+    "entre_lineas": "Ocupa el espacio entre líneas para activar mediapuntas.",
+    "profundidad":  "{profundidad:.0f} atacantes para atacar la espalda y las rupturas.",
+    "area":         "Carga el área con {area:.0f} rematadores por dentro.",
+    "presion":      "Presencia alta para presionar la salida rival.",
+    "solidez":      "Bloque sólido en el tercio propio ({solidez:.1f} de presencia) para salir en transición.",
+    "sobrecarga":   "Sobrecarga zonas clave frente al {rival}.",
+}
+
+# Franjas (a lo largo) y carriles (a lo ancho) de la rejilla de zonas
+_CENTRALES = slice(1, ZONAS_ANCHO - 1)
+_BANDAS = [0, ZONAS_ANCHO - 1]
+_TERCIO_PROPIO = slice(0, 2)
+_MEDIOS = slice(2, 4)
+_ENTRE_LINEAS = 3
+_ULTIMO_TERCIO = slice(4, ZONAS_LARGO)
+_CAMPO_RIVAL = slice(ZONAS_LARGO // 2, ZONAS_LARGO)
+
+
+def normalizar_formacion(valor):
+    """'433', '4-3-3' o '4 3 3' → '4-3-3'; None si no está en la biblioteca."""
+    if not isinstance(valor, str) or not valor.strip():
+        return None
+    valor = valor.strip()
+    if valor in INDICE:
+        return valor
+    digitos = re.sub(r"\D", "", valor)
+    candidato = "-".join(digitos)
+    return candidato if candidato in INDICE else None
+
+
+def _rasgos_base(posiciones, cobertura):
+    x, y = posiciones[:, 1:, 0], posiciones[:, 1:, 1]
+    delanteros = x >= 0.6
+    return {
+        "amplitud":     cobertura[:, _CAMPO_RIVAL, _BANDAS].sum(axis=(1, 2)),
+        "centro":       cobertura[:, _MEDIOS, _CENTRALES].sum(axis=(1, 2)),
+        "entre_lineas": cobertura[:, _ENTRE_LINEAS, _CENTRALES].sum(axis=1),
+        "profundidad":  delanteros.sum(axis=1),
+        "area":         (delanteros & (y > 0.3) & (y < 0.7)).sum(axis=1),
+        "presion":      cobertura[:, _ULTIMO_TERCIO, :].sum(axis=(1, 2)),
+        "solidez":      cobertura[:, _TERCIO_PROPIO, :].sum(axis=(1, 2)),
+    }
+
+
+RASGOS_BASE = _rasgos_base(POSICIONES, COBERTURA)
+
+
+def matriz_sobrecarga(indice_rival):
+    """Cobertura propia − cobertura rival reflejada, para toda la biblioteca: (F, 6, 5)."""
+    return COBERTURA - COBERTURA[indice_rival, ::-1, ::-1][None, :, :]
+
+
+def _estandarizar(m):
+    std = m.std(axis=0)
+    return (m - m.mean(axis=0)) / np.where(std > 0, std, 1.0)
+
+
+def puntuar_formaciones(fortalezas, debilidades, formacion_rival=None):
+    """Devuelve (puntuaciones (F,), contribuciones (F, K), rasgos crudos (F, K))."""
+    rival = normalizar_formacion(formacion_rival)
+    sobrecarga = (matriz_sobrecarga(INDICE[rival])[:, _CAMPO_RIVAL, :].clip(min=0).sum(axis=(1, 2))
+                  if rival else np.zeros(len(NOMBRES)))
+    crudos = np.column_stack([RASGOS_BASE[r] for r in RASGOS[:-1]] + [sobrecarga]).astype("f8")
+
+    pesos = np.zeros(len(RASGOS))
+    for tabla, claves in ((PESOS_FORTALEZAS, fortalezas), (PESOS_DEBILIDADES, debilidades)):
+        for clave in claves or []:
+            for rasgo, peso in tabla.get(clave, {}).items():
+                pesos[RASGOS.index(rasgo)] += peso
+    if rival:
+        pesos[RASGOS.index("sobrecarga")] += PESO_SOBRECARGA_RIVAL
+    if not pesos.any():
+        # Sin señales: premiar el equilibrio (ningún rasgo extremo)
+        z = _estandarizar(crudos[:, :-1])
+        return -np.abs(z).sum(axis=1), np.zeros_like(crudos), crudos
+
+    contribuciones = _estandarizar(crudos) * pesos
+    return contribuciones.sum(axis=1), contribuciones, crudos
+
+
+def ranking_formaciones(fortalezas, debilidades, formacion_rival=None):
+    """Todas las formaciones ordenadas: [(nombre, puntuación, motivo)]."""
+    puntuaciones, contribuciones, crudos = puntuar_formaciones(fortalezas, debilidades, formacion_rival)
+    rival = normalizar_formacion(formacion_rival)
+    ranking = []
+    for i in np.argsort(-puntuaciones, kind="stable"):
+        if contribuciones[i].max() > 0:
+            rasgo = RASGOS[int(np.argmax(contribuciones[i]))]
+            valores = dict(zip(RASGOS, crudos[i]), rival=rival)
+            motivo = MOTIVOS[rasgo].format(**valores)
+        elif contribuciones[i].any():
+            motivo = "Compromiso sin ventajas claras para las señales elegidas."
+        else:
+            motivo = "Config. base equilibrada si no hay señales claras."
+        ranking.append((NOMBRES[i], float(puntuaciones[i]), motivo))
+    return ranking
@@ -0,0 +1,133 @@
+import functools
+import threading
+import time
+
+
+# =========================
+# RESILIENCIA FRENTE A LA API
+# =========================
+# Dos piezas delante de cada petición a la API (ver `api._get`):
+#   CuboTokens  limita el ritmo al cupo del gateway. Es adaptativo: un 429 lo
+#               reduce a la mitad (y respeta Retry-After) y cada respuesta
+#               correcta lo devuelve poco a poco al ritmo configurado.
+#   Disyuntor   tras `umbral` fallos seguidos (red, timeout, 5xx, 429) se abre
+#               y rechaza al instante durante `enfriamiento` s. Después deja
+#               pasar una sola petición de prueba: si va bien se cierra, si
+#               falla vuelve a abrirse.
+# Los rechazos se levantan como `ApiNoDisponible`, que los llamadores tratan
+# como un fallo más: nada de lo que falló se guarda en cache.
+class ApiNoDisponible(Exception):
+    """La petición no se hizo: la API está caída o se agotó el cupo."""
+
+
+class CircuitoAbierto(ApiNoDisponible):
+    def __init__(self, reintento_s):
+        super().__init__(f"TacticSense API no disponible; se reintentará en {reintento_s:.0f} s")
+        self.reintento_s = reintento_s
+
+
+class CupoAgotado(ApiNoDisponible):
+    def __init__(self, espera_s):
+        super().__init__(f"Cupo de la TacticSense API agotado; haría falta esperar {espera_s:.1f} s")
+        self.espera_s = espera_s
+
+
+class DatosIncompletos(Exception):
+    """Resultado calculado sin algunos partidos que no se pudieron descargar."""
+
+    def __init__(self, parcial):
+        super().__init__("faltan partidos por descargar")
+        self.parcial = parcial
+
+
+def no_cachear_incompletos(cacheada):
+    """Sobre una función con `st.cache_data`: si levanta DatosIncompletos se devuelve
+    el resultado parcial, que no queda en cache y se recalcula en la próxima llamada."""
+    @functools.wraps(cacheada)
+    def wrapper(*args, **kwargs):
+        try:
+            return cacheada(*args, **kwargs)
+        except DatosIncompletos as ex:
+            return ex.parcial
+
+    wrapper.clear = cacheada.clear
+    return wrapper
+
+
+class CuboTokens:
+    """Token bucket seguro entre hilos; `tasa` peticiones/s con ráfagas de hasta `capacidad`."""
+
+    def __init__(self, tasa=20.0, capacidad=40, tasa_min=1.0):
+        self.tasa_max = self.tasa = float(tasa)
+        self.tasa_min = float(tasa_min)
+        self.capacidad = capacidad
+        self._tokens = float(capacidad)
+        self._ultimo = time.monotonic()
+        self._pausa_hasta = 0.0
+        self._lock = threading.Lock()
+
+    def tomar(self, max_espera=10.0):
+        """Reserva un token y espera lo necesario; si la espera supera `max_espera`, CupoAgotado."""
+        with self._lock:
+            ahora = time.monotonic()
+            self._tokens = min(self.capacidad, self._tokens + (ahora - self._ultimo) * self.tasa)
+            self._ultimo = ahora
+            espera = max(0.0, (1 - self._tokens) / self.tasa, self._pausa_hasta - ahora)
+            if espera > max_espera:
+                raise CupoAgotado(espera)
+            # El token se descuenta ya (puede quedar en negativo): los que llegan detrás esperan más
+            self._tokens -= 1
+        if espera > 0:
+            time.sleep(espera)
+        return espera
+
+    def frenar(self, retry_after=None):
+        """Respuesta 429: ritmo a la mitad y, si la API lo indica, pausa hasta Retry-After."""
+        with self._lock:
+            self.tasa = max(self.tasa_min, self.tasa / 2)
+            if retry_after:
+                self._pausa_hasta = max(self._pausa_hasta, time.monotonic() + retry_after)
+
+    def acelerar(self):
+        """Respuesta correcta: recupera un 5 % del ritmo configurado."""
+        with self._lock:
+            self.tasa = min(self.tasa_max, self.tasa + 0.05 * self.tasa_max)
+
+
+class Disyuntor:
+    """Circuit breaker cerrado → abierto → semiabierto (una petición de prueba) → cerrado."""
+
+    def __init__(self, umbral=5, enfriamiento=30.0):
+        self.umbral = umbral
+        self.enfriamiento = enfriamiento
+        self.estado = "cerrado"
+        self._fallos = 0
+        self._abierto_hasta = 0.0
+        self._sonda_desde = 0.0
+        self._lock = threading.Lock()
+
+    def permitir(self):
+        """Levanta CircuitoAbierto si la petición no debe salir."""
+        with self._lock:
+            if self.estado == "cerrado":
+                return
+            ahora = time.monotonic()
+            # Esta petición es la prueba; si una prueba anterior nunca informó, se lanza otra
+            if (self.estado == "abierto" and ahora >= self._abierto_hasta) or (
+                    self.estado == "semiabierto" and ahora - self._sonda_desde >= self.enfriamiento):
+                self.estado = "semiabierto"
+                self._sonda_desde = ahora
+                return
+            raise CircuitoAbierto(max(0.0, self._abierto_hasta - ahora))
+
+    def exito(self):
+        with self._lock:
+            self._fallos = 0
+            self.estado = "cerrado"
+
+    def fallo(self):
+        with self._lock:
+            self._fallos += 1
+            if self.estado == "semiabierto" or self._fallos >= self.umbral:
+                self.estado = "abierto"
+                self._abierto_hasta = time.monotonic() + self.enfriamiento
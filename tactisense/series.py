@@ -0,0 +1,180 @@
+import bisect
+import threading
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+
+# =========================
+# SERIES TEMPORALES DE FORMA
+# =========================
+# Cada equipo o jugador guarda sus agregados por partido en orden de fecha.
+# Al llegar un partido posterior al último, la media móvil (ventana de N
+# partidos) y la media exponencial se actualizan en O(1) a partir del estado
+# anterior. Un partido que llega desordenado (más antiguo que el último) se
+# inserta en su sitio y la serie se recalcula: pasa solo al mezclar partidos
+# indexados desde equipos distintos, y una temporada son unas decenas de filas.
+VENTANA_FORMA = 5
+ALFA_EWM = 0.35
+
+METRICAS_EQUIPO = ("xg", "xg_against", "shots", "shots_against", "goals", "goals_against")
+METRICAS_JUGADOR = ("xg", "shots", "goals", "rating", "minutes")
+
+
+class SerieTemporal:
+    """Valores por partido de una entidad con media móvil y EWMA incrementales.
+
+    Los NaN cuentan como dato ausente: no entran en la media móvil y la EWMA
+    conserva el valor anterior.
+    """
+
+    def __init__(self, metricas, ventana=VENTANA_FORMA, alfa=ALFA_EWM):
+        self.metricas = tuple(metricas)
+        self.ventana = ventana
+        self.alfa = alfa
+        self._fechas, self._mids, self._valores, self._medias, self._ewm = [], [], [], [], []
+        self._partidos = set()
+        self._reiniciar_estado()
+
+    def _reiniciar_estado(self):
+        m = len(self.metricas)
+        self._cola = deque()
+        self._suma = np.zeros(m)
+        self._conteo = np.zeros(m)
+        self._ewm_actual = np.full(m, np.nan)
+
+    def _avanzar(self, valores):
+        """Estado tras añadir `valores` al final: O(1) por partido."""
+        presentes = ~np.isnan(valores)
+        self._cola.append(valores)
+        self._suma += np.where(presentes, valores, 0.0)
+        self._conteo += presentes
+        if len(self._cola) > self.ventana:
+            sale = self._cola.popleft()
+            self._suma -= np.nan_to_num(sale)
+            self._conteo -= ~np.isnan(sale)
+        media = np.divide(self._suma, self._conteo, out=np.full_like(self._suma, np.nan), where=self._conteo > 0)
+        previo = self._ewm_actual
+        self._ewm_actual = np.where(presentes, np.where(np.isnan(previo), valores,
+                                                        self.alfa * valores + (1 - self.alfa) * previo), previo)
+        return media, self._ewm_actual.copy()
+
+    def agregar(self, fecha, match_id, valores):
+        """Incorpora un partido; devuelve False si ya estaba en la serie."""
+        if match_id in self._partidos:
+            return False
+        self._partidos.add(match_id)
+        fila = np.array([valores.get(m, np.nan) for m in self.metricas], dtype="f8")
+        fecha = pd.Timestamp(fecha) if fecha is not None and not pd.isna(fecha) else pd.Timestamp.min
+        if not self._fechas or fecha >= self._fechas[-1]:
+            media, ewm = self._avanzar(fila)
+            self._fechas.append(fecha)
+            self._mids.append(match_id)
+            self._valores.append(fila)
+            self._medias.append(media)
+            self._ewm.append(ewm)
+            return True
+
+        i = bisect.bisect_right(self._fechas, fecha)
+        self._fechas.insert(i, fecha)
+        self._mids.insert(i, match_id)
+        self._valores.insert(i, fila)
+        self._reiniciar_estado()
+        self._medias, self._ewm = [], []
+        for v in self._valores:
+            media, ewm = self._avanzar(v)
+            self._medias.append(media)
+            self._ewm.append(ewm)
+        return True
+
+    def __len__(self):
+        return len(self._mids)
+
+    def __contains__(self, match_id):
+        return match_id in self._partidos
+
+    def ultimo(self):
+        """{métrica: valor, métrica_media, métrica_ewm} del último partido (vacío si no hay)."""
+        if not self._mids:
+            return {}
+        resultado = {}
+        for j, m in enumerate(self.metricas):
+            resultado[m] = self._valores[-1][j]
+            resultado[f"{m}_media"] = self._medias[-1][j]
+            resultado[f"{m}_ewm"] = self._ewm[-1][j]
+        return resultado
+
+    def tabla(self):
+        """DataFrame en orden de fecha: match_date, match_id y, por métrica, valor, media y ewm."""
+        columnas = ["match_date", "match_id"] + [f"{m}{s}" for m in self.metricas for s in ("", "_media", "_ewm")]
+        if not self._mids:
+            return pd.DataFrame(columns=columnas)
+        bloques = np.stack([np.asarray(self._valores), np.asarray(self._medias), np.asarray(self._ewm)], axis=2)
+        df = pd.DataFrame(bloques.reshape(len(self._mids), -1), columns=columnas[2:])
+        df.insert(0, "match_id", self._mids)
+        df.insert(0, "match_date", [None if f == pd.Timestamp.min else f for f in self._fechas])
+        return df
+
+
+class MotorSeries:
+    """Series de equipos y jugadores por temporada, compartidas entre sesiones."""
+
+    def __init__(self, ventana=VENTANA_FORMA, alfa=ALFA_EWM):
+        self.ventana = ventana
+        self.alfa = alfa
+        self._series = {}
+        self._plantillas = {}
+        self._ingeridos = {}
+        self._lock = threading.Lock()
+
+    def serie(self, temporada, tipo, entidad):
+        metricas = METRICAS_EQUIPO if tipo == "equipo" else METRICAS_JUGADOR
+        with self._lock:
+            clave = (temporada, tipo, entidad)
+            if clave not in self._series:
+                self._series[clave] = SerieTemporal(metricas, self.ventana, self.alfa)
+            return self._series[clave]
+
+    def agregar(self, temporada, tipo, entidad, fecha, match_id, valores):
+        serie = self.serie(temporada, tipo, entidad)
+        with self._lock:
+            return serie.agregar(fecha, match_id, valores)
+
+    def contiene(self, temporada, tipo, entidad, match_id):
+        with self._lock:
+            serie = self._series.get((temporada, tipo, entidad))
+            return serie is not None and match_id in serie
+
+    def pendientes(self, temporada, equipo, mids):
+        """Partidos del equipo cuyos agregados de jugadores aún no se han incorporado."""
+        with self._lock:
+            hechos = self._ingeridos.get((temporada, equipo), set())
+            return [m for m in mids if m not in hechos]
+
+    def marcar_ingeridos(self, temporada, equipo, mids, jugadores):
+        with self._lock:
+            self._ingeridos.setdefault((temporada, equipo), set()).update(mids)
+            self._plantillas.setdefault((temporada, equipo), set()).update(jugadores)
+
+    def plantilla(self, temporada, equipo):
+        with self._lock:
+            return sorted(self._plantillas.get((temporada, equipo), set()))
+
+    def tabla(self, temporada, tipo, entidad):
+        serie = self.serie(temporada, tipo, entidad)
+        with self._lock:
+            return serie.tabla()
+
+    def ultimos(self, temporada, tipo, entidades):
+        """Un DataFrame con el último estado de cada entidad (una fila por entidad)."""
+        with self._lock:
+            filas = {e: self._series[(temporada, tipo, e)].ultimo()
+                     for e in entidades if (temporada, tipo, e) in self._series}
+        return pd.DataFrame.from_dict(filas, orient="index")
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+            self._plantillas.clear()
+            self._ingeridos.clear()
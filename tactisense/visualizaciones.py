@@ -0,0 +1,125 @@
+import streamlit as st
+import numpy as np
+import matplotlib.pyplot as plt
+import seaborn as sns
+from mplsoccer import Pitch
+
+from tactisense.instrumentacion import instrumentado, medir
+
+
+# =========================
+# VISUALIZACIONES
+# =========================
+@instrumentado()
+def figura_xg_por_jugador(df_eventos):
+    """Barra horizontal con el top 10 de xG acumulado; None si no hay tiros."""
+    tiros = df_eventos[df_eventos['type_name'] == 'Shot']
+    if tiros.empty:
+        return None
+    xg_jugadores = tiros.groupby('player')['xg'].sum().sort_values(ascending=False).head(10)
+    brand_palette = ["#005595", "#1a6aaa", "#2d7fbf", "#3a8fd4", "#4da0e0",
+                     "#003B65", "#004f88", "#00639b", "#0077ae", "#008bc1"]
+    fig, ax = plt.subplots(figsize=(10, 6))
+    fig.patch.set_facecolor("#0d1f35")
+    ax.set_facecolor("#0d1f35")
+    bars = ax.barh(xg_jugadores.index[::-1], xg_jugadores.values[::-1],
+                   color=brand_palette[:len(xg_jugadores)], height=0.6)
+    for bar, val in zip(bars, xg_jugadores.values[::-1]):
+        ax.text(val + 0.005, bar.get_y() + bar.get_height() / 2,
+                f"{val:.2f}", va="center", color="#B3B2B3",
+                fontsize=10, fontweight="bold")
+    ax.set_xlabel("xG acumulado", color="#B3B2B3", fontsize=11)
+    ax.set_title("Top 10 Jugadores por xG", color="#FFFFFF",
+                 fontsize=14, fontweight="bold", pad=16)
+    ax.tick_params(colors="#B3B2B3", labelsize=10)
+    ax.spines[["top", "right", "left", "bottom"]].set_visible(False)
+    ax.xaxis.grid(True, color=(0, 0.333, 0.584, 0.2), linewidth=0.8)
+    ax.set_axisbelow(True)
+    plt.tight_layout()
+    return fig
+
+
+def graficar_xg_por_jugador(df_eventos):
+    fig = figura_xg_por_jugador(df_eventos)
+    if fig is None:
+        st.info("No hay tiros para graficar.")
+        return
+    with medir("st.pyplot"):
+        st.pyplot(fig)
+    plt.close(fig)
+
+
+@instrumentado()
+def graficar_mapa_calor(shots, pitch_color, line_color):
+    """KDE de tiros sobre cancha StatsBomb; None si no hay coordenadas suficientes."""
+    x = shots['x'].dropna().tolist()
+    y = shots['y'].dropna().tolist()
+    pitch = Pitch(pitch_type='statsbomb', pitch_color=pitch_color, line_color=line_color)
+    fig, ax = pitch.draw(figsize=(6,4))
+    if not (x and y):
+        plt.close(fig)
+        return None
+    sns.kdeplot(
+        x=x,
+        y=y,
+        ax=ax,
+        fill=True,
+        cmap='magma',
+        alpha=0.8,
+        thresh=0.05,
+        bw_adjust=0.6
+    )
+    return fig
+
+
+# =========================
+# SCOUT REPORT — RADAR
+# =========================
+def _lienzo_radar(labels):
+    """Figura polar con la rejilla y las etiquetas; se reutiliza entre jugadores con las mismas métricas."""
+    N = len(labels)
+    angulos = [n / float(N) * 2 * np.pi for n in range(N)]
+    angulos += angulos[:1]
+
+    fig, ax = plt.subplots(figsize=(6, 6), subplot_kw=dict(polar=True))
+    fig.patch.set_facecolor("#0d1f35")
+    ax.set_facecolor("#0d1f35")
+    ax.set_theta_offset(np.pi / 2)
+    ax.set_theta_direction(-1)
+    ax.spines['polar'].set_visible(False)
+    ax.yaxis.set_tick_params(labelsize=0)
+    ax.set_ylim(0, 100)
+    ax.set_yticks([20, 40, 60, 80, 100])
+    ax.set_yticklabels([])
+    ax.yaxis.grid(True, color=(0, 0.333, 0.584, 0.18), linewidth=0.7)
+    ax.xaxis.grid(True, color=(0, 0.333, 0.584, 0.25), linewidth=0.8)
+    ax.set_xticks(angulos[:-1])
+    ax.set_xticklabels(labels, color="#B3B2B3", fontsize=11,
+                       fontfamily="sans-serif", fontweight="600",
+                       position=(0, 0.05))
+    ax.tick_params(axis='x', pad=18)
+    return fig, ax, angulos
+
+
+def _trazar_radar(ax, angulos, valores, jugador):
+    """Polígono, puntos, valores y título de un jugador; devuelve los artistas para poder quitarlos."""
+    valores = list(valores)
+    valores += valores[:1]
+    artistas = ax.plot(angulos, valores, color="#005595", linewidth=2.2, linestyle="solid")
+    artistas += ax.fill(angulos, valores, color="#005595", alpha=0.30)
+    artistas.append(ax.scatter(angulos[:-1], valores[:-1], color="#3a8fd4", s=55, zorder=5))
+    for ang, val in zip(angulos[:-1], valores[:-1]):
+        offset = -12 if val > 70 else 10
+        artistas.append(ax.text(ang, val + offset, f"{val:.0f}", ha="center", va="center",
+                                color="#FFFFFF", fontsize=9, fontweight="bold"))
+    ax.set_title(jugador, color="#FFFFFF", fontsize=13,
+                 fontweight="900", pad=22, fontfamily="sans-serif")
+    return artistas
+
+
+@instrumentado()
+def graficar_radar(metricas: dict, jugador: str):
+    fig, ax, angulos = _lienzo_radar(list(metricas.keys()))
+    _trazar_radar(ax, angulos, metricas.values(), jugador)
+    plt.tight_layout()
+    return fig